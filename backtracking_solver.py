@@ -2,24 +2,42 @@
 Solucionador alternativo para Hashiwokakero usando BACKTRACKING PURO
 Técnica: Recursividad + Backtracking (fuerza bruta optimizada)
 No usa propagación de restricciones avanzada, solo prueba y retrocede
+
+Si el tablero tiene simetrías (rotaciones o reflexiones que lo dejan igual),
+en cada nodo se explora un solo movimiento por cada clase de movimientos
+equivalentes bajo las simetrías que fijan el estado actual
 """
 
 import copy
+import random
+import time
+
+from symmetry import automorphisms, islands_of, transform_point
 
 class BacktrackingSolver:
     """Resuelve el puzzle usando backtracking puro con recursividad"""
     
-    def __init__(self, game):
+    def __init__(self, game, seed=None):
         """
         Inicializa el solucionador
         
         Args:
             game: instancia de HashiGame
+            seed: semilla opcional; si se indica, el orden en que se prueban
+                  los vecinos se baraja de forma reproducible
         """
         self.game = game
         self.solution_bridges = []
         self.iterations = 0
         self.max_iterations = 1000000  # Sin límite práctico
+        self.rng = random.Random(seed) if seed is not None else None
+        self.symmetry_breaking = True  # Podar subárboles simétricos
+        self.time_limit = None  # Segundos para solve(); None = sin límite
+        self.timed_out = False
+        self._deadline = None
+        self.tracer = None  # SearchTracer opcional (search_trace.py)
+        self.cancelled = False
+        self.depth = 0  # Profundidad del nodo actual (progreso para la interfaz)
     
     def solve(self):
         """
@@ -31,11 +49,23 @@ class BacktrackingSolver:
         # Guardar estado inicial
         initial_state = self._save_state()
         
+        self.timed_out = False
+        self._deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        if self.cancelled:
+            self._deadline = 0.0
+        
         # Generar todos los pares posibles de islas que pueden conectarse
         self.possible_connections = self._generate_possible_connections()
         
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.emit('start', solver='backtracking', islands=len(self.game.islands))
+        
         # Intentar resolver recursivamente
-        success = self._backtrack()
+        success = self._backtrack(self._initial_stabilizer())
+        
+        if tracer is not None:
+            tracer.emit('end', success=success, iterations=self.iterations, timed_out=self.timed_out)
         
         if success:
             # Recopilar todos los puentes de la solución
@@ -84,59 +114,241 @@ class BacktrackingSolver:
         
         return connections
     
-    def _backtrack(self):
+    def count_solutions(self):
+        """
+        Cuenta las soluciones distintas del puzzle explorando el árbol completo
+        Con la poda por simetría activa, las soluciones de los subárboles podados
+        se recuperan como imágenes de las encontradas, así que el conteo es exacto
+        
+        Returns:
+            int - número de soluciones distintas
+        """
+        initial_state = self._save_state()
+        solutions = self._collect_solutions(self._initial_stabilizer())
+        self._restore_state(initial_state)
+        return len(solutions)
+    
+    def _collect_solutions(self, stabilizer):
+        """
+        Recorre el subárbol del estado actual acumulando sus soluciones
+        
+        Args:
+            stabilizer: simetrías que fijan el estado actual
+        
+        Returns:
+            set de soluciones (frozenset de ((a, b), cantidad))
+        """
+        self.iterations += 1
+        
+        if self._is_solution():
+            return {self._solution_signature()}
+        
+        if self._is_invalid_state():
+            return set()
+        
+        found = set()
+        for move in self._prune_symmetric(self._expand(), stabilizer):
+            if self._apply_move(move):
+                found |= self._collect_solutions(self._child_stabilizer(stabilizer, move))
+                self._undo_move(move)
+        
+        # Las soluciones de los movimientos podados son imágenes de las encontradas
+        images = set()
+        for t in stabilizer:
+            for solution in found:
+                images.add(frozenset((self._map_pair(t, a, b), count) for (a, b), count in solution))
+        found |= images
+        
+        return found
+    
+    def _solution_signature(self):
+        """Representa el estado actual como frozenset de ((a, b), cantidad)"""
+        return frozenset(((pos, neighbor), count)
+                         for pos, info in self.game.islands.items()
+                         for neighbor, count in info['bridges'].items()
+                         if pos < neighbor)
+    
+    def _backtrack(self, stabilizer=(), depth=0):
         """
         Función recursiva de backtracking
         Prueba todas las combinaciones posibles de puentes
         
+        Args:
+            stabilizer: simetrías del tablero que fijan el estado actual
+            depth: profundidad del nodo (para la traza y el progreso)
+        
         Returns:
             bool - True si se encontró solución
         """
         self.iterations += 1
+        self.depth = depth
+        tracer = self.tracer
+        
+        # Al agotar el tiempo cada nodo pendiente retorna de inmediato
+        if self._deadline is not None and self._out_of_time():
+            return False
         
         # Verificar si ya se encontró la solución
         if self._is_solution():
+            if tracer is not None:
+                tracer.emit('solution', depth)
             return True
         
         # Verificar si el estado actual es inválido (poda temprana)
         if self._is_invalid_state():
+            if tracer is not None:
+                tracer.emit('contradiction', depth, reason='invalid_state')
             return False
         
+        moves = self._prune_symmetric(self._expand(), stabilizer)
+        if tracer is not None:
+            tracer.emit('branch', depth, moves=len(moves))
+            if not moves:
+                tracer.emit('contradiction', depth, reason='no_moves')
+        
+        # Probar cada movimiento posible desde este estado
+        for move in moves:
+            if self._apply_move(move):
+                if tracer is not None:
+                    island, neighbor, num_bridges = move
+                    tracer.emit('decision', depth, a=island, b=neighbor, n=num_bridges)
+                    before = self.iterations
+                
+                # Recursión: intentar resolver con este estado
+                if self._backtrack(self._child_stabilizer(stabilizer, move), depth + 1):
+                    return True
+                
+                # Backtrack: eliminar los puentes agregados
+                self._undo_move(move)
+                if tracer is not None:
+                    tracer.emit('backtrack', depth, a=island, b=neighbor, n=num_bridges,
+                                nodes=self.iterations - before)
+        
+        # Si ninguna opción funcionó, retornar False
+        return False
+    
+    def cancel(self):
+        """
+        Pide detener la búsqueda; se puede llamar desde otro hilo y solve()
+        retorna (False, []) en cuanto la búsqueda revisa el tiempo
+        """
+        self.cancelled = True
+        self._deadline = 0.0
+    
+    def _out_of_time(self):
+        """Indica si se superó time_limit (y lo registra en timed_out) o se canceló la búsqueda"""
+        if self.cancelled:
+            return True
+        if time.perf_counter() > self._deadline:
+            self.timed_out = True
+        return self.timed_out
+    
+    def _expand(self):
+        """
+        Genera los movimientos posibles desde el estado actual
+        Usa la isla con menos puentes restantes (heurística MRV) y prueba
+        1 o 2 puentes hacia cada uno de sus vecinos válidos
+        
+        Returns:
+            list de tuplas (isla, vecino, num_puentes)
+        """
         # Encontrar la isla con menos opciones restantes (heurística MRV - Minimum Remaining Values)
         island = self._select_island_with_min_remaining()
         
         if island is None:
-            # No hay más islas incompletas, pero no es solución
-            return False
+            # No hay más islas incompletas
+            return []
         
         # Obtener vecinos válidos para esta isla
         neighbors = self._get_valid_neighbors(island)
+        if self.rng is not None:
+            self.rng.shuffle(neighbors)
         
-        # Probar agregar puentes a cada vecino
+        moves = []
         for neighbor in neighbors:
-            # Probar con 0, 1 o 2 puentes (en orden)
+            # Probar con 1 o 2 puentes (en orden)
             for num_bridges in [1, 2]:
-                # Verificar si podemos agregar estos puentes
                 if self._can_add_bridges(island, neighbor, num_bridges):
-                    # Agregar puente(s)
-                    added_successfully = True
-                    for _ in range(num_bridges):
-                        success, msg, bridge_info = self.game.create_bridge(island, neighbor)
-                        if not success:
-                            added_successfully = False
-                            break
-                    
-                    if added_successfully:
-                        # Recursión: intentar resolver con este estado
-                        if self._backtrack():
-                            return True
-                        
-                        # Backtrack: eliminar los puentes agregados
-                        for _ in range(num_bridges):
-                            self.game.delete_bridge(island, neighbor)
+                    moves.append((island, neighbor, num_bridges))
+        return moves
+    
+    def _initial_stabilizer(self):
+        """
+        Simetrías del tablero que además fijan los puentes ya colocados
         
-        # Si ninguna opción funcionó, retornar False
-        return False
+        Returns:
+            list de índices de transformación (sin la identidad)
+        """
+        if not self.symmetry_breaking:
+            return []
+        group = automorphisms(islands_of(self.game), self.game.rows, self.game.cols)
+        current = self._solution_signature()
+        return [t for t in group
+                if {(self._map_pair(t, a, b), count) for (a, b), count in current} == current]
+    
+    def _map_pair(self, t, a, b):
+        """Transforma el par de islas (a, b) y lo retorna ordenado"""
+        ta = transform_point(t, a, self.game.rows, self.game.cols)
+        tb = transform_point(t, b, self.game.rows, self.game.cols)
+        return (ta, tb) if ta < tb else (tb, ta)
+    
+    def _prune_symmetric(self, moves, stabilizer):
+        """
+        Deja un solo movimiento por clase de equivalencia bajo las simetrías
+        Los subárboles de movimientos equivalentes son imágenes simétricas entre sí
+        
+        Args:
+            moves: lista de (isla, vecino, num_puentes)
+            stabilizer: simetrías que fijan el estado actual
+        
+        Returns:
+            list de movimientos representantes (en el orden original)
+        """
+        if not stabilizer:
+            return moves
+        
+        kept = []
+        seen = set()
+        for move in moves:
+            island, neighbor, num_bridges = move
+            pair = (island, neighbor) if island < neighbor else (neighbor, island)
+            if (pair, num_bridges) in seen:
+                continue
+            kept.append(move)
+            seen.add((pair, num_bridges))
+            for t in stabilizer:
+                seen.add((self._map_pair(t, island, neighbor), num_bridges))
+        return kept
+    
+    def _child_stabilizer(self, stabilizer, move):
+        """Simetrías que siguen fijando el estado tras aplicar el movimiento"""
+        if not stabilizer:
+            return stabilizer
+        island, neighbor, _ = move
+        pair = (island, neighbor) if island < neighbor else (neighbor, island)
+        return [t for t in stabilizer if self._map_pair(t, island, neighbor) == pair]
+    
+    def _apply_move(self, move):
+        """
+        Agrega los puentes de un movimiento; si alguno falla, deshace los ya agregados
+        
+        Returns:
+            bool - True si se agregaron todos los puentes
+        """
+        island, neighbor, num_bridges = move
+        for added in range(num_bridges):
+            success, msg, bridge_info = self.game.create_bridge(island, neighbor)
+            if not success:
+                for _ in range(added):
+                    self.game.delete_bridge(island, neighbor)
+                return False
+        return True
+    
+    def _undo_move(self, move):
+        """Elimina los puentes agregados por un movimiento"""
+        island, neighbor, num_bridges = move
+        for _ in range(num_bridges):
+            self.game.delete_bridge(island, neighbor)
     
     def _path_is_clear(self, island_a, island_b):
         """
@@ -152,20 +364,10 @@ class BacktrackingSolver:
         r1, c1 = island_a
         r2, c2 = island_b
         
-        if r1 == r2:  # Horizontal
-            c_min, c_max = min(c1, c2), max(c1, c2)
-            for c in range(c_min + 1, c_max):
-                if self.game.board[r1][c] != 0:
-                    return False
-        elif c1 == c2:  # Vertical
-            r_min, r_max = min(r1, r2), max(r1, r2)
-            for r in range(r_min + 1, r_max):
-                if self.game.board[r][c1] != 0:
-                    return False
-        else:
+        if r1 != r2 and c1 != c2:
             return False
         
-        return True
+        return not self.game.has_island_between(island_a, island_b)
     
     def _select_island_with_min_remaining(self):
         """
@@ -277,24 +479,18 @@ class BacktrackingSolver:
         Returns:
             list - lista de posiciones de vecinos válidos
         """
-        r, c = island_pos
         neighbors = []
         
         # Buscar en las 4 direcciones
         directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # arriba, abajo, izq, der
         
         for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            
             # Buscar la primera isla en esta dirección
-            while 0 <= nr < self.game.rows and 0 <= nc < self.game.cols:
-                if (nr, nc) in self.game.islands:
-                    # Verificar que no haya cruce de puentes
-                    if self._can_connect(island_pos, (nr, nc)):
-                        neighbors.append((nr, nc))
-                    break
-                nr += dr
-                nc += dc
+            neighbor = self.game.nearest_island(island_pos, dr, dc)
+            if neighbor is not None:
+                # Verificar que no haya cruce de puentes
+                if self._can_connect(island_pos, neighbor):
+                    neighbors.append(neighbor)
         
         return neighbors
     
@@ -0,0 +1,362 @@
+"""
+Resolución por lotes de tableros Hashiwokakero sin interfaz gráfica
+Recibe directorios, patrones glob o una lista de archivos por stdin, resuelve
+cada tablero con el solucionador elegido en N procesos y escribe una línea JSON
+por tablero en stdout a medida que cada uno termina. Los contenedores '.hashi'
+(ver container.py), los corpus binarios '.hbc' (ver binary_corpus.py) y los
+archivos de IDs de juego '.gid' (ver game_id.py) se expanden en sus tableros;
+cada proceso lee su tablero directamente con el índice de offsets o el mapa de
+memoria del corpus.
+
+Uso:
+    py batch_solve.py puzzles/ --solver csp --workers 4 > resultados.jsonl
+    py batch_solve.py "puzzles/test_*.txt" --resume resultados.jsonl >> resultados.jsonl
+    find corpus -name "*.txt" | py batch_solve.py -
+    py batch_solve.py corpus.hashi --workers 8 > resultados.jsonl
+    py batch_solve.py puzzles/ --profile cprofile --profile-dir perfiles > resultados.jsonl
+    py batch_solve.py corpus.hbc --workers 8 > resultados.jsonl
+    generador | py batch_solve.py --game-ids - > resultados.jsonl
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+from parser import parse_board
+from container import is_container, iter_headers, load_index, read_puzzle
+from binary_corpus import BinaryCorpus, is_binary_corpus
+from game_id import GAME_ID_EXTENSION, parse_game_id, read_game_id_lines
+from game_logic import HashiGame
+from portfolio import SOLVERS
+from profiling import PROFILE_MODES, profile_call, profile_path, summarize_directory
+from solution_cache import SolutionCache, CachedSolver
+
+# Extensión de los archivos de tablero al recorrer directorios
+PUZZLE_EXTENSION = ".txt"
+
+# Trabajos enviados al pool y aún sin resultado, por proceso: la entrada se
+# lee a medida que avanzan los resultados y no toda de antemano
+PENDING_PER_WORKER = 4
+
+# Estados que no se vuelven a procesar al reanudar: 'unsolved' no es final
+# porque puede deberse al límite de iteraciones o de tiempo del solucionador
+FINAL_STATUSES = ("solved",)
+
+# Conexiones a la caché abiertas en este proceso (ruta -> SolutionCache)
+_caches = {}
+
+# Índices de offsets de los contenedores leídos en este proceso (ruta -> array)
+_indexes = {}
+
+# Corpus binarios mapeados en este proceso (ruta -> BinaryCorpus)
+_corpora = {}
+
+
+def _get_cache(path):
+    """Abre la caché de soluciones una sola vez por proceso"""
+    if path not in _caches:
+        _caches[path] = SolutionCache(path)
+    return _caches[path]
+
+
+def _get_index(path):
+    """Carga el índice de un contenedor una sola vez por proceso"""
+    if path not in _indexes:
+        _indexes[path] = load_index(path)
+    return _indexes[path]
+
+
+def _get_corpus(path):
+    """Mapea un corpus binario una sola vez por proceso"""
+    if path not in _corpora:
+        _corpora[path] = BinaryCorpus(path)
+    return _corpora[path]
+
+
+def collect_inputs(sources, stdin=None):
+    """
+    Expande las fuentes de entrada en una lista de rutas de tableros
+
+    Args:
+        sources: lista de directorios, patrones glob, archivos o "-" (rutas por stdin)
+        stdin: flujo del que leer rutas cuando aparece "-" (por defecto sys.stdin)
+
+    Returns:
+        list de rutas en el orden de las fuentes, sin duplicados
+    """
+    paths = []
+    for source in sources:
+        if source == "-":
+            stream = stdin if stdin is not None else sys.stdin
+            paths.extend(line.strip() for line in stream if line.strip())
+        elif os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if (name.endswith(PUZZLE_EXTENSION) or name.endswith(GAME_ID_EXTENSION)
+                            or is_container(name) or is_binary_corpus(name)):
+                        paths.append(os.path.join(root, name))
+        elif glob.has_magic(source):
+            paths.extend(sorted(glob.glob(source, recursive=True)))
+        else:
+            paths.append(source)
+
+    seen = set()
+    unique = []
+    for path in paths:
+        if path not in seen:
+            seen.add(path)
+            unique.append(path)
+    return unique
+
+
+def load_completed(path):
+    """
+    Lee un archivo de resultados previo para poder reanudar
+
+    Args:
+        path: archivo JSONL producido por una ejecución anterior
+
+    Returns:
+        set con los tableros ya resueltos
+    """
+    completed = set()
+    if not os.path.exists(path):
+        return completed
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Línea incompleta de una ejecución interrumpida
+                continue
+            if record.get("status") in FINAL_STATUSES:
+                completed.add(record.get("puzzle"))
+    return completed
+
+
+def expand_puzzles(paths, stdin=None):
+    """
+    Expande las rutas en los tableros a resolver
+
+    Args:
+        paths: rutas de archivos de tablero, contenedores, corpus binarios o
+               archivos de IDs de juego; "-" lee IDs de juego de stdin
+        stdin: flujo a usar para "-" (por defecto sys.stdin)
+
+    Yields:
+        tupla (nombre, origen) donde origen es la ruta del tablero,
+        (ruta_contenedor, n) o (ruta, nombre, id_de_juego); el nombre de un
+        tablero de contenedor o de archivo de IDs es 'ruta#id' y el de un
+        tablero de corpus binario es 'ruta#n'
+    """
+    for path in paths:
+        if path == "-":
+            # Los IDs viajan en el propio trabajo: el flujo se lee una sola vez;
+            # una línea inválida produce su registro de error en solve_file
+            for name, text in read_game_id_lines(stdin if stdin is not None else sys.stdin, strict=False):
+                yield f"stdin#{name}", ("stdin", name, text)
+            continue
+        if path.endswith(GAME_ID_EXTENSION) and os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for name, text in read_game_id_lines(f, strict=False):
+                    yield f"{path}#{name}", (path, name, text)
+            continue
+        if is_container(path) and os.path.isfile(path):
+            # El índice se construye aquí, antes de repartir sus tableros, y no
+            # en cada proceso; una cabecera inválida produce solo su registro
+            # de error al leer el tablero en solve_file
+            _get_index(path)
+            for n, puzzle_id, _ in iter_headers(path, strict=False):
+                yield f"{path}#{puzzle_id if puzzle_id is not None else n}", (path, n)
+        elif is_binary_corpus(path) and os.path.isfile(path):
+            for n in range(len(_get_corpus(path))):
+                yield f"{path}#{n}", (path, n)
+        else:
+            # Los archivos que no existen producen su registro de error en solve_file
+            yield path, path
+
+
+def load_puzzle(source):
+    """
+    Lee un tablero de cualquiera de los orígenes de expand_puzzles
+
+    Args:
+        source: ruta del tablero, (ruta_contenedor, n) o (ruta, nombre, id_de_juego)
+
+    Returns:
+        tupla (nombre, filas, columnas, tablero)
+    """
+    if not isinstance(source, tuple):
+        return (source,) + parse_board(source)
+    if len(source) == 3:
+        path, name, text = source
+        return (f"{path}#{name}",) + parse_game_id(text)
+    path, n = source
+    if is_binary_corpus(path):
+        return (f"{path}#{n}",) + _get_corpus(path).board(n)
+    puzzle_id, rows, cols, board = read_puzzle(path, n, _get_index(path))
+    return f"{path}#{puzzle_id}", rows, cols, board
+
+
+def solve_file(job):
+    """
+    Resuelve un tablero y construye su registro de resultado
+
+    Args:
+        job: tupla (origen, nombre_solucionador[, ruta_cache[, perfil]]); origen
+             es la ruta del tablero o (ruta_contenedor, n) y perfil es
+             (modo, directorio) para guardar el perfil de la resolución
+
+    Returns:
+        dict con 'puzzle', 'status', 'solver', 'bridges', 'time_ms' y 'stats'
+        (o 'error' si el tablero no se pudo procesar)
+    """
+    source, solver_name = job[:2]
+    cache_path = job[2] if len(job) > 2 else None
+    profile = job[3] if len(job) > 3 else None
+    record = {"puzzle": "#".join(map(str, source[:2])) if isinstance(source, tuple) else source,
+              "solver": solver_name}
+    start = time.perf_counter()
+    try:
+        record["puzzle"], rows, cols, board = load_puzzle(source)
+        game = HashiGame(rows, cols, board)
+        if cache_path:
+            solver = CachedSolver(game, SOLVERS[solver_name], _get_cache(cache_path))
+        else:
+            solver = SOLVERS[solver_name](game)
+        if profile:
+            mode, directory = profile
+            record["profile"] = profile_path(directory, record["puzzle"], mode)
+            success, bridges = profile_call(solver.solve, mode, record["profile"])
+        else:
+            success, bridges = solver.solve()
+        record.update({
+            "status": "solved" if success else "unsolved",
+            "bridges": bridges,
+            "time_ms": round((time.perf_counter() - start) * 1000, 3),
+            "stats": {
+                "rows": rows,
+                "cols": cols,
+                "islands": len(game.islands),
+                "iterations": solver.iterations
+            }
+        })
+        if cache_path:
+            record["cached"] = solver.cached
+    except Exception as e:
+        record.update({
+            "status": "error",
+            "error": f"{type(e).__name__}: {e}",
+            "time_ms": round((time.perf_counter() - start) * 1000, 3)
+        })
+    return record
+
+
+def run_batch(paths, solver_name="csp", workers=1, out=None, cache_path=None, skip=None, stdin=None,
+              profile=None):
+    """
+    Resuelve una lista de tableros y escribe un registro JSON por línea
+
+    Args:
+        paths: rutas de los tableros o contenedores
+        solver_name: clave de portfolio.SOLVERS
+        workers: número de procesos
+        out: flujo de salida (por defecto sys.stdout)
+        cache_path: archivo de SolutionCache a consultar antes de resolver (opcional)
+        skip: nombres de tableros a omitir (p. ej. los ya terminados al reanudar)
+        stdin: flujo de IDs de juego para la ruta "-" (por defecto sys.stdin)
+        profile: (modo, directorio) para perfilar cada resolución (ver
+                 profiling.py); al final se imprime en stderr la tabla de
+                 funciones más costosas de toda la corrida
+
+    Returns:
+        dict con el conteo de registros por estado
+    """
+    out = out if out is not None else sys.stdout
+    skip = skip or set()
+    # Generador: la resolución empieza sin esperar al final de la entrada
+    jobs = ((source, solver_name, cache_path, profile)
+            for name, source in expand_puzzles(paths, stdin) if name not in skip)
+    counts = {"solved": 0, "unsolved": 0, "error": 0}
+
+    def emit(record):
+        counts[record["status"]] += 1
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+
+    if workers <= 1:
+        for job in jobs:
+            emit(solve_file(job))
+    else:
+        # El pool consume los trabajos desde un hilo propio tan rápido como
+        # puede; el semáforo limita los pendientes para no leer toda la entrada
+        window = workers * PENDING_PER_WORKER
+        slots = threading.Semaphore(window)
+
+        def throttled():
+            for job in jobs:
+                slots.acquire()
+                yield job
+
+        with multiprocessing.Pool(workers) as pool:
+            try:
+                for record in pool.imap_unordered(solve_file, throttled()):
+                    slots.release()
+                    emit(record)
+            finally:
+                # Desbloquear el hilo del pool si la corrida se interrumpe
+                for _ in range(window):
+                    slots.release()
+
+    if profile:
+        summarize_directory(profile[1], profile[0])
+
+    return counts
+
+
+def main(argv=None):
+    """Función principal"""
+    arg_parser = argparse.ArgumentParser(description="Resuelve tableros Hashiwokakero por lotes")
+    arg_parser.add_argument("sources", nargs="+",
+                            help="directorios, patrones glob, archivos o '-' para leer rutas de stdin")
+    arg_parser.add_argument("--game-ids", action="store_true",
+                            help="con '-', leer de stdin IDs de juego (un tablero por línea) en vez de rutas")
+    arg_parser.add_argument("--solver", choices=sorted(SOLVERS), default="csp",
+                            help="solucionador a usar (por defecto: csp)")
+    arg_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                            help="número de procesos (por defecto: número de CPUs)")
+    arg_parser.add_argument("--resume", metavar="RESULTADOS",
+                            help="omitir los tableros ya resueltos en este archivo JSONL")
+    arg_parser.add_argument("--cache", metavar="ARCHIVO",
+                            help="caché SQLite de soluciones a consultar antes de resolver")
+    arg_parser.add_argument("--profile", choices=PROFILE_MODES,
+                            help="perfilar cada resolución con cProfile (.pstats) o por muestreo "
+                                 "de pilas (.folded, para flamegraphs)")
+    arg_parser.add_argument("--profile-dir", default="perfiles",
+                            help="directorio de los perfiles (por defecto: perfiles)")
+    args = arg_parser.parse_args(argv)
+
+    if args.game_ids:
+        paths = collect_inputs([source for source in args.sources if source != "-"])
+        if "-" in args.sources:
+            paths.append("-")
+    else:
+        paths = collect_inputs(args.sources)
+    completed = load_completed(args.resume) if args.resume else None
+
+    profile = (args.profile, args.profile_dir) if args.profile else None
+    counts = run_batch(paths, args.solver, args.workers, cache_path=args.cache, skip=completed,
+                       profile=profile)
+    print(f"Resueltos: {counts['solved']}, sin solución: {counts['unsolved']}, "
+          f"errores: {counts['error']}", file=sys.stderr)
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Compuerta de regresiones de rendimiento contra un reporte base
+Carga un reporte de referencia (benchmark_report.json o uno de harness.py),
+ejecuta el harness sobre los mismos tableros (o lee un reporte ya generado) y
+compara por tablero y solver la mediana de los tiempos y los nodos
+explorados. Termina con código 1 si algún par empeora más que el umbral, para
+usarlo antes de aceptar cambios en solver.py o backtracking_solver.py.
+
+Uso:
+    py benchmark/compare.py baseline.json
+    py benchmark/compare.py baseline.json --repeat 20 --threshold 0.05 -o actual.json
+    py benchmark/compare.py baseline.json --current actual.json
+"""
+
+import argparse
+import json
+import ntpath
+import os
+import sys
+
+# Configurar encoding UTF-8 para Windows
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from harness import SOLVERS, run_harness
+
+
+def _solver_results(test_case):
+    """Resultados por solver de un caso: clave -> dict con 'time_ms'"""
+    return {key: value for key, value in test_case.items()
+            if isinstance(value, dict) and "time_ms" in value}
+
+
+def _median_ms(result):
+    """
+    Mediana de los tiempos; los reportes de una sola medición usan time_ms
+    (None si la ejecución aislada no terminó)
+    """
+    return result.get("stats", {}).get("median", result["time_ms"])
+
+
+def compare_reports(baseline, current, threshold=0.10, node_threshold=0.0, min_ms=0.5):
+    """
+    Compara dos reportes por tablero (nombre) y solver
+
+    Un tiempo es regresión si la mediana actual supera a la base en más del
+    umbral relativo y en más de min_ms (los tableros de fracciones de
+    milisegundo varían más que cualquier umbral). Los nodos son
+    deterministas, así que por defecto cualquier aumento es regresión.
+    También lo es dejar de resolver un tablero que la base resolvía.
+
+    Args:
+        baseline, current: reportes (dict con 'test_cases')
+        threshold: aumento relativo permitido del tiempo (0.10 = 10%)
+        node_threshold: aumento relativo permitido de los nodos
+        min_ms: diferencia absoluta mínima en ms para contar un tiempo
+
+    Returns:
+        list de dicts {'board', 'solver', 'metric', 'baseline', 'current',
+        'change', 'regression'} (change es relativo, None si no aplica)
+    """
+    base_cases = {tc["name"]: tc for tc in baseline.get("test_cases", []) if "error" not in tc}
+    findings = []
+    for tc in current.get("test_cases", []):
+        base = base_cases.get(tc.get("name"))
+        if base is None or "error" in tc:
+            continue
+        base_results = _solver_results(base)
+        for solver, result in _solver_results(tc).items():
+            ref = base_results.get(solver)
+            if ref is None:
+                continue
+            entry = {"board": tc["name"], "solver": solver}
+
+            if ref.get("success") and not result.get("success"):
+                findings.append(dict(entry, metric=result.get("status", "success"), baseline=True,
+                                     current=False, change=None, regression=True))
+
+            before, after = _median_ms(ref), _median_ms(result)
+            if before is not None and after is not None:
+                change = (after - before) / before if before > 0 else None
+                regression = change is not None and change > threshold and after - before > min_ms
+                findings.append(dict(entry, metric="time_ms", baseline=before, current=after,
+                                     change=_round(change), regression=regression))
+
+            before, after = ref.get("iterations"), result.get("iterations")
+            if before is not None and after is not None:
+                change = (after - before) / before if before > 0 else None
+                regression = after > before and (change is None or change > node_threshold)
+                findings.append(dict(entry, metric="iterations", baseline=before, current=after,
+                                     change=_round(change), regression=regression))
+    return findings
+
+
+def _round(change):
+    """Redondea un cambio relativo (None se mantiene)"""
+    return None if change is None else round(change, 4)
+
+
+def resolve_test_files(baseline):
+    """
+    Tableros del reporte base como (nombre, archivo); las rutas relativas
+    son relativas a la raíz del proyecto y si la ruta guardada no existe
+    (p. ej. un reporte generado en otra máquina) se busca el archivo con el
+    mismo nombre en puzzles/
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    puzzles_dir = os.path.join(root, "puzzles")
+    test_files = []
+    for tc in baseline.get("test_cases", []):
+        path = tc.get("file", "")
+        if path and not ntpath.isabs(path) and not os.path.isabs(path):
+            path = os.path.join(root, path)
+        if not os.path.exists(path):
+            path = os.path.join(puzzles_dir, ntpath.basename(path))
+        test_files.append((tc["name"], path))
+    return test_files
+
+
+def _format(value):
+    """Formatea un valor de la tabla (tiempos con 3 decimales)"""
+    return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+
+def print_findings(findings):
+    """Imprime la tabla de comparación y retorna el número de regresiones"""
+    print(f"\n{'Tablero':<20} {'Solver':<14} {'Métrica':<11} {'Base':>12} {'Actual':>12} {'Cambio':>9}")
+    print(f"{'-'*20} {'-'*14} {'-'*11} {'-'*12} {'-'*12} {'-'*9}")
+    for f in findings:
+        change = "" if f["change"] is None else f"{f['change']:+.1%}"
+        mark = "  ✗ REGRESIÓN" if f["regression"] else ""
+        print(f"{f['board']:<20} {f['solver']:<14} {f['metric']:<11} {_format(f['baseline']):>12} "
+              f"{_format(f['current']):>12} {change:>9}{mark}")
+    regressions = sum(1 for f in findings if f["regression"])
+    print("=" * 80)
+    if regressions:
+        print(f"✗ {regressions} regresión(es)")
+    else:
+        print("✓ Sin regresiones")
+    return regressions
+
+
+def main(argv=None):
+    """Función principal; retorna 1 si hay regresiones"""
+    ap = argparse.ArgumentParser(description="Compara el rendimiento actual con un reporte base")
+    ap.add_argument('baseline', help="Reporte JSON de referencia")
+    ap.add_argument('--current', help="Reporte actual ya generado (si no, se ejecuta el harness)")
+    ap.add_argument('--threshold', type=float, default=0.10,
+                    help="Aumento relativo permitido de la mediana de tiempo (0.10 = 10%%)")
+    ap.add_argument('--node-threshold', type=float, default=0.0,
+                    help="Aumento relativo permitido de los nodos explorados")
+    ap.add_argument('--min-ms', type=float, default=0.5,
+                    help="Diferencia mínima en ms para contar una regresión de tiempo")
+    ap.add_argument('--warmup', type=int, default=1, help="Ejecuciones de calentamiento")
+    ap.add_argument('--repeat', type=int, default=10, help="Ejecuciones medidas (se compara la mediana)")
+    ap.add_argument('-o', '--output', help="Guardar el reporte actual (sirve como nueva base)")
+    args = ap.parse_args(argv)
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    if args.current:
+        with open(args.current, 'r', encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        current = run_harness(resolve_test_files(baseline), args.warmup, args.repeat, solvers=SOLVERS)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+
+    findings = compare_reports(baseline, current, args.threshold, args.node_threshold, args.min_ms)
+    if not findings:
+        print("No hay tableros en común entre los reportes")
+        return 1
+    return 1 if print_findings(findings) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
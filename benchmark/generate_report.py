@@ -16,6 +16,7 @@ if sys.platform == "win32":
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from benchmark_solvers import test_solver
+from harness import project_path
 from parser import parse_board
 from game_logic import HashiGame
 from solver import HashiSolver
@@ -33,7 +34,7 @@ def generate_detailed_report(test_files, output_file="benchmark_report.json"):
     report = {
         "timestamp": datetime.now().isoformat(),
         "description": "Comparación de rendimiento entre CSP y Backtracking en Hashiwokakero",
-        "board_size": "7x7",
+        "board_size": None,
         "test_cases": [],
         "summary": {}
     }
@@ -91,7 +92,7 @@ def generate_detailed_report(test_files, output_file="benchmark_report.json"):
             # Agregar al reporte
             test_case = {
                 "name": test_name,
-                "file": test_file,
+                "file": project_path(test_file),
                 "board_dimensions": f"{cols}x{rows}",
                 "num_islands": num_islands,
                 "csp": {
@@ -117,11 +118,15 @@ def generate_detailed_report(test_files, output_file="benchmark_report.json"):
             print(f"Error procesando {test_file}: {e}")
             test_case = {
                 "name": test_name,
-                "file": test_file,
+                "file": project_path(test_file),
                 "error": str(e)
             }
             report["test_cases"].append(test_case)
     
+    # Dimensiones de los tableros medidos (ya no todos son 7x7)
+    dims = {tc["board_dimensions"] for tc in report["test_cases"] if "board_dimensions" in tc}
+    report["board_size"] = ", ".join(sorted(dims))
+    
     # Agregar resumen
     report["summary"] = {
         "total_tests": len(test_files),
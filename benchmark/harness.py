@@ -0,0 +1,524 @@
+"""
+Harness de benchmark con calentamiento, repeticiones y control del GC
+Una sola medición de solve() en tableros de pocos milisegundos es ruido: el
+harness ejecuta cada solver varias veces sobre un juego nuevo, descarta las
+ejecuciones de calentamiento y reporta mínimo, mediana, p95 y desviación
+estándar. El reporte JSON extiende el esquema de benchmark_report.json
+('time_ms' es la mediana), así que visualize_results.py lo sigue leyendo.
+
+Uso:
+    py benchmark/harness.py
+    py benchmark/harness.py --warmup 3 --repeat 30 -o harness_report.json
+    py benchmark/harness.py puzzles/test_hard.txt --keep-gc
+    py benchmark/harness.py --memory --top-sites 5
+    py benchmark/harness.py --isolate --timeout 30 --memory-limit 1024 --workers 4
+    py benchmark/harness.py --profile cprofile --profile-dir perfiles
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+# Configurar encoding UTF-8 para Windows
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from parser import parse_board
+from game_logic import HashiGame
+from solver import HashiSolver
+from backtracking_solver import BacktrackingSolver
+from profiling import PROFILE_MODES, profile_call, profile_path, summarize_directory
+import isolation
+
+
+SCHEMA_VERSION = 2
+
+# Solvers medidos: clave del reporte -> (nombre, clase)
+SOLVERS = {
+    'csp': ('CSP', HashiSolver),
+    'backtracking': ('Backtracking', BacktrackingSolver),
+}
+
+
+def default_test_files():
+    """Tableros de prueba del benchmark (nombre, archivo)"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    puzzles_dir = os.path.join(os.path.dirname(script_dir), "puzzles")
+    return [
+        ("Simple 1", os.path.join(puzzles_dir, "test_simple1.txt")),
+        ("Simple 2", os.path.join(puzzles_dir, "test_simple2.txt")),
+        ("Fácil", os.path.join(puzzles_dir, "test_easy.txt")),
+        ("Moderado 1", os.path.join(puzzles_dir, "test_moderate1.txt")),
+        ("Moderado 2", os.path.join(puzzles_dir, "test_moderate2.txt")),
+        ("Difícil", os.path.join(puzzles_dir, "test_hard.txt")),
+        ("Ejemplo Base", os.path.join(puzzles_dir, "example.txt")),
+        ("Hash Test", os.path.join(puzzles_dir, "hashitest.txt")),
+    ]
+
+
+def project_path(path):
+    """
+    Ruta de un tablero para los reportes: relativa a la raíz del proyecto y
+    con '/' si el archivo está dentro de él (los reportes se comparan entre
+    máquinas), o la ruta tal cual si está fuera
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    absolute = os.path.abspath(path)
+    if os.path.commonpath([root, absolute]) != root:
+        return path
+    return os.path.relpath(absolute, root).replace(os.sep, '/')
+
+
+def percentile(values, p):
+    """
+    Percentil con interpolación lineal entre las muestras ordenadas
+
+    Args:
+        values: lista de números (no vacía)
+        p: percentil entre 0 y 100
+
+    Returns:
+        float
+    """
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    k = (len(ordered) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(times):
+    """
+    Estadísticas de una lista de tiempos en ms
+
+    Returns:
+        dict con min, median, p95, mean, stdev y max (redondeados a 4 decimales)
+    """
+    stats = {
+        'min': min(times),
+        'median': statistics.median(times),
+        'p95': percentile(times, 95),
+        'mean': statistics.fmean(times),
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        'max': max(times),
+    }
+    return {k: round(v, 4) for k, v in stats.items()}
+
+
+def measure(rows, cols, board, solver_class, warmup=1, repeat=10, disable_gc=True, time_limit=None):
+    """
+    Mide un solver con calentamiento y repeticiones
+
+    Cada ejecución usa un HashiGame nuevo (los solvers modifican el juego) y
+    la construcción del juego queda fuera del tiempo medido. Con disable_gc
+    se hace gc.collect() antes de cada ejecución y el GC queda desactivado
+    mientras corre solve().
+
+    Args:
+        rows, cols, board: tablero a resolver
+        solver_class: clase del solucionador
+        warmup: ejecuciones descartadas antes de medir
+        repeat: ejecuciones medidas
+        disable_gc: desactivar el recolector durante cada medición
+        time_limit: segundos por ejecución (solver.time_limit); si una
+                    ejecución lo supera no se hacen más
+
+    Returns:
+        dict {'success', 'timed_out', 'iterations', 'times_ms', 'stats'}
+    """
+    if repeat < 1:
+        raise ValueError("repeat debe ser al menos 1")
+
+    times = []
+    success = False
+    timed_out = False
+    iterations = 0
+    gc_was_enabled = gc.isenabled()
+    try:
+        for i in range(warmup + repeat):
+            game = HashiGame(rows, cols, [row[:] for row in board])
+            solver = solver_class(game)
+            solver.time_limit = time_limit
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+            start = time.perf_counter()
+            success, _ = solver.solve()
+            elapsed = (time.perf_counter() - start) * 1000
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+            if i >= warmup or solver.timed_out:
+                times.append(elapsed)
+                iterations = solver.iterations
+            if solver.timed_out:
+                timed_out = True
+                break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        'success': success,
+        'timed_out': timed_out,
+        'iterations': iterations,
+        'times_ms': [round(t, 4) for t in times],
+        'stats': summarize(times),
+    }
+
+
+def memory_profile(rows, cols, board, solver_class, time_limit=None, top=0, interval=0.001):
+    """
+    Perfil de memoria de una ejecución de solve() con tracemalloc
+
+    Se hace en una ejecución aparte de las medidas por tiempo porque
+    tracemalloc hace más lento al solver. El juego se construye antes de
+    empezar el rastreo, así que solo se cuenta lo que asigna el solver.
+    CPython no lleva un contador del total de asignaciones; como medida de
+    la cantidad de objetos se reportan los bloques vivos al final y en el
+    pico muestreado, y las recolecciones del GC durante la ejecución.
+
+    Args:
+        rows, cols, board: tablero a resolver
+        solver_class: clase del solucionador
+        time_limit: segundos para solve() (solver.time_limit)
+        top: número de sitios de asignación a reportar; con top > 0 un hilo
+             toma una instantánea cada vez que la memoria rastreada supera
+             el máximo visto, y los sitios salen de la más alta
+        interval: segundos entre muestras del hilo
+
+    Returns:
+        dict {'peak_kb', 'net_kb', 'net_blocks', 'gc_collections'} y, con
+        top > 0, 'peak_blocks' y 'top_sites' [{'site', 'size_kb', 'count'}]
+    """
+    game = HashiGame(rows, cols, [row[:] for row in board])
+    solver = solver_class(game)
+    solver.time_limit = time_limit
+
+    done = threading.Event()
+    sampled = {'current': -1, 'snapshot': None}
+
+    def sample():
+        while not done.wait(interval):
+            current = tracemalloc.get_traced_memory()[0]
+            if current > sampled['current']:
+                sampled['current'] = current
+                sampled['snapshot'] = tracemalloc.take_snapshot()
+
+    collections_before = sum(gen['collections'] for gen in gc.get_stats())
+    tracemalloc.start()
+    sampler = threading.Thread(target=sample, daemon=True) if top > 0 else None
+    try:
+        if sampler:
+            sampler.start()
+        solver.solve()
+        done.set()
+        if sampler:
+            sampler.join()
+        current, peak = tracemalloc.get_traced_memory()
+        end = tracemalloc.take_snapshot()
+    finally:
+        done.set()
+        tracemalloc.stop()
+
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__),
+              tracemalloc.Filter(False, threading.__file__)]
+    result = {
+        'peak_kb': round(peak / 1024, 1),
+        'net_kb': round(current / 1024, 1),
+        'net_blocks': sum(stat.count for stat in end.filter_traces(ignore).statistics('filename')),
+        'gc_collections': sum(gen['collections'] for gen in gc.get_stats()) - collections_before,
+    }
+    if top > 0:
+        snapshot = (sampled['snapshot'] or end).filter_traces(ignore)
+        stats = snapshot.statistics('lineno')
+        result['peak_blocks'] = sum(stat.count for stat in stats)
+        result['top_sites'] = [{
+            'site': f"{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+            'size_kb': round(stat.size / 1024, 1),
+            'count': stat.count,
+        } for stat in stats[:top]]
+    return result
+
+
+def _short_path(filename):
+    """Ruta relativa al proyecto si el archivo es del proyecto"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    filename = os.path.abspath(filename)
+    if filename.startswith(root + os.sep):
+        return os.path.relpath(filename, root)
+    return os.path.basename(filename)
+
+
+def measure_solver(rows, cols, board, solver_class, warmup=1, repeat=10, disable_gc=True,
+                   memory=False, top=0, profile=None):
+    """
+    Entrada del reporte para un solver en un tablero: measure() y, si se
+    pide, memory_profile() y un perfil de una ejecución aparte. Es la unidad
+    de trabajo de las ejecuciones aisladas.
+
+    Args:
+        profile: (modo, archivo) para guardar el perfil (ver profiling.py)
+
+    Returns:
+        dict con success, time_ms (mediana), iterations, stats, times_ms y
+        opcionalmente memory y profile (ruta del archivo)
+    """
+    result = measure(rows, cols, board, solver_class, warmup, repeat, disable_gc)
+    stats = result['stats']
+    entry = {
+        "success": result['success'],
+        "time_ms": round(stats['median'], 2),
+        "iterations": result['iterations'],
+        "stats": stats,
+        "times_ms": result['times_ms'],
+    }
+    if memory or top > 0:
+        entry["memory"] = memory_profile(rows, cols, board, solver_class, top=top)
+    if profile:
+        mode, path = profile
+        solver = solver_class(HashiGame(rows, cols, [row[:] for row in board]))
+        profile_call(solver.solve, mode, path)
+        entry["profile"] = path
+    return entry
+
+
+def _print_entry(label, entry):
+    """Imprime el resultado de un solver"""
+    if entry.get("status", "ok") != "ok":
+        print(f"  {label:<13} {entry['status'].upper()}: {entry['error'].splitlines()[0]}")
+        return
+    stats = entry["stats"]
+    print(f"  {label:<13} mediana {stats['median']:>10.3f} ms  "
+          f"min {stats['min']:>10.3f}  p95 {stats['p95']:>10.3f}  "
+          f"stdev {stats['stdev']:>8.3f}")
+    profile = entry.get("memory")
+    if profile:
+        print(f"  {'':<13} pico {profile['peak_kb']:>10.1f} KB  "
+              f"bloques {profile['net_blocks']:>8}  GC {profile['gc_collections']}")
+        for site in profile.get('top_sites', []):
+            print(f"  {'':<15} {site['size_kb']:>9.1f} KB {site['count']:>7}  {site['site']}")
+
+
+def run_harness(test_files, warmup=1, repeat=10, disable_gc=True, solvers=None, memory=False, top=0,
+                isolate=False, workers=None, timeout=None, memory_mb=None, profile=None):
+    """
+    Ejecuta el harness en todos los tableros
+
+    Args:
+        test_files: lista de tuplas (nombre, archivo)
+        warmup, repeat, disable_gc: ver measure()
+        solvers: dict clave -> (nombre, clase); por defecto SOLVERS
+        memory: agregar a cada solver la sección 'memory' de memory_profile()
+        top: sitios de asignación a reportar en 'memory' (implica memory)
+        isolate: medir cada (tablero, solver) en su propio subproceso en
+                 paralelo (ver isolation.py); los tiempos agotados y fallos
+                 quedan en el reporte con 'status' y 'error'
+        workers: procesos simultáneos con isolate (por defecto, CPUs)
+        timeout: segundos de reloj por (tablero, solver) con isolate
+        memory_mb: límite de memoria por subproceso en MB con isolate
+        profile: (modo, directorio) para perfilar cada (tablero, solver) en
+                 <directorio>/<solver>/; al final se imprime la tabla de
+                 funciones más costosas de cada solver
+
+    Returns:
+        dict con el reporte (esquema de benchmark_report.json extendido)
+    """
+    solvers = solvers or SOLVERS
+    report = {
+        "schema_version": SCHEMA_VERSION,
+        "timestamp": datetime.now().isoformat(),
+        "description": "Comparación de rendimiento entre CSP y Backtracking en Hashiwokakero",
+        "board_size": None,
+        "harness": {
+            "warmup": warmup,
+            "repeat": repeat,
+            "gc_disabled": disable_gc,
+            "memory": memory or top > 0,
+            "top_sites": top,
+            "timer": "perf_counter",
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "test_cases": [],
+        "summary": {}
+    }
+    if isolate:
+        report["harness"]["isolation"] = {
+            "workers": workers or os.cpu_count() or 1,
+            "timeout_s": timeout,
+            "memory_mb": memory_mb if isolation.memory_limit_supported() else None,
+        }
+
+    boards = []
+    for test_name, test_file in test_files:
+        try:
+            rows, cols, board = parse_board(test_file)
+        except Exception as e:
+            print(f"Error procesando {test_file}: {e}")
+            report["test_cases"].append({"name": test_name, "file": project_path(test_file),
+                                         "error": str(e)})
+            continue
+        test_case = {
+            "name": test_name,
+            "file": project_path(test_file),
+            "board_dimensions": f"{cols}x{rows}",
+            "num_islands": sum(1 for row in board for v in row if v > 0),
+        }
+        report["test_cases"].append(test_case)
+        boards.append((test_case, rows, cols, board))
+
+    def profile_target(test_case, key):
+        if not profile:
+            return None
+        mode, directory = profile
+        return mode, profile_path(os.path.join(directory, key), test_case["name"], mode)
+
+    if isolate:
+        jobs = [((i, key), measure_solver,
+                 (rows, cols, board, solver_class, warmup, repeat, disable_gc, memory, top,
+                  profile_target(test_case, key)))
+                for i, (test_case, rows, cols, board) in enumerate(boards)
+                for key, (_, solver_class) in solvers.items()]
+
+        def on_result(job_id, record):
+            i, key = job_id
+            if record['status'] == 'ok':
+                entry = record['result']
+            else:
+                entry = {"success": False, "time_ms": None, "iterations": None,
+                         "error": record['error']}
+            entry["status"] = record['status']
+            entry["wall_ms"] = record['wall_ms']
+            boards[i][0][key] = entry
+            print(f"{boards[i][0]['name']}:")
+            _print_entry(solvers[key][0], entry)
+
+        isolation.run_isolated(jobs, workers, timeout, memory_mb, on_result)
+    else:
+        for test_case, rows, cols, board in boards:
+            print(f"Procesando: {test_case['name']}...")
+            for key, (label, solver_class) in solvers.items():
+                test_case[key] = measure_solver(rows, cols, board, solver_class, warmup, repeat,
+                                                disable_gc, memory, top, profile_target(test_case, key))
+                _print_entry(label, test_case[key])
+
+    for test_case, _, _, _ in boards:
+        # Mismo orden de claves que en la ejecución secuencial
+        for key in solvers:
+            test_case[key] = test_case.pop(key)
+        if 'csp' in test_case and 'backtracking' in test_case:
+            test_case["comparison"] = _compare(test_case['csp'], test_case['backtracking'])
+
+    if profile:
+        mode, directory = profile
+        for key, (label, _) in solvers.items():
+            if os.path.isdir(os.path.join(directory, key)):
+                print(f"\n--- {label} ---")
+                summarize_directory(os.path.join(directory, key), mode, out=sys.stdout)
+
+    dims = {tc["board_dimensions"] for tc in report["test_cases"] if "board_dimensions" in tc}
+    report["board_size"] = ", ".join(sorted(dims))
+    report["summary"] = _summary(report["test_cases"], len(test_files))
+    return report
+
+
+def _compare(csp, bt):
+    """Sección 'comparison' del caso, calculada con las medianas"""
+    if not (csp['success'] and bt['success']):
+        return {"speedup": None, "iteration_ratio": None, "faster": None}
+    csp_time, bt_time = csp['stats']['median'], bt['stats']['median']
+    speedup = bt_time / csp_time if csp_time > 0 else None
+    iter_ratio = bt['iterations'] / csp['iterations'] if csp['iterations'] > 0 else None
+    return {
+        "speedup": round(speedup, 2) if speedup else None,
+        "iteration_ratio": round(iter_ratio, 2) if iter_ratio else None,
+        "faster": "CSP" if csp_time < bt_time else "Backtracking"
+    }
+
+
+def _summary(test_cases, total_tests):
+    """Resumen con los mismos campos que generate_report.py"""
+    total_csp = total_bt = 0
+    csp_wins = bt_wins = both_solved = both_failed = 0
+    for tc in test_cases:
+        if 'csp' not in tc or 'backtracking' not in tc:
+            continue
+        csp, bt = tc['csp'], tc['backtracking']
+        if csp['success'] and bt['success']:
+            both_solved += 1
+            total_csp += csp['stats']['median']
+            total_bt += bt['stats']['median']
+            if tc['comparison']['faster'] == "CSP":
+                csp_wins += 1
+            else:
+                bt_wins += 1
+        elif not csp['success'] and not bt['success']:
+            both_failed += 1
+    return {
+        "total_tests": total_tests,
+        "both_solved": both_solved,
+        "both_failed": both_failed,
+        "csp_wins": csp_wins,
+        "backtracking_wins": bt_wins,
+        "total_csp_time_ms": round(total_csp, 2),
+        "total_bt_time_ms": round(total_bt, 2),
+        "average_speedup": round(total_bt / total_csp, 2) if total_csp > 0 else None
+    }
+
+
+def main(argv=None):
+    """Función principal"""
+    ap = argparse.ArgumentParser(description="Benchmark de solvers con repeticiones y percentiles")
+    ap.add_argument('files', nargs='*', help="Tableros a medir (por defecto los de puzzles/)")
+    ap.add_argument('--warmup', type=int, default=1, help="Ejecuciones de calentamiento descartadas")
+    ap.add_argument('--repeat', type=int, default=10, help="Ejecuciones medidas por solver y tablero")
+    ap.add_argument('--keep-gc', action='store_true', help="No desactivar el GC durante las mediciones")
+    ap.add_argument('--memory', action='store_true',
+                    help="Medir pico de memoria y bloques con tracemalloc (ejecución aparte)")
+    ap.add_argument('--top-sites', type=int, default=0, metavar='N',
+                    help="Reportar los N sitios que más memoria asignan (implica --memory)")
+    ap.add_argument('--isolate', action='store_true',
+                    help="Medir cada tablero y solver en un subproceso aislado, en paralelo")
+    ap.add_argument('--workers', type=int, help="Subprocesos simultáneos con --isolate (por defecto, CPUs)")
+    ap.add_argument('--timeout', type=float, help="Segundos por tablero y solver con --isolate")
+    ap.add_argument('--memory-limit', type=float, metavar='MB',
+                    help="Límite de memoria por subproceso con --isolate (POSIX)")
+    ap.add_argument('--profile', choices=PROFILE_MODES,
+                    help="Perfilar una ejecución aparte por tablero y solver (.pstats o .folded)")
+    ap.add_argument('--profile-dir', default="perfiles", help="Directorio de los perfiles")
+    ap.add_argument('-o', '--output', default="harness_report.json", help="Archivo JSON de salida")
+    args = ap.parse_args(argv)
+
+    if args.files:
+        test_files = [(os.path.basename(path), path) for path in args.files]
+    else:
+        test_files = default_test_files()
+
+    report = run_harness(test_files, args.warmup, args.repeat, not args.keep_gc,
+                         memory=args.memory, top=args.top_sites, isolate=args.isolate,
+                         workers=args.workers, timeout=args.timeout, memory_mb=args.memory_limit,
+                         profile=(args.profile, args.profile_dir) if args.profile else None)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print("=" * 80)
+    print(f"✓ Reporte generado: {args.output}")
+    print(f"  - {args.warmup} calentamiento(s), {args.repeat} repeticiones por solver")
+    print(f"  - Speedup (medianas): {report['summary']['average_speedup']}x")
+
+
+if __name__ == '__main__':
+    main()
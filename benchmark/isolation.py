@@ -0,0 +1,147 @@
+"""
+Ejecución aislada de trabajos del benchmark en subprocesos
+Cada trabajo corre en su propio proceso con un límite de tiempo de reloj y,
+donde el sistema lo permite (módulo resource, POSIX), un límite de memoria
+(RLIMIT_AS). Un tablero patológico, un RecursionError o un proceso que muere
+quedan registrados como resultado del trabajo en lugar de detener la suite, y
+varios trabajos corren en paralelo.
+
+Estados de un trabajo:
+    'ok'       el trabajo terminó y retornó un resultado
+    'timeout'  superó el límite de tiempo y se terminó el proceso
+    'memory'   MemoryError (el límite de memoria se alcanzó)
+    'error'    el trabajo lanzó una excepción (p. ej. RecursionError)
+    'crash'    el proceso terminó sin publicar resultado
+"""
+
+import multiprocessing
+import os
+import time
+import traceback
+from multiprocessing.connection import wait
+
+try:
+    import resource
+except ImportError:  # Windows: sin límite de memoria por proceso
+    resource = None
+
+
+def memory_limit_supported():
+    """Indica si se puede limitar la memoria de los subprocesos"""
+    return resource is not None and hasattr(resource, 'RLIMIT_AS')
+
+
+def _child(conn, func, args, memory_mb):
+    """Proceso hijo: aplica el límite de memoria, ejecuta el trabajo y publica el resultado"""
+    try:
+        if memory_mb and memory_limit_supported():
+            limit = int(memory_mb * 1024 * 1024)
+            _, hard = resource.getrlimit(resource.RLIMIT_AS)
+            if hard != resource.RLIM_INFINITY:
+                limit = min(limit, hard)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+        result = func(*args)
+        conn.send(('ok', result, None))
+    except MemoryError:
+        conn.send(('memory', None, "MemoryError"))
+    except BaseException as e:
+        conn.send(('error', None, f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=-3)}"))
+    finally:
+        conn.close()
+
+
+def run_isolated(jobs, workers=None, timeout=None, memory_mb=None, on_result=None):
+    """
+    Ejecuta trabajos, cada uno en su propio subproceso
+
+    Args:
+        jobs: lista de (id, función, argumentos); la función y los argumentos
+              deben poder enviarse a otro proceso (funciones de módulo)
+        workers: máximo de procesos simultáneos (por defecto, número de CPUs)
+        timeout: segundos de reloj por trabajo (None = sin límite)
+        memory_mb: límite del espacio de direcciones de cada proceso en MB,
+                   incluido el intérprete (None = sin límite; se ignora donde
+                   no hay módulo resource)
+        on_result: función opcional llamada con (id, registro) al terminar
+                   cada trabajo
+
+    Returns:
+        dict id -> {'status', 'result', 'error', 'wall_ms', 'exitcode'}
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    ctx = multiprocessing.get_context()
+    pending = list(jobs)
+    # conexión -> (id, proceso, inicio)
+    running = {}
+    records = {}
+
+    def launch_next():
+        job_id, func, args = pending.pop(0)
+        reader, writer = ctx.Pipe(duplex=False)
+        process = ctx.Process(target=_child, args=(writer, func, args, memory_mb), daemon=True)
+        process.start()
+        writer.close()
+        running[reader] = (job_id, process, time.perf_counter())
+
+    def finish(reader, status, result, error):
+        job_id, process, start = running.pop(reader)
+        if status != 'timeout':
+            # Dar tiempo a que el proceso termine solo tras publicar el resultado
+            process.join(1)
+        if process.is_alive():
+            process.terminate()
+            process.join(1)
+            if process.is_alive():
+                process.kill()
+        process.join()
+        reader.close()
+        record = {
+            'status': status,
+            'result': result,
+            'error': error,
+            'wall_ms': round((time.perf_counter() - start) * 1000, 2),
+            'exitcode': process.exitcode,
+        }
+        records[job_id] = record
+        if on_result is not None:
+            on_result(job_id, record)
+
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                launch_next()
+
+            # Un trabajo termina cuando publica su resultado o cuando su proceso muere
+            sentinels = {process.sentinel: reader for reader, (_, process, _) in running.items()}
+            ready = wait(list(running) + list(sentinels), timeout=0.05)
+            done = set()
+            for obj in ready:
+                reader = sentinels.get(obj, obj)
+                if reader in done:
+                    continue
+                done.add(reader)
+                try:
+                    status, result, error = reader.recv()
+                except (EOFError, OSError):
+                    exitcode = running[reader][1].exitcode
+                    if exitcode is None:
+                        running[reader][1].join(1)
+                        exitcode = running[reader][1].exitcode
+                    finish(reader, 'crash', None, f"exitcode {exitcode}")
+                    continue
+                finish(reader, status, result, error)
+
+            if timeout is not None:
+                now = time.perf_counter()
+                for reader, (_, process, start) in list(running.items()):
+                    if now - start > timeout:
+                        finish(reader, 'timeout', None, f"más de {timeout} s")
+    finally:
+        for reader, (_, process, _) in list(running.items()):
+            if process.is_alive():
+                process.kill()
+            process.join()
+            reader.close()
+
+    return records
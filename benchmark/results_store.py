@@ -0,0 +1,292 @@
+"""
+Almacén incremental de resultados del benchmark
+Cada medición de (tablero, solver) se agrega como una línea JSON a un archivo
+que nunca se reescribe (por defecto benchmark/results.jsonl), con la clave:
+
+    revision   hash del código de los solvers (SOURCE_FILES), así que editar
+               pruebas, documentación o scripts no invalida resultados
+    config     identificador de la configuración de medición (solver,
+               calentamiento, repeticiones, GC, límite de tiempo, Python)
+    board      hash del tablero (symmetry.hash_cells)
+
+Los pares que ya están en el almacén para la revisión y configuración
+actuales se omiten salvo con --force, así que una corrida nocturna sobre un
+corpus grande solo mide los tableros nuevos o los que cambiaron de código.
+Una corrida interrumpida conserva las mediciones ya escritas.
+
+Uso:
+    py benchmark/results_store.py
+    py benchmark/results_store.py corpus.hashi puzzles/test_hard.txt --repeat 5
+    py benchmark/results_store.py --force --time-limit 30
+    py benchmark/results_store.py --history
+    py benchmark/visualize_results.py benchmark/results.jsonl
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+# Configurar encoding UTF-8 para Windows
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from harness import SOLVERS, default_test_files, measure, project_path
+from container import is_container, iter_puzzles
+from parser import parse_board
+from symmetry import hash_cells
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.jsonl")
+
+# Módulos que determinan el comportamiento de los solvers medidos
+SOURCE_FILES = [
+    "solver.py",
+    "backtracking_solver.py",
+    "game_logic.py",
+    "occupancy.py",
+    "sparse_board.py",
+    "symmetry.py",
+]
+
+
+def code_revision(root=ROOT, files=SOURCE_FILES):
+    """
+    Hash corto del contenido de los módulos de los solvers
+
+    Returns:
+        str - 12 dígitos hexadecimales
+    """
+    digest = hashlib.sha256()
+    for name in files:
+        digest.update(name.encode('utf-8') + b"\0")
+        with open(os.path.join(root, name), 'rb') as f:
+            digest.update(f.read().replace(b"\r\n", b"\n"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:12]
+
+
+def git_commit(root=ROOT):
+    """Commit actual de git (informativo); None si no hay repositorio"""
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def board_hash(rows, cols, board):
+    """Hash de un tablero exacto (sin normalizar simetrías: el tiempo depende de la orientación)"""
+    cells = [((r, c), board[r][c]) for r in range(rows) for c in range(cols) if board[r][c] > 0]
+    return hash_cells(rows, cols, cells)[:16]
+
+
+def measurement_config(solver, warmup, repeat, disable_gc, time_limit):
+    """
+    Configuración de medición y su identificador
+
+    Returns:
+        tuple (dict, str)
+    """
+    config = {
+        "solver": solver,
+        "warmup": warmup,
+        "repeat": repeat,
+        "gc_disabled": disable_gc,
+        "time_limit_s": time_limit,
+        "python": platform.python_version(),
+    }
+    text = json.dumps(config, sort_keys=True, separators=(',', ':'))
+    return config, hashlib.sha256(text.encode('utf-8')).hexdigest()[:8]
+
+
+class ResultStore:
+    """Archivo JSONL de solo agregado con las mediciones"""
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = path
+        self._keys = None
+
+    def records(self):
+        """
+        Lee las mediciones guardadas
+
+        Yields:
+            dict por medición (se ignoran líneas incompletas de una corrida cortada)
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def has(self, revision, config_id, board):
+        """Indica si ya hay una medición con esa clave"""
+        if self._keys is None:
+            self._keys = {(r["revision"], r["config_id"], r["board_hash"]) for r in self.records()}
+        return (revision, config_id, board) in self._keys
+
+    def append(self, record):
+        """Agrega una medición al final del archivo"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if self._keys is not None:
+            self._keys.add((record["revision"], record["config_id"], record["board_hash"]))
+
+
+def iter_boards(test_files):
+    """
+    Tableros a medir; los contenedores .hashi aportan todos sus tableros
+
+    Args:
+        test_files: lista de (nombre, archivo)
+
+    Yields:
+        tuple (nombre, archivo relativo, filas, columnas, tablero)
+    """
+    for name, path in test_files:
+        if is_container(path):
+            for pid, rows, cols, board in iter_puzzles(path):
+                yield f"{name}#{pid}", project_path(path), rows, cols, [list(row) for row in board]
+        else:
+            rows, cols, board = parse_board(path)
+            yield name, project_path(path), rows, cols, [list(row) for row in board]
+
+
+def run_incremental(test_files, store, warmup=1, repeat=5, disable_gc=True, time_limit=None,
+                    force=False, solvers=None):
+    """
+    Mide los pares (tablero, solver) que faltan en el almacén
+
+    Args:
+        test_files: lista de (nombre, archivo)
+        store: ResultStore
+        warmup, repeat, disable_gc, time_limit: ver harness.measure()
+        force: medir también los pares ya guardados (se agrega otra línea)
+        solvers: dict clave -> (nombre, clase); por defecto SOLVERS
+
+    Returns:
+        tuple (medidos, omitidos)
+    """
+    solvers = solvers or SOLVERS
+    revision = code_revision()
+    commit = git_commit()
+    measured = skipped = 0
+
+    for name, path, rows, cols, board in iter_boards(test_files):
+        key = board_hash(rows, cols, board)
+        for solver, (label, solver_class) in solvers.items():
+            config, config_id = measurement_config(solver, warmup, repeat, disable_gc, time_limit)
+            if not force and store.has(revision, config_id, key):
+                skipped += 1
+                continue
+            result = measure(rows, cols, board, solver_class, warmup, repeat, disable_gc, time_limit)
+            store.append({
+                "revision": revision,
+                "commit": commit,
+                "config_id": config_id,
+                "config": config,
+                "board_hash": key,
+                "board": name,
+                "file": path,
+                "board_dimensions": f"{cols}x{rows}",
+                "num_islands": sum(1 for row in board for v in row if v > 0),
+                "solver": solver,
+                "success": result['success'],
+                "timed_out": result['timed_out'],
+                "iterations": result['iterations'],
+                "time_ms": round(result['stats']['median'], 4),
+                "stats": result['stats'],
+                "timestamp": datetime.now().isoformat(timespec='seconds'),
+            })
+            measured += 1
+            status = "tiempo agotado" if result['timed_out'] else ("✓" if result['success'] else "✗")
+            print(f"  {name:<24} {label:<13} {result['stats']['median']:>10.2f} ms "
+                  f"{result['iterations']:>8} nodos  {status}")
+    return measured, skipped
+
+
+def history(records):
+    """
+    Serie por (tablero, solver) a través de las revisiones, en orden de
+    primera aparición de cada revisión; los tableros se identifican por su
+    hash (el mismo tablero con otro nombre es la misma serie) y si una
+    revisión se midió varias veces se usa la última medición
+
+    Returns:
+        tuple (revisiones, {(hash, solver): {revisión: registro}})
+    """
+    revisions = []
+    series = {}
+    for record in records:
+        if record["revision"] not in revisions:
+            revisions.append(record["revision"])
+        series.setdefault((record["board_hash"], record["solver"]), {})[record["revision"]] = record
+    return revisions, series
+
+
+def series_label(by_revision):
+    """Nombre de una serie: el del tablero en su medición más reciente"""
+    return list(by_revision.values())[-1]["board"]
+
+
+def print_history(records):
+    """Imprime la mediana de tiempo por tablero y solver en cada revisión"""
+    revisions, series = history(records)
+    if not revisions:
+        print("El almacén está vacío")
+        return
+    print(f"{'Tablero':<24} {'Solver':<13}" + "".join(f" {rev[:8]:>10}" for rev in revisions))
+    rows = sorted(((series_label(by_revision), solver, by_revision)
+                   for (_, solver), by_revision in series.items()), key=lambda row: row[:2])
+    for board, solver, by_revision in rows:
+        cells = [f"{by_revision[rev]['time_ms']:>10.2f}" if rev in by_revision else f"{'-':>10}"
+                 for rev in revisions]
+        print(f"{board:<24} {solver:<13} " + " ".join(cells))
+
+
+def main(argv=None):
+    """Función principal"""
+    ap = argparse.ArgumentParser(description="Benchmark incremental con historial por revisión del código")
+    ap.add_argument('files', nargs='*', help="Tableros o contenedores .hashi (por defecto los de puzzles/)")
+    ap.add_argument('--store', default=DEFAULT_STORE, help="Archivo JSONL del almacén")
+    ap.add_argument('--warmup', type=int, default=1, help="Ejecuciones de calentamiento descartadas")
+    ap.add_argument('--repeat', type=int, default=5, help="Ejecuciones medidas por solver y tablero")
+    ap.add_argument('--keep-gc', action='store_true', help="No desactivar el GC durante las mediciones")
+    ap.add_argument('--time-limit', type=float, help="Segundos por ejecución de cada solver")
+    ap.add_argument('--force', action='store_true', help="Medir también los pares ya guardados")
+    ap.add_argument('--history', action='store_true', help="Solo imprimir el historial del almacén")
+    args = ap.parse_args(argv)
+
+    store = ResultStore(args.store)
+    if args.history:
+        print_history(store.records())
+        return
+
+    if args.files:
+        test_files = [(project_path(path), path) for path in args.files]
+    else:
+        test_files = default_test_files()
+
+    print(f"Revisión del código: {code_revision()} (commit {git_commit() or '-'})")
+    measured, skipped = run_incremental(test_files, store, args.warmup, args.repeat, not args.keep_gc,
+                                        args.time_limit, args.force)
+    print("=" * 80)
+    print(f"✓ {measured} mediciones agregadas a {args.store}, {skipped} ya guardadas omitidas")
+
+
+if __name__ == '__main__':
+    main()
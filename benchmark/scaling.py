@@ -0,0 +1,276 @@
+"""
+Benchmark de escalabilidad por tamaño de tablero y densidad de islas
+Genera tableros con solución garantizada desde 7x7 hasta 100x100 con varias
+densidades (o carga tableros existentes) y mide cada solver con un límite de
+tiempo: tiempo, nodos explorados (iterations) y pico de memoria frente al
+tamaño. Cuando un solver agota el tiempo en un tamaño, los tamaños mayores de
+esa densidad se marcan como omitidos para ese solver.
+
+Uso:
+    py benchmark/scaling.py
+    py benchmark/scaling.py --sizes 7 15 30 --densities 0.1 0.2 --time-limit 5
+    py benchmark/scaling.py corpus.hashi puzzles/test_hard.txt
+    py benchmark/visualize_results.py scaling_report.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+from datetime import datetime
+
+# Configurar encoding UTF-8 para Windows
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from harness import SOLVERS, measure, memory_profile
+from container import is_container, iter_puzzles, write_container
+from parser import parse_board
+
+
+DEFAULT_SIZES = [7, 10, 15, 20, 30, 50, 70, 100]
+DEFAULT_DENSITIES = [0.05, 0.1, 0.2]
+
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+
+def generate_puzzle(rows, cols, density, seed=None, max_length=None, extra=0.3):
+    """
+    Genera un tablero con al menos una solución
+
+    Crece un árbol de puentes desde una isla al azar: cada paso elige una
+    isla existente y una dirección y coloca una isla nueva unida por 1 o 2
+    puentes a través de celdas libres. Después agrega con probabilidad
+    'extra' puentes entre islas consecutivas libres para formar ciclos. El
+    número de cada isla es la cantidad de puentes que tocan, así que los
+    puentes generados son una solución.
+
+    Args:
+        rows, cols: dimensiones
+        density: fracción de celdas con isla buscada (puede no alcanzarse)
+        seed: semilla para un tablero reproducible
+        max_length: largo máximo de un puente (por defecto max(2, lado // 4))
+        extra: probabilidad de agregar cada puente extra
+
+    Returns:
+        tuple (tablero, puentes) - lista de listas y lista [(a, b), ...]
+    """
+    rng = random.Random(seed)
+    max_length = max_length or max(2, min(rows, cols) // 4)
+    target = max(2, round(density * rows * cols))
+
+    # cells: (r, c) -> 'I' (isla), 'h' o 'v' (puente que pasa por la celda)
+    start = (rng.randrange(rows), rng.randrange(cols))
+    cells = {start: 'I'}
+    islands = [start]
+    bridges = []
+
+    attempts = 0
+    while len(islands) < target and attempts < target * 50:
+        attempts += 1
+        a = rng.choice(islands)
+        dr, dc = rng.choice(DIRECTIONS)
+        free = []
+        r, c = a[0] + dr, a[1] + dc
+        while 0 <= r < rows and 0 <= c < cols and (r, c) not in cells and len(free) < max_length:
+            free.append((r, c))
+            r, c = r + dr, c + dc
+        if not free:
+            continue
+        k = rng.randint(1, len(free))
+        b = free[k - 1]
+        mark = 'h' if dr == 0 else 'v'
+        for cell in free[:k - 1]:
+            cells[cell] = mark
+        cells[b] = 'I'
+        islands.append(b)
+        bridges.extend([(a, b)] * rng.choice((1, 2)))
+
+    # Puentes extra entre islas consecutivas con el camino libre
+    linked = {frozenset(pair) for pair in bridges}
+    for a in sorted(islands):
+        for dr, dc in ((0, 1), (1, 0)):
+            path = []
+            r, c = a[0] + dr, a[1] + dc
+            while 0 <= r < rows and 0 <= c < cols and (r, c) not in cells:
+                path.append((r, c))
+                r, c = r + dr, c + dc
+            b = (r, c)
+            if cells.get(b) != 'I' or frozenset((a, b)) in linked or rng.random() >= extra:
+                continue
+            mark = 'h' if dr == 0 else 'v'
+            for cell in path:
+                cells[cell] = mark
+            linked.add(frozenset((a, b)))
+            bridges.extend([(a, b)] * rng.choice((1, 2)))
+
+    board = [[0] * cols for _ in range(rows)]
+    for a, b in bridges:
+        board[a[0]][a[1]] += 1
+        board[b[0]][b[1]] += 1
+    return board, bridges
+
+
+def generated_boards(sizes, densities, seeds):
+    """
+    Tableros generados para la suite
+
+    Yields:
+        dict con name, size, density, seed, rows, cols y board
+    """
+    for density in densities:
+        for size in sizes:
+            for seed in range(seeds):
+                board, _ = generate_puzzle(size, size, density, seed=seed)
+                yield {
+                    "name": f"gen-{size}x{size}-d{density}-s{seed}",
+                    "size": size, "density": density, "seed": seed,
+                    "rows": size, "cols": size, "board": board,
+                }
+
+
+def loaded_boards(paths):
+    """
+    Tableros cargados de archivos (.hashi o de texto); la densidad es la real
+
+    Yields:
+        dict con name, size, density, seed, rows, cols y board
+    """
+    for path in paths:
+        if is_container(path):
+            puzzles = ((f"{path}#{pid}", rows, cols, board)
+                       for pid, rows, cols, board in iter_puzzles(path))
+        else:
+            puzzles = [(path,) + parse_board(path)]
+        for name, rows, cols, board in puzzles:
+            board = [list(row) for row in board]
+            islands = sum(1 for row in board for v in row if v > 0)
+            yield {
+                "name": name,
+                "size": max(rows, cols),
+                "density": round(islands / (rows * cols), 3),
+                "seed": None,
+                "rows": rows, "cols": cols, "board": board,
+            }
+
+
+def run_scaling(boards, time_limit=10.0, repeat=1, memory=True, skip_after_timeout=True, solvers=None):
+    """
+    Ejecuta cada solver sobre cada tablero
+
+    Args:
+        boards: iterable de dicts de generated_boards() o loaded_boards()
+        time_limit: segundos por ejecución de solve()
+        repeat: ejecuciones medidas por solver y tablero (se reporta la mediana)
+        memory: medir el pico de memoria en una ejecución aparte
+        skip_after_timeout: omitir tamaños mayores de la misma densidad
+                            después de que un solver agote el tiempo
+        solvers: dict clave -> (nombre, clase); por defecto SOLVERS
+
+    Returns:
+        list de dicts, uno por (tablero, solver)
+    """
+    solvers = solvers or SOLVERS
+    runs = []
+    # (solver, densidad) -> menor tamaño en que se agotó el tiempo
+    cliff = {}
+
+    for spec in boards:
+        rows, cols, board = spec["rows"], spec["cols"], spec["board"]
+        islands = sum(1 for row in board for v in row if v > 0)
+        print(f"{spec['name']}: {cols}x{rows}, {islands} islas")
+        for key, (label, solver_class) in solvers.items():
+            run = {
+                "board": spec["name"], "size": spec["size"], "density": spec["density"],
+                "seed": spec["seed"], "rows": rows, "cols": cols, "num_islands": islands,
+                "solver": key,
+            }
+            limit = cliff.get((key, spec["density"]))
+            if skip_after_timeout and limit is not None and spec["size"] > limit:
+                run.update({"skipped": True, "success": False, "timed_out": None,
+                            "time_ms": None, "iterations": None, "peak_kb": None,
+                            "net_blocks": None, "gc_collections": None})
+                runs.append(run)
+                continue
+
+            result = measure(rows, cols, board, solver_class, warmup=0, repeat=repeat,
+                             time_limit=time_limit)
+            profile = {}
+            if memory and not result['timed_out']:
+                profile = memory_profile(rows, cols, board, solver_class, time_limit)
+            peak_kb = profile.get('peak_kb')
+            if result['timed_out']:
+                cliff[(key, spec["density"])] = min(spec["size"], limit or spec["size"])
+            run.update({
+                "skipped": False,
+                "success": result['success'],
+                "timed_out": result['timed_out'],
+                "time_ms": round(result['stats']['median'], 3),
+                "iterations": result['iterations'],
+                "peak_kb": peak_kb,
+                "net_blocks": profile.get('net_blocks'),
+                "gc_collections": profile.get('gc_collections'),
+            })
+            runs.append(run)
+            status = "tiempo agotado" if result['timed_out'] else ("✓" if result['success'] else "✗")
+            memory_text = f"  {peak_kb:>10.1f} KB" if peak_kb is not None else ""
+            print(f"  {label:<13} {run['time_ms']:>12.2f} ms  {run['iterations']:>8} nodos"
+                  f"{memory_text}  {status}")
+    return runs
+
+
+def main(argv=None):
+    """Función principal"""
+    ap = argparse.ArgumentParser(description="Benchmark de escalabilidad por tamaño y densidad")
+    ap.add_argument('files', nargs='*', help="Tableros a medir (.hashi o texto); por defecto se generan")
+    ap.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Lados de los tableros generados")
+    ap.add_argument('--densities', type=float, nargs='+', default=DEFAULT_DENSITIES,
+                    help="Fracción de celdas con isla")
+    ap.add_argument('--seeds', type=int, default=1, help="Tableros generados por tamaño y densidad")
+    ap.add_argument('--time-limit', type=float, default=10.0, help="Segundos por ejecución de cada solver")
+    ap.add_argument('--repeat', type=int, default=1, help="Ejecuciones medidas por solver y tablero")
+    ap.add_argument('--no-memory', action='store_true', help="No medir el pico de memoria")
+    ap.add_argument('--no-skip', action='store_true',
+                    help="Medir también los tamaños mayores después de agotar el tiempo")
+    ap.add_argument('--save-boards', metavar='ARCHIVO.hashi', help="Guardar los tableros generados")
+    ap.add_argument('-o', '--output', default="scaling_report.json", help="Archivo JSON de salida")
+    args = ap.parse_args(argv)
+
+    if args.files:
+        boards = list(loaded_boards(args.files))
+    else:
+        boards = list(generated_boards(args.sizes, args.densities, args.seeds))
+        if args.save_boards:
+            write_container(args.save_boards, ((b["name"], b["rows"], b["cols"], b["board"])
+                                               for b in boards))
+    boards.sort(key=lambda b: (b["density"], b["size"]))
+
+    runs = run_scaling(boards, args.time_limit, args.repeat, not args.no_memory, not args.no_skip)
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "description": "Escalabilidad de los solvers por tamaño de tablero y densidad de islas",
+        "config": {
+            "sizes": sorted({b["size"] for b in boards}),
+            "densities": sorted({b["density"] for b in boards}),
+            "seeds": args.seeds if not args.files else None,
+            "time_limit_s": args.time_limit,
+            "repeat": args.repeat,
+            "memory": not args.no_memory,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "runs": runs,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print("=" * 80)
+    print(f"✓ Reporte generado: {args.output} ({len(runs)} mediciones)")
+
+
+if __name__ == '__main__':
+    main()
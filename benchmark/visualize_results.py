@@ -13,11 +13,28 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 
 def load_report(filename="benchmark_report.json"):
-    """Carga el reporte JSON generado"""
+    """
+    Carga el reporte JSON generado; un almacén de resultados
+    (benchmark/results_store.py, .jsonl) se carga como {"records": [...]}
+    """
+    if filename.endswith(".jsonl"):
+        from results_store import ResultStore
+        return {"records": list(ResultStore(filename).records())}
     with open(filename, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+def _error_bars(results):
+    """
+    Barras de error asimétricas (mediana - min, p95 - mediana) de los
+    resultados con estadísticas; None si el reporte es de una sola medición
+    """
+    if not all("stats" in r for r in results):
+        return None
+    return [[r["stats"]["median"] - r["stats"]["min"] for r in results],
+            [r["stats"]["p95"] - r["stats"]["median"] for r in results]]
+
+
 def plot_comparison_charts(report):
     """Genera gráficos comparativos a partir del reporte"""
     
@@ -46,8 +63,14 @@ def plot_comparison_charts(report):
     x = np.arange(len(names))
     width = 0.35
     
-    bars1 = ax1.bar(x - width/2, csp_times, width, label='CSP', color='#2ecc71', alpha=0.8)
-    bars2 = ax1.bar(x + width/2, bt_times, width, label='Backtracking', color='#e74c3c', alpha=0.8)
+    # Con reportes del harness (benchmark/harness.py) se dibuja el rango min-p95
+    csp_err = _error_bars([tc["csp"] for tc in solved_cases])
+    bt_err = _error_bars([tc["backtracking"] for tc in solved_cases])
+    
+    bars1 = ax1.bar(x - width/2, csp_times, width, yerr=csp_err, capsize=3,
+                    label='CSP', color='#2ecc71', alpha=0.8)
+    bars2 = ax1.bar(x + width/2, bt_times, width, yerr=bt_err, capsize=3,
+                    label='Backtracking', color='#e74c3c', alpha=0.8)
     
     ax1.set_xlabel('Tablero', fontweight='bold')
     ax1.set_ylabel('Tiempo (ms)', fontweight='bold')
@@ -174,6 +197,132 @@ def plot_comparison_charts(report):
     plt.tight_layout()
     plt.show()
     
+    # Gráfico 7: Memoria (reportes del harness con --memory)
+    if all("memory" in tc["csp"] and "memory" in tc["backtracking"] for tc in solved_cases):
+        plot_memory_chart(names, [tc["csp"]["memory"] for tc in solved_cases],
+                          [tc["backtracking"]["memory"] for tc in solved_cases])
+    
+    print("✓ Todas las gráficas se han mostrado")
+
+
+def plot_memory_chart(names, csp_memory, bt_memory):
+    """Pico de memoria y bloques asignados por tablero de cada solver"""
+    x = np.arange(len(names))
+    width = 0.35
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    
+    ax1.bar(x - width/2, [m["peak_kb"] for m in csp_memory], width, label='CSP', color='#2ecc71', alpha=0.8)
+    ax1.bar(x + width/2, [m["peak_kb"] for m in bt_memory], width, label='Backtracking', color='#e74c3c', alpha=0.8)
+    ax1.set_ylabel('Pico de memoria (KB)', fontweight='bold')
+    ax1.set_title('Pico de Memoria por Solución', fontsize=12, fontweight='bold')
+    
+    csp_blocks = [m.get("peak_blocks", m["net_blocks"]) for m in csp_memory]
+    bt_blocks = [m.get("peak_blocks", m["net_blocks"]) for m in bt_memory]
+    ax2.bar(x - width/2, csp_blocks, width, label='CSP', color='#3498db', alpha=0.8)
+    ax2.bar(x + width/2, bt_blocks, width, label='Backtracking', color='#9b59b6', alpha=0.8)
+    ax2.set_ylabel('Bloques asignados', fontweight='bold')
+    ax2.set_title('Bloques de Memoria Vivos', fontsize=12, fontweight='bold')
+    
+    for ax in (ax1, ax2):
+        ax.set_xlabel('Tablero', fontweight='bold')
+        ax.set_xticks(x)
+        ax.set_xticklabels(names, rotation=45, ha='right')
+        ax.legend()
+        ax.grid(axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_scaling_charts(report):
+    """
+    Curvas de crecimiento de un reporte de benchmark/scaling.py: tiempo,
+    nodos y pico de memoria frente al lado del tablero, una línea por
+    solver y densidad (los tiempos agotados se marcan con una X)
+    """
+    runs = [run for run in report["runs"] if not run.get("skipped")]
+    if not runs:
+        print("No hay mediciones para graficar.")
+        return
+    
+    colors = {'csp': '#2ecc71', 'backtracking': '#e74c3c'}
+    markers = ['o', 's', '^', 'D', 'v']
+    densities = sorted({run["density"] for run in runs})
+    metrics = [
+        ("time_ms", 'Tiempo (ms) - Escala Log', 'Tiempo frente al tamaño del tablero'),
+        ("iterations", 'Nodos explorados - Escala Log', 'Nodos frente al tamaño del tablero'),
+        ("peak_kb", 'Pico de memoria (KB) - Escala Log', 'Memoria frente al tamaño del tablero'),
+    ]
+    
+    for key, ylabel, title in metrics:
+        fig = plt.figure(figsize=(10, 6))
+        ax = fig.add_subplot(111)
+        for solver in sorted({run["solver"] for run in runs}):
+            for i, density in enumerate(densities):
+                points = {}
+                for run in runs:
+                    if run["solver"] == solver and run["density"] == density and run[key] is not None:
+                        points.setdefault(run["size"], []).append(run)
+                if not points:
+                    continue
+                sizes = sorted(points)
+                values = [float(np.median([r[key] for r in points[size]])) for size in sizes]
+                ax.plot(sizes, values, marker=markers[i % len(markers)], linewidth=2,
+                        color=colors.get(solver), label=f'{solver} (densidad {density})')
+                timed_out = [(size, v) for size, v in zip(sizes, values)
+                             if any(r.get("timed_out") for r in points[size])]
+                if timed_out:
+                    ax.scatter(*zip(*timed_out), marker='x', s=120, color='black', zorder=3)
+        
+        ax.set_xlabel('Lado del tablero (celdas)', fontweight='bold')
+        ax.set_ylabel(ylabel, fontweight='bold')
+        ax.set_title(title, fontsize=12, fontweight='bold')
+        ax.set_yscale('log')
+        ax.legend(fontsize=8)
+        ax.grid(True, alpha=0.3, which="both")
+        plt.tight_layout()
+        plt.show()
+    
+    print("✓ Todas las gráficas se han mostrado")
+
+
+def plot_trend_charts(report):
+    """
+    Tendencia de un almacén de resultados: mediana de tiempo y nodos de cada
+    tablero a través de las revisiones del código, una figura por solver (las
+    revisiones sin medición de un tablero quedan como huecos)
+    """
+    from results_store import history, series_label
+    revisions, series = history(report["records"])
+    if not revisions:
+        print("El almacén está vacío.")
+        return
+    
+    x = np.arange(len(revisions))
+    labels = [rev[:8] for rev in revisions]
+    for solver in sorted({solver for _, solver in series}):
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        for (_, key), by_revision in sorted(series.items()):
+            if key != solver:
+                continue
+            label = series_label(by_revision)
+            times = [by_revision[rev]["time_ms"] if rev in by_revision else np.nan for rev in revisions]
+            nodes = [by_revision[rev]["iterations"] if rev in by_revision else np.nan for rev in revisions]
+            ax1.plot(x, times, marker='o', linewidth=2, label=label)
+            ax2.plot(x, nodes, marker='o', linewidth=2, label=label)
+        
+        for ax, ylabel in ((ax1, 'Tiempo (ms) - Escala Log'), (ax2, 'Nodos explorados - Escala Log')):
+            ax.set_xticks(x)
+            ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=8)
+            ax.set_xlabel('Revisión del código', fontweight='bold')
+            ax.set_ylabel(ylabel, fontweight='bold')
+            ax.set_yscale('log')
+            ax.grid(True, alpha=0.3, which="both")
+        ax1.set_title(f'Tiempo por revisión ({solver})', fontsize=12, fontweight='bold')
+        ax2.set_title(f'Nodos por revisión ({solver})', fontsize=12, fontweight='bold')
+        ax2.legend(fontsize=8, loc='center left', bbox_to_anchor=(1, 0.5))
+        plt.tight_layout()
+        plt.show()
+    
     print("✓ Todas las gráficas se han mostrado")
 
 
@@ -202,7 +351,19 @@ def main():
     try:
         # Cargar reporte
         print("Cargando reporte...")
-        report = load_report()
+        report = load_report(sys.argv[1] if len(sys.argv) > 1 else "benchmark_report.json")
+        
+        # Almacén de resultados (benchmark/results_store.py)
+        if "records" in report:
+            print("\nGenerando tendencias por revisión...")
+            plot_trend_charts(report)
+            return
+        
+        # Reporte de escalabilidad (benchmark/scaling.py)
+        if "runs" in report:
+            print("\nGenerando curvas de crecimiento...")
+            plot_scaling_charts(report)
+            return
         
         # Imprimir resumen
         print_summary(report)
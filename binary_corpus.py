@@ -0,0 +1,330 @@
+"""
+Corpus binario de tableros y soluciones Hashiwokakero
+Guarda muchos tableros en un archivo binario compacto que se lee con mmap: los
+procesos que abren el mismo archivo comparten sus páginas y cada tablero se
+decodifica directamente desde el mapa de memoria, sin interpretar texto ni
+copiar el archivo.
+
+Formato (little-endian):
+    cabecera:   firma 'HASHIBC1', número de tableros (u32), offset del índice (u64)
+    datos:      por tablero, sus islas ordenadas por (fila, columna) como
+                registros (fila u16, columna u16, valor u8), seguidas de su
+                solución opcional: 2 bits por arista candidata (0, 1 o 2 puentes)
+    índice:     un registro fijo por tablero (offset de las islas u64, offset de
+                la solución u64, número de islas u32, filas u16, columnas u16,
+                bytes de la solución u32)
+
+Las aristas candidatas de un tablero son los pares de islas consecutivas en una
+misma fila o columna, en orden; son las únicas que pueden llevar puentes.
+
+Uso como script para convertir tableros o contenedores:
+    py binary_corpus.py corpus.hashi -o corpus.hbc --solutions resultados.jsonl
+"""
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+
+from sparse_board import SparseBoard
+
+# Extensión de los archivos de corpus binario
+CORPUS_EXTENSION = ".hbc"
+
+_MAGIC = b"HASHIBC1"
+_HEADER = struct.Struct("<8sIQ")
+_ENTRY = struct.Struct("<QQIHHI")
+_ISLAND = struct.Struct("<HHB")
+
+# Dimensión máxima representable (u16)
+MAX_DIM = 0xFFFF
+
+
+def is_binary_corpus(path):
+    """Indica si una ruta es un corpus binario (por su extensión)"""
+    return path.endswith(CORPUS_EXTENSION)
+
+
+def candidate_edges(positions):
+    """
+    Aristas candidatas de un tablero
+
+    Args:
+        positions: posiciones de las islas ordenadas por (fila, columna)
+
+    Returns:
+        list de pares (a, b) de islas consecutivas en una fila o columna, ordenada
+    """
+    edges = []
+    columns = {}
+    prev = None
+    for pos in positions:
+        if prev is not None and prev[0] == pos[0]:
+            edges.append((prev, pos))
+        prev = pos
+        columns.setdefault(pos[1], []).append(pos)
+    for column in columns.values():
+        edges.extend(zip(column, column[1:]))
+    edges.sort()
+    return edges
+
+
+def encode_board(rows, cols, board):
+    """
+    Codifica las islas de un tablero
+
+    Returns:
+        tupla (bytes, posiciones ordenadas)
+    """
+    if not (0 < rows <= MAX_DIM and 0 < cols <= MAX_DIM):
+        raise ValueError(f"Dimensiones fuera de rango: {rows}x{cols}")
+    if isinstance(board, SparseBoard):
+        cells = sorted(board.islands.items())
+    else:
+        cells = [((r, c), board[r][c]) for r in range(rows) for c in range(cols) if board[r][c] > 0]
+    data = bytearray(_ISLAND.size * len(cells))
+    for i, ((r, c), v) in enumerate(cells):
+        if v > 0xFF:
+            raise ValueError(f"Valor de isla fuera de rango en {r},{c}: {v}")
+        _ISLAND.pack_into(data, i * _ISLAND.size, r, c, v)
+    return bytes(data), [pos for pos, _ in cells]
+
+
+def encode_solution(positions, bridges):
+    """
+    Codifica una solución con 2 bits por arista candidata
+
+    Args:
+        positions: posiciones ordenadas de las islas
+        bridges: lista de puentes [(a, b), ...] (un elemento por puente)
+
+    Returns:
+        bytes
+    """
+    edges = candidate_edges(positions)
+    slot = {edge: i for i, edge in enumerate(edges)}
+    counts = [0] * len(edges)
+    for a, b in bridges:
+        a, b = tuple(a), tuple(b)
+        key = (a, b) if a < b else (b, a)
+        if key not in slot:
+            raise ValueError(f"Puente entre islas no consecutivas: {a} - {b}")
+        counts[slot[key]] += 1
+    data = bytearray((len(edges) + 3) // 4)
+    for i, count in enumerate(counts):
+        if count > 2:
+            raise ValueError(f"Más de 2 puentes entre {edges[i][0]} y {edges[i][1]}")
+        data[i >> 2] |= count << ((i & 3) * 2)
+    return bytes(data)
+
+
+def decode_solution(positions, data):
+    """
+    Decodifica una solución
+
+    Args:
+        positions: posiciones ordenadas de las islas
+        data: bytes o memoryview producido por encode_solution
+
+    Returns:
+        list de puentes [(a, b), ...] (un elemento por puente)
+    """
+    bridges = []
+    for i, (a, b) in enumerate(candidate_edges(positions)):
+        count = (data[i >> 2] >> ((i & 3) * 2)) & 3
+        bridges.extend([(a, b)] * count)
+    return bridges
+
+
+def write_corpus(path, puzzles):
+    """
+    Escribe un corpus binario
+
+    Args:
+        path: archivo de salida
+        puzzles: iterable de (filas, columnas, tablero) o
+                 (filas, columnas, tablero, puentes); puentes puede ser None
+
+    Returns:
+        int - número de tableros escritos
+    """
+    entries = []
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, 0, 0))
+        for puzzle in puzzles:
+            rows, cols, board = puzzle[:3]
+            bridges = puzzle[3] if len(puzzle) > 3 else None
+            data, positions = encode_board(rows, cols, board)
+            board_offset = f.tell()
+            f.write(data)
+            solution_offset, solution_len = 0, 0
+            if bridges is not None:
+                solution = encode_solution(positions, bridges)
+                solution_offset, solution_len = f.tell(), len(solution)
+                f.write(solution)
+            entries.append((board_offset, solution_offset, len(positions), rows, cols, solution_len))
+
+        index_offset = f.tell()
+        for entry in entries:
+            f.write(_ENTRY.pack(*entry))
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, len(entries), index_offset))
+    return len(entries)
+
+
+class BinaryCorpus:
+    """Acceso de solo lectura a un corpus binario mediante mmap"""
+
+    def __init__(self, path):
+        """
+        Abre el corpus
+
+        Args:
+            path: archivo escrito con write_corpus
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Corpus binario vacío: {path}")
+        self._view = memoryview(self._mmap)
+        if len(self._view) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Corpus binario inválido: {path}")
+        magic, self._count, self._index_offset = _HEADER.unpack_from(self._view, 0)
+        if magic != _MAGIC or self._index_offset + self._count * _ENTRY.size > len(self._view):
+            self.close()
+            raise ValueError(f"Corpus binario inválido: {path}")
+
+    def __len__(self):
+        return self._count
+
+    def _entry(self, n):
+        """Registro del índice del tablero n"""
+        if not 0 <= n < self._count:
+            raise IndexError(f"El corpus tiene {self._count} tableros")
+        return _ENTRY.unpack_from(self._view, self._index_offset + n * _ENTRY.size)
+
+    def dims(self, n):
+        """Retorna (filas, columnas) del tablero n"""
+        _, _, _, rows, cols, _ = self._entry(n)
+        return rows, cols
+
+    def board_view(self, n):
+        """Retorna un memoryview (sin copia) con las islas codificadas del tablero n"""
+        offset, _, count, _, _, _ = self._entry(n)
+        return self._view[offset:offset + count * _ISLAND.size]
+
+    def islands(self, n):
+        """
+        Islas del tablero n
+
+        Returns:
+            iterador de (fila, columna, valor) en orden
+        """
+        return _ISLAND.iter_unpack(self.board_view(n))
+
+    def board(self, n):
+        """
+        Decodifica el tablero n
+
+        Returns:
+            tupla (filas, columnas, SparseBoard)
+        """
+        rows, cols = self.dims(n)
+        islands = {(r, c): v for r, c, v in self.islands(n)}
+        return rows, cols, SparseBoard(rows, cols, islands)
+
+    def has_solution(self, n):
+        """Indica si el corpus guarda una solución para el tablero n"""
+        _, solution_offset, _, _, _, _ = self._entry(n)
+        return solution_offset > 0
+
+    def solution_view(self, n):
+        """Retorna un memoryview (sin copia) con la solución codificada, o None"""
+        _, offset, _, _, _, length = self._entry(n)
+        if offset == 0:
+            return None
+        return self._view[offset:offset + length]
+
+    def solution(self, n):
+        """
+        Decodifica la solución del tablero n
+
+        Returns:
+            list de puentes [(a, b), ...] o None si no hay solución guardada
+        """
+        data = self.solution_view(n)
+        if data is None:
+            return None
+        positions = [(r, c) for r, c, _ in self.islands(n)]
+        return decode_solution(positions, data)
+
+    def close(self):
+        """Libera el mapa de memoria y cierra el archivo"""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __getstate__(self):
+        # Al pasar el corpus a otro proceso solo viaja la ruta: el otro proceso
+        # vuelve a mapear el mismo archivo y comparte sus páginas
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+
+def _load_solutions(path):
+    """Lee las soluciones de un archivo de resultados de batch_solve"""
+    solutions = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("status") == "solved":
+                solutions[record["puzzle"]] = record["bridges"]
+    return solutions
+
+
+def main(argv=None):
+    """Función principal: convierte tableros y contenedores a un corpus binario"""
+    from batch_solve import collect_inputs, expand_puzzles, load_puzzle
+
+    arg_parser = argparse.ArgumentParser(description="Convierte tableros a un corpus binario")
+    arg_parser.add_argument("sources", nargs="+",
+                            help="directorios, patrones glob, archivos, contenedores o '-'")
+    arg_parser.add_argument("-o", "--output", required=True, help="archivo .hbc de salida")
+    arg_parser.add_argument("--solutions", metavar="RESULTADOS",
+                            help="archivo JSONL de batch_solve con las soluciones a incluir")
+    args = arg_parser.parse_args(argv)
+
+    solutions = _load_solutions(args.solutions) if args.solutions else {}
+
+    def puzzles():
+        for name, source in expand_puzzles(collect_inputs(args.sources)):
+            rows, cols, board = load_puzzle(source)[1:]
+            yield rows, cols, board, solutions.get(name)
+
+    count = write_corpus(args.output, puzzles())
+    print(f"{count} tableros escritos en {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Contenedor de muchos tableros Hashiwokakero en un solo archivo de texto
+Cada tablero va precedido por una cabecera con su id y metadatos opcionales,
+seguida del tablero en el mismo formato que parse_board (denso o disperso):
+
+    #puzzle p0001 dificultad=facil fuente=generador
+    3,3
+    202
+    000
+    202
+    #puzzle p0002
+    1000,1000,sparse
+    0,0,2
+    ...
+
+Las líneas antes de la primera cabecera se ignoran. Los tableros se leen de uno
+en uno (sin cargar el archivo completo) y un índice de offsets guardado junto
+al contenedor ('<archivo>.idx') permite saltar directamente al tablero N.
+"""
+
+import os
+import struct
+import tempfile
+from array import array
+
+from parser import parse_board_lines
+from sparse_board import SparseBoard
+
+# Extensión de los archivos contenedor
+CONTAINER_EXTENSION = ".hashi"
+
+# Prefijo de la línea de cabecera de cada tablero
+HEADER_PREFIX = "#puzzle"
+
+# Extensión del índice de offsets
+INDEX_EXTENSION = ".idx"
+
+# Cabecera del índice: firma, tamaño y fecha de modificación del contenedor y
+# número de tableros
+_INDEX_MAGIC = b"HASHIDX2"
+_INDEX_HEADER = struct.Struct("<8sQQQ")
+
+_HEADER_BYTES = HEADER_PREFIX.encode("ascii")
+
+
+def is_container(path):
+    """Indica si una ruta es un contenedor (por su extensión)"""
+    return path.endswith(CONTAINER_EXTENSION)
+
+
+def parse_header(line):
+    """
+    Interpreta una línea de cabecera '#puzzle id clave=valor ...'
+
+    Returns:
+        tupla (id, metadatos)
+    """
+    parts = line.split()
+    if not parts or parts[0] != HEADER_PREFIX:
+        raise ValueError(f"Cabecera inválida: '{line.strip()}'")
+    if len(parts) < 2:
+        raise ValueError("Cabecera sin id de tablero")
+    meta = {}
+    for item in parts[2:]:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Metadato inválido en la cabecera de {parts[1]}: '{item}'")
+        meta[key] = value
+    return parts[1], meta
+
+
+def _is_header(raw):
+    """Indica si una línea (bytes) es una cabecera de tablero"""
+    return raw.startswith(_HEADER_BYTES) and raw[len(_HEADER_BYTES):len(_HEADER_BYTES) + 1].isspace()
+
+
+def _iter_raw(f):
+    """
+    Recorre un contenedor abierto en modo binario agrupando las líneas por tablero
+
+    Yields:
+        tupla (offset, línea_cabecera, líneas_del_tablero)
+    """
+    offset = f.tell()
+    header = None
+    header_offset = 0
+    body = []
+    for raw in f:
+        if _is_header(raw):
+            if header is not None:
+                yield header_offset, header, body
+            header, header_offset, body = raw.decode("utf-8"), offset, []
+        elif header is not None:
+            body.append(raw.decode("utf-8"))
+        offset += len(raw)
+    if header is not None:
+        yield header_offset, header, body
+
+
+def iter_puzzles(path, start=0):
+    """
+    Lee los tableros de un contenedor de uno en uno
+
+    Args:
+        path: archivo contenedor
+        start: índice del primer tablero a leer (usa el índice de offsets)
+
+    Yields:
+        tupla (id, filas, columnas, tablero)
+    """
+    with open(path, "rb") as f:
+        if start > 0:
+            index = load_index(path)
+            if start >= len(index):
+                return
+            f.seek(index[start])
+        for _, header, body in _iter_raw(f):
+            puzzle_id, _ = parse_header(header)
+            yield (puzzle_id,) + parse_board_lines(body)
+
+
+def iter_headers(path, strict=True):
+    """
+    Recorre solo las cabeceras de un contenedor (sin interpretar los tableros)
+
+    Args:
+        path: archivo contenedor
+        strict: si es False, una cabecera inválida no interrumpe el recorrido
+                y se entrega con id None (el error aparece al leer el tablero)
+
+    Yields:
+        tupla (n, id, metadatos)
+    """
+    with open(path, "rb") as f:
+        n = 0
+        for raw in f:
+            if _is_header(raw):
+                try:
+                    puzzle_id, meta = parse_header(raw.decode("utf-8"))
+                except ValueError:
+                    if strict:
+                        raise
+                    puzzle_id, meta = None, {}
+                yield n, puzzle_id, meta
+                n += 1
+
+
+def build_index(path):
+    """
+    Calcula los offsets de cada cabecera y los guarda en '<path>.idx'
+
+    Returns:
+        array('Q') con el offset de cada tablero
+    """
+    index = array("Q")
+    with open(path, "rb") as f:
+        offset = 0
+        for raw in f:
+            if _is_header(raw):
+                index.append(offset)
+            offset += len(raw)
+
+    st = os.stat(path)
+    # Archivo temporal único: varios procesos pueden reconstruir el índice a la vez
+    try:
+        fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + INDEX_EXTENSION + ".",
+                                   suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+    except OSError:
+        # Directorio de solo lectura: el índice se usa solo en memoria
+        return index
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, st.st_size, st.st_mtime_ns, len(index)))
+            index.tofile(f)
+        os.replace(tmp, path + INDEX_EXTENSION)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+    return index
+
+
+def load_index(path):
+    """
+    Carga el índice de offsets, reconstruyéndolo si falta o está desactualizado
+
+    Returns:
+        array('Q') con el offset de cada tablero
+    """
+    st = os.stat(path)
+    try:
+        with open(path + INDEX_EXTENSION, "rb") as f:
+            magic, size, mtime, count = _INDEX_HEADER.unpack(f.read(_INDEX_HEADER.size))
+            if magic == _INDEX_MAGIC and size == st.st_size and mtime == st.st_mtime_ns:
+                body = f.read()
+                # Un índice truncado (p. ej. escritura interrumpida) se reconstruye
+                if len(body) % 8 == 0 and len(body) // 8 == count:
+                    index = array("Q")
+                    index.frombytes(body)
+                    return index
+    except (OSError, struct.error):
+        pass
+    return build_index(path)
+
+
+def read_puzzle(path, n, index=None):
+    """
+    Lee el tablero N de un contenedor sin recorrer los anteriores
+
+    Args:
+        path: archivo contenedor
+        n: posición del tablero (desde 0)
+        index: índice ya cargado con load_index (opcional)
+
+    Returns:
+        tupla (id, filas, columnas, tablero)
+    """
+    index = index if index is not None else load_index(path)
+    if not 0 <= n < len(index):
+        raise IndexError(f"El contenedor tiene {len(index)} tableros")
+    with open(path, "rb") as f:
+        f.seek(index[n])
+        header = f.readline().decode("utf-8")
+        body = []
+        for raw in f:
+            if _is_header(raw):
+                break
+            body.append(raw.decode("utf-8"))
+    puzzle_id, _ = parse_header(header)
+    return (puzzle_id,) + parse_board_lines(body)
+
+
+def count_puzzles(path):
+    """Retorna el número de tableros de un contenedor"""
+    return len(load_index(path))
+
+
+def _board_lines(rows, cols, board):
+    """Serializa un tablero en el formato de parse_board"""
+    if isinstance(board, SparseBoard):
+        lines = [f"{rows},{cols},sparse"]
+        lines.extend(f"{r},{c},{v}" for (r, c), v in sorted(board.islands.items()))
+        return lines
+    lines = [f"{rows},{cols}"]
+    lines.extend("".join(str(v) for v in board[r][:cols]) for r in range(rows))
+    return lines
+
+
+def write_container(path, puzzles):
+    """
+    Escribe un contenedor y su índice
+
+    Args:
+        path: archivo de salida
+        puzzles: iterable de (id, filas, columnas, tablero) o
+                 (id, filas, columnas, tablero, metadatos)
+
+    Returns:
+        int - número de tableros escritos
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for puzzle in puzzles:
+            puzzle_id, rows, cols, board = puzzle[:4]
+            meta = puzzle[4] if len(puzzle) > 4 else {}
+            if not puzzle_id or any(ch.isspace() for ch in str(puzzle_id)):
+                raise ValueError(f"Id de tablero inválido: '{puzzle_id}'")
+            for key, value in meta.items():
+                if any(ch.isspace() or ch == "=" for ch in str(key)) or any(ch.isspace() for ch in str(value)):
+                    raise ValueError(f"Metadato inválido en {puzzle_id}: '{key}={value}'")
+            header = " ".join([HEADER_PREFIX, str(puzzle_id)] +
+                              [f"{key}={value}" for key, value in meta.items()])
+            f.write(header + "\n")
+            f.write("\n".join(_board_lines(rows, cols, board)) + "\n")
+            count += 1
+    build_index(path)
+    return count
@@ -0,0 +1,186 @@
+"""
+IDs de juego de Hashiwokakero en el formato compacto de otros generadores
+(el de "Bridges" de la colección de puzzles de Simon Tatham):
+
+    7x7:a2b3c1b...
+
+La parte anterior a ':' da ancho x alto (pueden seguir otros parámetros del
+generador, que se ignoran salvo 'mN', el máximo de puentes por par de islas).
+La descripción recorre el tablero por filas: un dígito es una isla con ese
+número y una letra 'a'-'z' son de 1 a 26 celdas vacías seguidas.
+
+Uso como script:
+    py game_id.py puzzles/*.txt > tableros.gid          (exportar)
+    py game_id.py --decode tableros.gid -o corpus.hashi  (importar a un contenedor)
+"""
+
+import argparse
+import re
+import sys
+
+from sparse_board import SparseBoard
+
+# Extensión de los archivos con un ID de juego por línea
+GAME_ID_EXTENSION = ".gid"
+
+# Celdas vacías que representa una letra: 'a' = 1 ... 'z' = 26
+MAX_RUN = 26
+
+_PARAMS = re.compile(r"(\d+)x(\d+)(.*)")
+_MAX_BRIDGES = re.compile(r"m(\d+)")
+
+
+def parse_game_id(text):
+    """
+    Convierte un ID de juego en un tablero
+
+    Args:
+        text: ID 'AnchoxAlto[parámetros]:descripción'
+
+    Returns:
+        tupla (filas, columnas, SparseBoard)
+    """
+    params, sep, desc = text.strip().partition(":")
+    match = _PARAMS.fullmatch(params)
+    if not sep or not match:
+        raise ValueError(f"ID de juego inválido: '{text.strip()[:40]}'")
+    cols, rows = int(match.group(1)), int(match.group(2))
+    if rows <= 0 or cols <= 0:
+        raise ValueError(f"Dimensiones inválidas: {cols}x{rows}")
+    max_bridges = _MAX_BRIDGES.search(match.group(3))
+    if max_bridges and int(max_bridges.group(1)) != 2:
+        raise ValueError(f"Solo se admiten 2 puentes por par de islas (m{max_bridges.group(1)})")
+
+    total = rows * cols
+    islands = {}
+    i = 0
+    for ch in desc:
+        if i >= total:
+            raise ValueError("La descripción tiene más celdas que el tablero")
+        if "a" <= ch <= "z":
+            i += ord(ch) - ord("a") + 1
+        elif "1" <= ch <= "8":
+            islands[divmod(i, cols)] = ord(ch) - ord("0")
+            i += 1
+        else:
+            raise ValueError(f"Carácter inválido en la descripción: '{ch}'")
+    if i != total:
+        raise ValueError(f"La descripción tiene {i} celdas y el tablero {total}")
+    return rows, cols, SparseBoard(rows, cols, islands)
+
+
+def to_game_id(rows, cols, board):
+    """
+    Convierte un tablero en su ID de juego
+
+    Args:
+        rows, cols: dimensiones
+        board: lista de listas o SparseBoard
+
+    Returns:
+        str - 'AnchoxAlto:descripción'
+    """
+    if isinstance(board, SparseBoard):
+        cells = sorted(board.islands.items())
+    else:
+        cells = [((r, c), board[r][c]) for r in range(rows) for c in range(cols) if board[r][c] > 0]
+
+    parts = []
+    last = 0
+    for (r, c), v in cells:
+        if not 1 <= v <= 8:
+            raise ValueError(f"Valor de isla no representable en {r},{c}: {v}")
+        i = r * cols + c
+        parts.append(_run(i - last))
+        parts.append(str(v))
+        last = i + 1
+    parts.append(_run(rows * cols - last))
+    return f"{cols}x{rows}:" + "".join(parts)
+
+
+def _run(gap):
+    """Codifica gap celdas vacías seguidas"""
+    full, rest = divmod(gap, MAX_RUN)
+    return "z" * full + (chr(ord("a") + rest - 1) if rest else "")
+
+
+def read_game_id_lines(stream, strict=True):
+    """
+    Recorre un flujo con un ID de juego por línea sin interpretarlos
+
+    Cada línea puede llevar delante un nombre separado por espacios
+    ('nombre 7x7:...'); sin nombre se usa el número de ID (desde 0).
+    Las líneas vacías y las que empiezan por '#' se ignoran.
+
+    Args:
+        stream: flujo de texto
+        strict: si es False, una línea inválida no interrumpe el recorrido y
+                se entrega completa como ID con el número de ID como nombre
+                (el error aparece al interpretarla con parse_game_id)
+
+    Yields:
+        tupla (nombre, id_de_juego)
+    """
+    n = 0
+    for line in stream:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split()
+        if len(parts) > 2:
+            if strict:
+                raise ValueError(f"Línea inválida: '{line[:40]}'")
+            yield str(n), line
+        else:
+            yield (parts[0] if len(parts) == 2 else str(n)), parts[-1]
+        n += 1
+
+
+def iter_game_ids(stream):
+    """
+    Lee tableros de un flujo de IDs de juego en una sola pasada
+
+    Yields:
+        tupla (nombre, filas, columnas, SparseBoard)
+    """
+    for name, text in read_game_id_lines(stream):
+        yield (name,) + parse_game_id(text)
+
+
+def main(argv=None):
+    """Función principal: exporta tableros a IDs de juego o los importa a un contenedor"""
+    from batch_solve import collect_inputs, expand_puzzles, load_puzzle
+    from container import write_container
+
+    arg_parser = argparse.ArgumentParser(description="Convierte tableros desde y hacia IDs de juego")
+    arg_parser.add_argument("sources", nargs="+",
+                            help="tableros a exportar, o archivos de IDs ('-' = stdin) con --decode")
+    arg_parser.add_argument("--decode", action="store_true",
+                            help="leer IDs de juego y escribirlos en un contenedor")
+    arg_parser.add_argument("-o", "--output", help="contenedor .hashi de salida (con --decode)")
+    args = arg_parser.parse_args(argv)
+
+    if args.decode:
+        if not args.output:
+            arg_parser.error("--decode requiere -o")
+
+        def puzzles():
+            for source in args.sources:
+                if source == "-":
+                    yield from iter_game_ids(sys.stdin)
+                    continue
+                with open(source, "r", encoding="utf-8") as f:
+                    yield from iter_game_ids(f)
+
+        count = write_container(args.output, puzzles())
+        print(f"{count} tableros escritos en {args.output}", file=sys.stderr)
+        return 0
+
+    for name, source in expand_puzzles(collect_inputs(args.sources)):
+        _, rows, cols, board = load_puzzle(source)
+        print(f"{'_'.join(name.split())} {to_game_id(rows, cols, board)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
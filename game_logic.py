@@ -3,6 +3,11 @@ Lógica del juego Hashiwokakero (Hashi)
 Maneja el estado del juego, validaciones y operaciones independientemente de la interfaz gráfica
 """
 
+from bisect import bisect_left, bisect_right
+
+from occupancy import BridgeOccupancy
+from sparse_board import SparseBoard
+
 class HashiGame:
     """Clase que contiene toda la lógica del juego Hashiwokakero"""
     
@@ -14,6 +19,7 @@ class HashiGame:
             rows: número de filas
             cols: número de columnas
             board: matriz con los valores de las islas (0 = vacío, >0 = isla con ese número)
+                   o un SparseBoard con solo las islas
         """
         self.rows = rows
         self.cols = cols
@@ -23,25 +29,91 @@ class HashiGame:
         # islands: (r,c) -> {'num': n, 'bridges': {(r2,c2): count}}
         self.islands = {}
         
-        # occupancy: (r,c) -> {'h': count, 'v': count}
-        self.occupancy = {}
+        # occupancy: intervalos ocupados por puentes (horizontales por fila,
+        # verticales por columna); occupancy[(r,c)] -> {'h': count, 'v': count}
+        self.occupancy = BridgeOccupancy()
         
-        # Historial de acciones: lista de dicts con 'a', 'b', 'occ_cells'
+        # Historial de acciones: lista de dicts con 'a', 'b', 'span'
         self.history = []
         
+        # Suscriptores a eventos: callback(evento, info) con evento
+        # 'bridge_added', 'bridge_removed' o 'reset' (ver subscribe)
+        self._subscribers = []
+        
+        # Índices de islas por fila y por columna (listas ordenadas) para
+        # buscar línea de visión con búsqueda binaria en vez de recorrer celdas
+        # row_islands: r -> [c, ...]; col_islands: c -> [r, ...]
+        self.row_islands = {}
+        self.col_islands = {}
+        
         # Inicializar islas
         self._init_islands()
     
     def _init_islands(self):
-        """Inicializa el diccionario de islas basado en el tablero"""
-        for r in range(self.rows):
-            for c in range(self.cols):
-                v = self.board[r][c]
-                if v > 0:
-                    self.islands[(r, c)] = {
-                        'num': v,
-                        'bridges': {}
-                    }
+        """Inicializa el diccionario de islas y los índices por fila y columna"""
+        if isinstance(self.board, SparseBoard):
+            # Tablero disperso: no recorrer las celdas vacías
+            cells = sorted(self.board.islands.items())
+        else:
+            cells = [((r, c), v) for r, row in enumerate(self.board[:self.rows])
+                     for c, v in enumerate(row[:self.cols]) if v > 0]
+        
+        # Las celdas van en orden (fila, columna): ambos índices quedan ordenados
+        for (r, c), v in cells:
+            self.islands[(r, c)] = {
+                'num': v,
+                'bridges': {}
+            }
+            self.row_islands.setdefault(r, []).append(c)
+            self.col_islands.setdefault(c, []).append(r)
+    
+    def has_island_between(self, a, b):
+        """
+        Verifica si hay alguna isla estrictamente entre dos celdas alineadas
+        
+        Args:
+            a: tupla (r1, c1)
+            b: tupla (r2, c2)
+            
+        Returns:
+            bool
+        """
+        r1, c1 = a
+        r2, c2 = b
+        if r1 == r2:
+            line, lo, hi = self.row_islands.get(r1, []), min(c1, c2), max(c1, c2)
+        else:
+            line, lo, hi = self.col_islands.get(c1, []), min(r1, r2), max(r1, r2)
+        i = bisect_right(line, lo)
+        return i < len(line) and line[i] < hi
+    
+    def nearest_island(self, pos, dr, dc):
+        """
+        Busca la isla más cercana desde pos en una dirección
+        
+        Args:
+            pos: tupla (r, c)
+            dr, dc: dirección (-1, 0), (1, 0), (0, -1) o (0, 1)
+            
+        Returns:
+            tupla (r, c) de la isla o None si no hay ninguna
+        """
+        r, c = pos
+        if dr == 0:
+            line, x = self.row_islands.get(r, []), c
+        else:
+            line, x = self.col_islands.get(c, []), r
+        
+        if dr + dc > 0:
+            i = bisect_right(line, x)
+            if i >= len(line):
+                return None
+        else:
+            i = bisect_left(line, x) - 1
+            if i < 0:
+                return None
+        
+        return (r, line[i]) if dr == 0 else (line[i], c)
     
     def get_island_info(self, pos):
         """
@@ -107,24 +179,15 @@ class HashiGame:
             return False, "Ya hay 2 puentes entre esas islas"
         
         # Verificar camino libre
-        if r1 == r2:
-            # horizontal
-            step = 1 if c2 > c1 else -1
-            for c in range(c1 + step, c2, step):
-                if self.board[r1][c] != 0:
-                    return False, "Hay isla en el camino"
-                occ = self.occupancy.get((r1, c), {'h': 0, 'v': 0})
-                if occ['v'] > 0:
-                    return False, "Cruza un puente vertical existente"
-        else:
-            # vertical
-            step = 1 if r2 > r1 else -1
-            for r in range(r1 + step, r2, step):
-                if self.board[r][c1] != 0:
-                    return False, "Hay isla en el camino"
-                occ = self.occupancy.get((r, c1), {'h': 0, 'v': 0})
-                if occ['h'] > 0:
-                    return False, "Cruza un puente horizontal existente"
+        if self.has_island_between(a, b):
+            return False, "Hay isla en el camino"
+        
+        # Verificar cruces: solo se revisan las columnas (o filas) con puentes
+        # perpendiculares dentro del tramo, no cada celda
+        if self.occupancy.crosses(a, b):
+            if r1 == r2:
+                return False, "Cruza un puente vertical existente"
+            return False, "Cruza un puente horizontal existente"
         
         return True, "OK"
     
@@ -139,7 +202,8 @@ class HashiGame:
             
         Returns:
             tupla (bool, str, dict) - (éxito, mensaje, info_puente)
-            info_puente contiene: {'a': a, 'b': b, 'count': nuevo_count, 'cells': celdas_ocupadas}
+            info_puente contiene: {'a': a, 'b': b, 'count': nuevo_count,
+            'span': (orientación, línea, inicio, fin), 'is_horizontal': bool}
         """
         can_create, msg = self.can_create_bridge(a, b)
         if not can_create:
@@ -159,19 +223,7 @@ class HashiGame:
         existing = ai['bridges'].get(b, 0)
         
         # Registrar ocupación
-        occ_cells = []
-        if r1 == r2:
-            # horizontal
-            for c in range(min(c1, c2) + 1, max(c1, c2)):
-                occ = self.occupancy.setdefault((r1, c), {'h': 0, 'v': 0})
-                occ['h'] += 1
-                occ_cells.append(((r1, c), 'h'))
-        else:
-            # vertical
-            for r in range(min(r1, r2) + 1, max(r1, r2)):
-                occ = self.occupancy.setdefault((r, c1), {'h': 0, 'v': 0})
-                occ['v'] += 1
-                occ_cells.append(((r, c1), 'v'))
+        span = self.occupancy.add(a, b)
         
         # Actualizar contadores
         new_count = existing + 1
@@ -182,19 +234,128 @@ class HashiGame:
         self.history.append({
             'a': a,
             'b': b,
-            'occ_cells': occ_cells
+            'span': span
         })
         
         bridge_info = {
             'a': a,
             'b': b,
             'count': new_count,
-            'cells': occ_cells,
+            'span': span,
             'is_horizontal': r1 == r2
         }
         
+        if self._subscribers:
+            self._emit('bridge_added', bridge_info)
+        
         return True, "Puente creado", bridge_info
     
+    def apply_bridges(self, bridges, validate=True):
+        """
+        Crea varios puentes de una sola vez (p. ej. una solución completa)
+        
+        Los puentes se agrupan por par de islas y se validan una vez por par; si
+        alguno no es válido no se modifica el estado.
+        
+        Args:
+            bridges: lista de puentes [(a, b), ...] (un elemento por puente)
+            validate: si es False, no se valida (puentes de una fuente confiable)
+        
+        Returns:
+            tupla (bool, str, list) - (éxito, mensaje, info de cada par de islas)
+            cada info contiene: {'a': a, 'b': b, 'count': count_final,
+            'span': (orientación, línea, inicio, fin), 'is_horizontal': bool}
+        """
+        # Agrupar por par de islas conservando el orden de aparición
+        pairs = {}
+        for a, b in bridges:
+            a, b = tuple(a), tuple(b)
+            key = (a, b) if a < b else (b, a)
+            pairs[key] = pairs.get(key, 0) + 1
+        
+        if validate:
+            ok, msg = self._validate_pairs(pairs)
+            if not ok:
+                return False, msg, None
+        
+            # Cruces con los puentes existentes y entre los nuevos: se ocupa un
+            # par a la vez y se revierte todo si alguno cruza
+            placed = {}
+            for a, b in pairs:
+                if self.occupancy.crosses(a, b):
+                    for pa, pb in placed:
+                        self.occupancy.remove(pa, pb)
+                    return False, f"El puente entre {a} y {b} cruza un puente existente", None
+                placed[(a, b)] = self.occupancy.add(a, b)
+        
+        infos = []
+        for (a, b), count in pairs.items():
+            ai = self.islands[a]
+            bi = self.islands[b]
+            old_count = ai['bridges'].get(b, 0)
+            new_count = old_count + count
+            ai['bridges'][b] = new_count
+            bi['bridges'][a] = new_count
+            for i in range(count):
+                # Con validación el primer puente de cada par ya está en la ocupación
+                if validate and i == 0:
+                    span = placed[(a, b)]
+                else:
+                    span = self.occupancy.add(a, b)
+                self.history.append({
+                    'a': a,
+                    'b': b,
+                    'span': span
+                })
+                if self._subscribers:
+                    self._emit('bridge_added', {
+                        'a': a,
+                        'b': b,
+                        'count': old_count + i + 1,
+                        'span': span,
+                        'is_horizontal': a[0] == b[0]
+                    })
+            infos.append({
+                'a': a,
+                'b': b,
+                'count': new_count,
+                'span': span,
+                'is_horizontal': a[0] == b[0]
+            })
+        
+        return True, f"{sum(pairs.values())} puentes creados", infos
+    
+    def _validate_pairs(self, pairs):
+        """
+        Valida islas, alineación, camino y capacidades de un conjunto de puentes
+        agrupados por par de islas (los cruces se revisan en apply_bridges)
+        
+        Args:
+            pairs: dict {(a, b): cantidad} con a < b
+            
+        Returns:
+            tupla (bool, str) - (válido, mensaje_error)
+        """
+        added = {}
+        for (a, b), count in pairs.items():
+            if a not in self.islands or b not in self.islands:
+                return False, f"{a} o {b} no es una isla"
+            if a == b or (a[0] != b[0] and a[1] != b[1]):
+                return False, f"{a} y {b} no están alineadas"
+            if self.has_island_between(a, b):
+                return False, f"Hay isla en el camino entre {a} y {b}"
+            if self.islands[a]['bridges'].get(b, 0) + count > 2:
+                return False, f"Más de 2 puentes entre {a} y {b}"
+            added[a] = added.get(a, 0) + count
+            added[b] = added.get(b, 0) + count
+        
+        for pos, count in added.items():
+            info = self.islands[pos]
+            if sum(info['bridges'].values()) + count > info['num']:
+                return False, f"La isla {pos} ({info['num']}) tendría más puentes de los permitidos"
+        
+        return True, "OK"
+    
     def undo_last_bridge(self):
         """
         Deshace el último puente creado
@@ -210,10 +371,7 @@ class HashiGame:
         b = last['b']
         
         # Decrementar ocupación
-        for cell, t in last['occ_cells']:
-            occ = self.occupancy.get(cell)
-            if occ:
-                occ[t] = max(0, occ[t] - 1)
+        self.occupancy.remove(a, b)
         
         # Decrementar contadores
         if b in self.islands[a]['bridges']:
@@ -229,9 +387,13 @@ class HashiGame:
         bridge_info = {
             'a': a,
             'b': b,
-            'cells': last['occ_cells']
+            'span': last['span']
         }
         
+        if self._subscribers:
+            self._emit('bridge_removed', dict(bridge_info, count=self.islands[a]['bridges'].get(b, 0),
+                                              is_horizontal=a[0] == b[0]))
+        
         return True, "Se deshizo el último puente", bridge_info
     
     def delete_bridge(self, a, b):
@@ -268,10 +430,7 @@ class HashiGame:
         hist_entry = self.history[history_idx]
         
         # Decrementar ocupación
-        for cell, t in hist_entry['occ_cells']:
-            occ = self.occupancy.get(cell)
-            if occ:
-                occ[t] = max(0, occ[t] - 1)
+        self.occupancy.remove(a, b)
         
         # Decrementar contadores (de uno en uno)
         if b in ai['bridges']:
@@ -291,12 +450,61 @@ class HashiGame:
         bridge_info = {
             'a': a,
             'b': b,
-            'cells': hist_entry['occ_cells'],
+            'span': hist_entry['span'],
             'count_after': ai['bridges'].get(b, 0)  # cuántos quedan después de eliminar
         }
         
+        if self._subscribers:
+            self._emit('bridge_removed', {
+                'a': a,
+                'b': b,
+                'count': bridge_info['count_after'],
+                'span': bridge_info['span'],
+                'is_horizontal': a[0] == b[0]
+            })
+        
         return True, "Puente eliminado", bridge_info
     
+    def reset(self):
+        """
+        Elimina todos los puentes y el historial conservando las islas y sus
+        índices (más barato que crear otro HashiGame); los suscriptores
+        reciben un solo evento 'reset' en lugar de uno por puente
+        """
+        for info in self.islands.values():
+            info['bridges'].clear()
+        self.occupancy = BridgeOccupancy()
+        self.history.clear()
+        if self._subscribers:
+            self._emit('reset', {})
+    
+    def subscribe(self, callback):
+        """
+        Registra un suscriptor a los cambios de puentes
+        
+        Args:
+            callback: función callback(evento, info) llamada tras cada puente
+                      creado ('bridge_added') o eliminado ('bridge_removed');
+                      info contiene 'a', 'b', 'count' (puentes que quedan entre
+                      a y b), 'span' e 'is_horizontal'. reset() emite 'reset'
+                      con info vacío
+            
+        Returns:
+            el mismo callback (para poder pasarlo a unsubscribe)
+        """
+        self._subscribers.append(callback)
+        return callback
+    
+    def unsubscribe(self, callback):
+        """Elimina un suscriptor registrado con subscribe"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+    
+    def _emit(self, event, info):
+        """Notifica un evento a los suscriptores"""
+        for callback in list(self._subscribers):
+            callback(event, info)
+    
     def check_victory(self):
         """
         Verifica si se ha ganado el juego
@@ -333,6 +541,20 @@ class HashiGame:
         
         return len(seen) == len(nodes)
     
+    def get_bridges(self):
+        """
+        Retorna los puentes actuales
+        
+        Returns:
+            list de puentes [(a, b), ...] con a < b (un elemento por puente)
+        """
+        bridges = []
+        for a, info in self.islands.items():
+            for b, count in info['bridges'].items():
+                if a < b:
+                    bridges.extend([(a, b)] * count)
+        return bridges
+    
     def get_total_bridges(self):
         """
         Retorna el número total de puentes en el tablero
@@ -0,0 +1,61 @@
+"""
+Estadísticas incrementales de una partida de Hashiwokakero
+GameStats se suscribe a los eventos de HashiGame y mantiene el total de
+puentes, los puentes de cada isla y cuántas islas están completas, con O(1)
+por evento en lugar de recorrer todo el tablero tras cada cambio.
+"""
+
+
+class GameStats:
+    """Contadores de una partida actualizados con los eventos del juego"""
+
+    def __init__(self, game):
+        """
+        Lee el estado actual del juego y se suscribe a sus eventos
+
+        Args:
+            game: instancia de HashiGame
+        """
+        self.game = game
+        self._recount()
+        game.subscribe(self.on_event)
+
+    def _recount(self):
+        """Calcula los contadores recorriendo el estado actual del juego"""
+        islands = self.game.islands
+        self.used = {pos: sum(info['bridges'].values()) for pos, info in islands.items()}
+        self.total_bridges = sum(self.used.values()) // 2
+        self.complete_islands = sum(1 for pos, info in islands.items()
+                                    if self.used[pos] == info['num'])
+
+    def on_event(self, event, info):
+        """Actualiza los contadores con un evento 'bridge_added', 'bridge_removed' o 'reset'"""
+        if event == 'reset':
+            self._recount()
+            return
+        delta = 1 if event == 'bridge_added' else -1
+        self.total_bridges += delta
+        for pos in (info['a'], info['b']):
+            num = self.game.islands[pos]['num']
+            before = self.used[pos]
+            after = before + delta
+            self.used[pos] = after
+            self.complete_islands += (after == num) - (before == num)
+
+    def is_complete(self):
+        """Indica si todas las islas tienen exactamente su número de puentes"""
+        return self.complete_islands == len(self.used)
+
+    def is_victory(self):
+        """
+        Verifica la victoria: la conectividad solo se revisa cuando todas las
+        islas están completas
+
+        Returns:
+            bool
+        """
+        return self.is_complete() and self.game.check_victory()
+
+    def close(self):
+        """Deja de recibir eventos del juego"""
+        self.game.unsubscribe(self.on_event)
@@ -1,5 +1,9 @@
+import threading
+import time
+from collections import Counter
 from tkinter import Tk, Canvas, Frame, Label, Button, filedialog, LEFT, RIGHT, BOTH, font
 from game_logic import HashiGame
+from game_stats import GameStats
 from solver import HashiSolver
 from backtracking_solver import BacktrackingSolver
 
@@ -9,6 +13,8 @@ MARGIN = 20
 ISLAND_RADIUS = 18
 BRIDGE_GAP = 6  # distancia desde la circunferencia de la isla donde inicia el puente
 PARALLEL_OFF = 6  # desplazamiento para puentes dobles
+BRIDGE_TAG = "bridge"  # tag de canvas de todas las líneas de puentes
+POLL_MS = 100  # intervalo (ms) de actualización del progreso de una resolución
 
 # Paleta de colores mejorada
 COLOR_BG = "#F5F5F5"  # fondo general (gris claro)
@@ -22,6 +28,53 @@ COLOR_SELECTED = "#E74C3C"  # color de selección (rojo)
 COLOR_BUTTON_BG = "#3498DB"  # fondo de botones (azul)
 COLOR_BUTTON_FG = "#FFFFFF"  # texto de botones (blanco)
 
+def bridge_tag(a, b):
+    """Tag de canvas de las líneas entre las islas a y b (independiente del orden)"""
+    (r1, c1), (r2, c2) = (a, b) if a < b else (b, a)
+    return f"bridge_{r1}_{c1}_{r2}_{c2}"
+
+
+def bridge_segments(a, b, count, is_horizontal):
+    """
+    Geometría de los puentes entre dos islas
+    
+    Returns:
+        list de ((x1, y1, x2, y2), ancho): una línea centrada para un puente
+        o dos paralelas para dos
+    """
+    r1, c1 = a
+    r2, c2 = b
+    
+    # Calcular coordenadas del canvas
+    cx1 = MARGIN + c1 * CELL_SIZE + CELL_SIZE // 2
+    cy1 = MARGIN + r1 * CELL_SIZE + CELL_SIZE // 2
+    cx2 = MARGIN + c2 * CELL_SIZE + CELL_SIZE // 2
+    cy2 = MARGIN + r2 * CELL_SIZE + CELL_SIZE // 2
+    
+    # Calcular extremos de la línea (desde circunferencia + gap)
+    if is_horizontal:
+        signx = 1 if cx2 > cx1 else -1
+        x1 = cx1 + signx * (ISLAND_RADIUS + BRIDGE_GAP)
+        x2 = cx2 - signx * (ISLAND_RADIUS + BRIDGE_GAP)
+        y1 = cy1
+        y2 = cy2
+    else:
+        signy = 1 if cy2 > cy1 else -1
+        y1 = cy1 + signy * (ISLAND_RADIUS + BRIDGE_GAP)
+        y2 = cy2 - signy * (ISLAND_RADIUS + BRIDGE_GAP)
+        x1 = cx1
+        x2 = cx2
+    
+    if count == 1:
+        return [((x1, y1, x2, y2), 5)]
+    if count == 2:
+        off = PARALLEL_OFF
+        if is_horizontal:
+            return [((x1, y1 - off, x2, y2 - off), 3), ((x1, y1 + off, x2, y2 + off), 3)]
+        return [((x1 - off, y1, x2 - off, y2), 3), ((x1 + off, y1, x2 + off, y2), 3)]
+    return []
+
+
 class HashiGUI:
     def __init__(self, master, rows, cols, board):
         self.master = master
@@ -31,8 +84,9 @@ class HashiGUI:
         self.width = MARGIN * 2 + cols * CELL_SIZE
         self.height = MARGIN * 2 + rows * CELL_SIZE
         
-        # Inicializar la lógica del juego
+        # Inicializar la lógica del juego y sus contadores incrementales
         self.game = HashiGame(rows, cols, board)
+        self.stats = GameStats(self.game)
         
         # Configurar fuentes personalizadas
         self.font_title = font.Font(family="Segoe UI", size=10, weight="bold")
@@ -66,14 +120,22 @@ class HashiGUI:
                                        relief="raised", padx=15, pady=5)
         self.backtrack_button.pack(padx=10, pady=5)
         
+        # Botón para cancelar la resolución en curso
+        self.cancel_button = Button(self.status_frame, text="Cancelar", command=self.cancel_solve,
+                                    bg="#95A5A6", fg=COLOR_BUTTON_FG, font=self.font_label,
+                                    relief="raised", padx=15, pady=5, state="disabled")
+        self.cancel_button.pack(padx=10, pady=5)
+        
         # Estado del solver
         self.is_solved = False
         self.is_backtrack_solved = False
+        self.solving = None  # Resolución en segundo plano en curso (ver start_solve)
 
         # Datos de visualización (solo para GUI)
-        self.islands_visual = {}  # (r,c) -> {'id':oval_id, 'text':text_id, 'lines':{(r2,c2): [line_ids]}}
-        # Mapeo line_id -> (isla_a, isla_b) para funcionalidad de eliminar con clic
-        self.line_to_bridge = {}
+        self.islands_visual = {}  # (r,c) -> {'id':oval_id, 'text':text_id}
+        # Las líneas de cada par de islas llevan los tags BRIDGE_TAG y
+        # bridge_tag(a, b); tag del par -> (isla_a, isla_b) para eliminar con clic
+        self.bridge_pairs = {}
         self.selected = None
 
         self.draw_grid()
@@ -105,12 +167,17 @@ class HashiGUI:
 
     def on_click(self, event):
         """Maneja los clics del usuario en el canvas"""
+        # El tablero no se edita mientras se resuelve
+        if self.solving is not None:
+            return
+        
         # Verificar si se hizo clic en una línea de puente primero
         clicked_item = self.canvas.find_closest(event.x, event.y)[0]
-        if clicked_item in self.line_to_bridge:
-            # El usuario hizo clic en una línea de puente - eliminarla
-            self.delete_bridge_by_line(clicked_item)
-            return
+        for tag in self.canvas.gettags(clicked_item):
+            if tag in self.bridge_pairs:
+                # El usuario hizo clic en una línea de puente - eliminarla
+                self.delete_bridge_by_tag(tag)
+                return
         
         cell = self.pixel_to_cell(event.x, event.y)
         if not cell:
@@ -166,82 +233,27 @@ class HashiGUI:
         self.update_status()
         self.msg_label.config(text="Puente creado")
         
-        # Verificar victoria
-        if self.game.check_victory():
+        # Verificar victoria (la conectividad solo se revisa con todas las islas completas)
+        if self.stats.is_victory():
             self.msg_label.config(text="¡Victoria! Todas las islas están conectadas y completas.")
         
         return True, "OK"
     
     def draw_bridge(self, bridge_info):
-        """Dibuja un puente en el canvas basado en la información del puente"""
+        """
+        Dibuja los puentes entre dos islas según su cantidad actual
+        Las líneas anteriores del par (si las hay) se borran con su tag y se
+        crean de nuevo (una línea centrada o dos paralelas) en lugar de
+        reconfigurarlas
+        """
         a = bridge_info['a']
         b = bridge_info['b']
-        count = bridge_info['count']
-        is_horizontal = bridge_info['is_horizontal']
-        
-        r1, c1 = a
-        r2, c2 = b
-        
-        # Calcular coordenadas del canvas
-        cx1 = MARGIN + c1 * CELL_SIZE + CELL_SIZE // 2
-        cy1 = MARGIN + r1 * CELL_SIZE + CELL_SIZE // 2
-        cx2 = MARGIN + c2 * CELL_SIZE + CELL_SIZE // 2
-        cy2 = MARGIN + r2 * CELL_SIZE + CELL_SIZE // 2
-        
-        # Calcular extremos de la línea (desde circunferencia + gap)
-        if is_horizontal:
-            signx = 1 if cx2 > cx1 else -1
-            x1 = cx1 + signx * (ISLAND_RADIUS + BRIDGE_GAP)
-            x2 = cx2 - signx * (ISLAND_RADIUS + BRIDGE_GAP)
-            y1 = cy1
-            y2 = cy2
-        else:
-            signy = 1 if cy2 > cy1 else -1
-            y1 = cy1 + signy * (ISLAND_RADIUS + BRIDGE_GAP)
-            y2 = cy2 - signy * (ISLAND_RADIUS + BRIDGE_GAP)
-            x1 = cx1
-            x2 = cx2
-        
-        # Obtener o crear almacenamiento de líneas visuales
-        av = self.islands_visual[a]
-        bv = self.islands_visual[b]
-        av.setdefault('lines', {})
-        bv.setdefault('lines', {})
-        
-        lines_ab = av['lines'].get(b, [])
-        
-        if count == 1:
-            # Primer puente: dibujar centrado
-            line_id = self.canvas.create_line(x1, y1, x2, y2, width=5, fill=COLOR_BRIDGE)
-            lines_ab = [line_id]
-            self.line_to_bridge[line_id] = (a, b)
-        elif count == 2:
-            # Segundo puente: crear dos líneas paralelas
-            off = PARALLEL_OFF
-            if is_horizontal:
-                if len(lines_ab) > 0:
-                    # Ajustar la primera línea
-                    first = lines_ab[0]
-                    self.canvas.coords(first, x1, y1 - off, x2, y2 - off)
-                    self.canvas.itemconfig(first, width=3)
-                else:
-                    first = self.canvas.create_line(x1, y1 - off, x2, y2 - off, width=3, fill=COLOR_BRIDGE)
-                second = self.canvas.create_line(x1, y1 + off, x2, y2 + off, width=3, fill=COLOR_BRIDGE)
-            else:
-                if len(lines_ab) > 0:
-                    first = lines_ab[0]
-                    self.canvas.coords(first, x1 - off, y1, x2 - off, y2)
-                    self.canvas.itemconfig(first, width=3)
-                else:
-                    first = self.canvas.create_line(x1 - off, y1, x2 - off, y2, width=3, fill=COLOR_BRIDGE)
-                second = self.canvas.create_line(x1 + off, y1, x2 + off, y2, width=3, fill=COLOR_BRIDGE)
-            lines_ab = [first, second]
-            self.line_to_bridge[first] = (a, b)
-            self.line_to_bridge[second] = (a, b)
-        
-        # Guardar las líneas
-        av['lines'][b] = lines_ab
-        bv['lines'][a] = lines_ab
+        tag = bridge_tag(a, b)
+        if tag in self.bridge_pairs:
+            self.canvas.delete(tag)
+        for coords, width in bridge_segments(a, b, bridge_info['count'], bridge_info['is_horizontal']):
+            self.canvas.create_line(*coords, width=width, fill=COLOR_BRIDGE, tags=(BRIDGE_TAG, tag))
+        self.bridge_pairs[tag] = (a, b) if a < b else (b, a)
 
     def undo(self):
         """Deshace el último puente creado"""
@@ -258,12 +270,9 @@ class HashiGUI:
         self.update_status()
         self.msg_label.config(text=msg)
 
-    def delete_bridge_by_line(self, line_id):
-        """Elimina un puente cuando el usuario hace clic en su línea"""
-        if line_id not in self.line_to_bridge:
-            return
-        
-        a, b = self.line_to_bridge[line_id]
+    def delete_bridge_by_tag(self, tag):
+        """Elimina un puente cuando el usuario hace clic en una de sus líneas"""
+        a, b = self.bridge_pairs[tag]
         
         # Usar la lógica del juego para eliminar
         success, msg, bridge_info = self.game.delete_bridge(a, b)
@@ -279,46 +288,25 @@ class HashiGUI:
         self.msg_label.config(text=msg)
     
     def remove_bridge_visual(self, a, b):
-        """Elimina las líneas visuales de un puente del canvas y redibuja si quedan puentes"""
-        av = self.islands_visual.get(a)
-        bv = self.islands_visual.get(b)
-        if not av or not bv:
-            return
-        
-        # Eliminar todas las líneas actuales
-        lines = av.get('lines', {}).get(b, [])
-        for lid in lines:
-            try:
-                self.canvas.delete(lid)
-                if lid in self.line_to_bridge:
-                    del self.line_to_bridge[lid]
-            except Exception:
-                pass
-        
-        # Eliminar almacenamiento de líneas visuales
-        if 'lines' in av and b in av['lines']:
-            del av['lines'][b]
-        if 'lines' in bv and a in bv['lines']:
-            del bv['lines'][a]
+        """Borra las líneas de un par de islas y redibuja los puentes que queden"""
+        tag = bridge_tag(a, b)
+        self.canvas.delete(tag)
+        self.bridge_pairs.pop(tag, None)
         
         # Verificar cuántos puentes quedan en la lógica del juego
         island_info = self.game.get_island_info(a)
-        if island_info and b in island_info['bridges']:
-            remaining_count = island_info['bridges'][b]
-            if remaining_count > 0:
-                # Redibujar el/los puente(s) restante(s)
-                bridge_info = {
-                    'a': a,
-                    'b': b,
-                    'count': remaining_count,
-                    'is_horizontal': a[0] == b[0]
-                }
-                self.draw_bridge(bridge_info)
+        if island_info and island_info['bridges'].get(b, 0) > 0:
+            self.draw_bridge({
+                'a': a,
+                'b': b,
+                'count': island_info['bridges'][b],
+                'is_horizontal': a[0] == b[0]
+            })
 
     def update_status(self):
         """Actualiza el panel de estado"""
         # Obtener información del estado del juego
-        total = self.game.get_total_bridges()
+        total = self.stats.total_bridges
         
         sel = "-"
         if self.selected:
@@ -352,70 +340,160 @@ class HashiGUI:
     
     def solve_puzzle(self):
         """Resuelve el puzzle usando CSP + Constraint Propagation"""
-        self.msg_label.config(text="Resolviendo con CSP...")
-        self.master.update()  # Actualizar GUI para mostrar mensaje
-        
-        # Crear solver y resolver
-        solver = HashiSolver(self.game)
-        success, bridges = solver.solve()
-        
+        self.start_solve(HashiSolver, "CSP", self.on_csp_done)
+    
+    def on_csp_done(self, solver, success, bridges):
+        """Muestra el resultado de la resolución con CSP"""
         if success:
-            # Dibujar todos los puentes de la solución
-            for a, b in bridges:
-                success_create, msg, bridge_info = self.game.create_bridge(a, b)
-                if success_create:
-                    self.draw_bridge(bridge_info)
-            
-            self.update_status()
+            applied, msg = self.show_solution(bridges)
+            if not applied:
+                self.solution_rejected(msg)
+                return
             self.msg_label.config(text="¡Solución con CSP!")
-            self.solve_button.config(text="Limpiar")
-            self.backtrack_button.config(state="disabled")
+            self.solve_button.config(text="Limpiar", state="normal")
             self.is_solved = True
         else:
             self.msg_label.config(text="No se encontró solución")
+            self.solve_button.config(state="normal")
+            self.backtrack_button.config(state="normal")
     
     def solve_puzzle_backtracking(self):
         """Resuelve el puzzle usando Backtracking Puro"""
-        self.msg_label.config(text="Resolviendo con Backtracking...")
-        self.master.update()  # Actualizar GUI para mostrar mensaje
-        
-        # Crear solver y resolver
-        solver = BacktrackingSolver(self.game)
-        success, bridges = solver.solve()
-        
+        self.start_solve(BacktrackingSolver, "Backtracking", self.on_backtracking_done)
+    
+    def on_backtracking_done(self, solver, success, bridges):
+        """Muestra el resultado de la resolución con backtracking"""
         if success:
-            # Dibujar todos los puentes de la solución
-            for a, b in bridges:
-                success_create, msg, bridge_info = self.game.create_bridge(a, b)
-                if success_create:
-                    self.draw_bridge(bridge_info)
-            
-            self.update_status()
+            applied, msg = self.show_solution(bridges)
+            if not applied:
+                self.solution_rejected(msg)
+                return
             iterations_text = f"Iteraciones: {solver.iterations}"
             self.msg_label.config(text=f"¡Solución con Backtracking!\n{iterations_text}")
-            self.backtrack_button.config(text="Limpiar")
-            self.solve_button.config(state="disabled")
+            self.backtrack_button.config(text="Limpiar", state="normal")
             self.is_backtrack_solved = True
         else:
             self.msg_label.config(text=f"No se encontró solución\n(Iteraciones: {solver.iterations})")
+            self.solve_button.config(state="normal")
+            self.backtrack_button.config(state="normal")
+    
+    def start_solve(self, solver_class, name, on_done):
+        """
+        Resuelve en un hilo aparte sobre una copia del juego
+        El progreso se consulta con after() desde el hilo de Tk y on_done
+        recibe (solver, éxito, puentes) también en el hilo de Tk
+        
+        Args:
+            solver_class: clase del solucionador
+            name: nombre para los mensajes
+            on_done: función llamada al terminar (no se llama si se cancela)
+        """
+        solver = solver_class(self.copy_game())
+        job = {'solver': solver, 'name': name, 'on_done': on_done,
+               'result': None, 'error': None, 'start': time.perf_counter()}
+        job['thread'] = threading.Thread(target=self._solve_worker, args=(job,), daemon=True)
+        self.solving = job
+        
+        self.solve_button.config(state="disabled")
+        self.backtrack_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.msg_label.config(text=f"Resolviendo con {name}...")
+        job['thread'].start()
+        self.master.after(POLL_MS, self.poll_solve)
+    
+    @staticmethod
+    def _solve_worker(job):
+        """Hilo de resolución: no toca widgets, solo deja el resultado en job"""
+        try:
+            job['result'] = job['solver'].solve()
+        except Exception as e:  # p. ej. RecursionError en tableros muy grandes
+            job['error'] = e
+    
+    def poll_solve(self):
+        """Muestra el progreso de la resolución o aplica su resultado al terminar"""
+        job = self.solving
+        if job is None:
+            return
+        solver = job['solver']
+        elapsed = time.perf_counter() - job['start']
+        
+        if job['thread'].is_alive():
+            rate = solver.iterations / elapsed if elapsed > 0 else 0
+            state = "Cancelando" if solver.cancelled else "Resolviendo"
+            self.msg_label.config(text=f"{state} con {job['name']}...\n"
+                                       f"Nodos: {solver.iterations} ({rate:.0f}/s)\n"
+                                       f"Profundidad: {solver.depth}\n"
+                                       f"Tiempo: {elapsed:.1f} s")
+            self.master.after(POLL_MS, self.poll_solve)
+            return
+        
+        self.solving = None
+        self.cancel_button.config(state="disabled")
+        if solver.cancelled or job['error'] is not None:
+            if solver.cancelled:
+                self.msg_label.config(text=f"Resolución cancelada\n(Iteraciones: {solver.iterations})")
+            else:
+                self.msg_label.config(text=f"Error al resolver: {job['error']}")
+            self.solve_button.config(state="normal")
+            self.backtrack_button.config(state="normal")
+            return
+        
+        success, bridges = job['result']
+        job['on_done'](solver, success, bridges)
+    
+    def cancel_solve(self):
+        """Pide al solver en curso que se detenga (el resultado llega en poll_solve)"""
+        if self.solving is not None:
+            self.solving['solver'].cancel()
+            self.cancel_button.config(state="disabled")
+    
+    def copy_game(self):
+        """
+        Copia el juego con los puentes actuales para que el solver no modifique
+        (ni emita eventos sobre) el juego que muestra la interfaz
+        """
+        game = HashiGame(self.rows, self.cols, self.board)
+        game.apply_bridges(self.game.get_bridges(), validate=False)
+        return game
+    
+    def show_solution(self, bridges):
+        """
+        Aplica y dibuja los puentes de la solución que aún no están en el tablero
+        
+        Returns:
+            tupla (bool, str) - (si el juego aceptó los puentes, mensaje)
+        """
+        existing = Counter(self.game.get_bridges())
+        pending = []
+        for a, b in bridges:
+            key = (a, b) if a < b else (b, a)
+            if existing[key] > 0:
+                existing[key] -= 1
+            else:
+                pending.append(key)
+        
+        # apply_bridges retorna una info por par con la cantidad final, así que
+        # cada par se dibuja una sola vez
+        applied, msg, infos = self.game.apply_bridges(pending)
+        for bridge_info in infos or []:
+            self.draw_bridge(bridge_info)
+        self.update_status()
+        return applied, msg
+    
+    def solution_rejected(self, msg):
+        """Informa que el juego rechazó la solución y deja el tablero sin resolver"""
+        self.msg_label.config(text=f"No se pudo aplicar la solución:\n{msg}")
+        self.solve_button.config(state="normal")
+        self.backtrack_button.config(state="normal")
     
     def clear_all_bridges(self):
         """Limpia todos los puentes del tablero"""
-        # Eliminar todas las líneas visuales
-        for island_pos, visual_info in self.islands_visual.items():
-            if 'lines' in visual_info:
-                for neighbor, lines in list(visual_info['lines'].items()):
-                    for line_id in lines:
-                        try:
-                            self.canvas.delete(line_id)
-                            if line_id in self.line_to_bridge:
-                                del self.line_to_bridge[line_id]
-                        except Exception:
-                            pass
-                visual_info['lines'] = {}
-        
-        # Reinicializar la lógica del juego
-        self.game = HashiGame(self.rows, self.cols, self.board)
+        # Todas las líneas de puentes comparten un tag: un solo borrado
+        self.canvas.delete(BRIDGE_TAG)
+        self.bridge_pairs.clear()
+        
+        # Quitar los puentes de la lógica del juego (GameStats recibe 'reset')
+        self.game.reset()
         self.update_status()
         
         # Resetear estados de los botones
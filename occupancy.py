@@ -0,0 +1,165 @@
+"""
+Ocupación de celdas por puentes para Hashiwokakero
+Guarda cada puente como un intervalo: los horizontales por fila y los verticales
+por columna. La memoria es proporcional al número de puentes (no a su longitud)
+y consultar si un puente nuevo cruza a otro es una búsqueda binaria sobre las
+líneas perpendiculares que tienen puentes dentro de su rango.
+
+Se puede consultar como el dict por celda que usaba HashiGame:
+occupancy[(r, c)] -> {'h': cantidad, 'v': cantidad}
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+
+class BridgeOccupancy:
+    """Intervalos ocupados por puentes, por orientación ('h' o 'v') y línea"""
+
+    def __init__(self):
+        # spans[o][línea] -> {inicio: [fin, cantidad]} (extremos exclusivos: las islas)
+        self.spans = {'h': {}, 'v': {}}
+        # starts[o][línea] -> inicios ordenados de los intervalos de esa línea
+        self.starts = {'h': {}, 'v': {}}
+        # lines[o] -> líneas (filas o columnas) ordenadas que tienen algún puente
+        self.lines = {'h': [], 'v': []}
+
+    @staticmethod
+    def span_of(a, b):
+        """
+        Retorna el intervalo que ocupa un puente entre dos islas alineadas
+
+        Returns:
+            tupla (orientación, línea, inicio, fin); las celdas ocupadas son
+            las que están estrictamente entre inicio y fin
+        """
+        r1, c1 = a
+        r2, c2 = b
+        if r1 == r2:
+            return 'h', r1, min(c1, c2), max(c1, c2)
+        return 'v', c1, min(r1, r2), max(r1, r2)
+
+    def add(self, a, b):
+        """
+        Registra un puente entre a y b
+
+        Returns:
+            tupla (orientación, línea, inicio, fin) del intervalo
+        """
+        o, line, lo, hi = span = self.span_of(a, b)
+        spans = self.spans[o].get(line)
+        if spans is None:
+            spans = self.spans[o][line] = {}
+            self.starts[o][line] = []
+            insort(self.lines[o], line)
+        if lo in spans:
+            spans[lo][1] += 1
+        else:
+            spans[lo] = [hi, 1]
+            insort(self.starts[o][line], lo)
+        return span
+
+    def remove(self, a, b):
+        """Elimina un puente entre a y b (si hay dos, deja el otro)"""
+        o, line, lo, hi = self.span_of(a, b)
+        spans = self.spans[o].get(line)
+        if not spans or lo not in spans:
+            return
+        spans[lo][1] -= 1
+        if spans[lo][1] > 0:
+            return
+        del spans[lo]
+        starts = self.starts[o][line]
+        del starts[bisect_left(starts, lo)]
+        if not spans:
+            del self.spans[o][line]
+            del self.starts[o][line]
+            lines = self.lines[o]
+            del lines[bisect_left(lines, line)]
+
+    def count_at(self, cell, o):
+        """
+        Cuenta los puentes de orientación o que pasan por una celda
+
+        Args:
+            cell: tupla (r, c)
+            o: 'h' o 'v'
+
+        Returns:
+            int
+        """
+        r, c = cell
+        line, x = (r, c) if o == 'h' else (c, r)
+        starts = self.starts[o].get(line)
+        if not starts:
+            return 0
+        i = bisect_left(starts, x) - 1
+        if i < 0:
+            return 0
+        hi, count = self.spans[o][line][starts[i]]
+        return count if x < hi else 0
+
+    def crosses(self, a, b):
+        """
+        Verifica si un puente entre a y b cruzaría algún puente perpendicular
+
+        Returns:
+            bool
+        """
+        for _ in self.crossing_spans(a, b):
+            return True
+        return False
+
+    def crossing_spans(self, a, b):
+        """
+        Puentes perpendiculares que cruzaría un puente entre a y b
+
+        Yields:
+            tupla (inicio, fin) con las islas de cada puente cruzado
+        """
+        o, line, lo, hi = self.span_of(a, b)
+        other = 'v' if o == 'h' else 'h'
+        lines = self.lines[other]
+        i = bisect_right(lines, lo)
+        while i < len(lines) and lines[i] < hi:
+            x = lines[i]
+            starts = self.starts[other][x]
+            j = bisect_left(starts, line) - 1
+            if j >= 0:
+                start = starts[j]
+                end = self.spans[other][x][start][0]
+                if line < end:
+                    if o == 'h':
+                        yield (start, x), (end, x)
+                    else:
+                        yield (x, start), (x, end)
+            i += 1
+
+    def copy(self):
+        """Retorna una copia independiente"""
+        new = BridgeOccupancy()
+        for o in ('h', 'v'):
+            new.spans[o] = {line: {lo: list(entry) for lo, entry in spans.items()}
+                            for line, spans in self.spans[o].items()}
+            new.starts[o] = {line: list(starts) for line, starts in self.starts[o].items()}
+            new.lines[o] = list(self.lines[o])
+        return new
+
+    def get(self, cell, default=None):
+        """Igual que dict.get: {'h': n, 'v': n} o default si la celda está libre"""
+        occ = {'h': self.count_at(cell, 'h'), 'v': self.count_at(cell, 'v')}
+        if occ['h'] == 0 and occ['v'] == 0:
+            return default
+        return occ
+
+    def __getitem__(self, cell):
+        occ = self.get(cell)
+        if occ is None:
+            raise KeyError(cell)
+        return occ
+
+    def __contains__(self, cell):
+        return self.get(cell) is not None
+
+    def __len__(self):
+        """Número de intervalos distintos guardados"""
+        return sum(len(spans) for o in ('h', 'v') for spans in self.spans[o].values())
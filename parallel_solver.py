@@ -0,0 +1,274 @@
+"""
+Búsqueda en árbol paralela para Hashiwokakero
+Divide la parte superior del árbol de BacktrackingSolver en subproblemas
+(asignaciones parciales de puentes) y los reparte entre procesos. Los procesos
+ociosos reciben trabajo de los ocupados: cuando hay procesos esperando, un
+proceso ocupado cede el nodo pendiente menos profundo de su pila, que es el que
+tiene el subárbol más grande. La búsqueda se detiene en cuanto un proceso
+encuentra solución.
+"""
+
+import multiprocessing
+import os
+import queue
+
+from game_logic import HashiGame
+from backtracking_solver import BacktrackingSolver
+
+# Cada cuántos nodos revisa un proceso si debe detenerse o ceder trabajo
+CHECK_INTERVAL = 64
+
+
+def _collect_bridges(game):
+    """Retorna la lista de puentes [(a, b), ...] del estado actual del juego"""
+    bridges = []
+    for pos, info in game.islands.items():
+        for neighbor, count in info['bridges'].items():
+            if pos < neighbor:
+                for _ in range(count):
+                    bridges.append((pos, neighbor))
+    return bridges
+
+
+def _move_bridges(move):
+    """Convierte un movimiento (isla, vecino, n) en n puentes sueltos"""
+    island, neighbor, num_bridges = move
+    return [(island, neighbor)] * num_bridges
+
+
+def _build_solver(rows, cols, board, bridges):
+    """
+    Crea un BacktrackingSolver sobre un juego nuevo con los puentes dados
+
+    Returns:
+        BacktrackingSolver o None si algún puente no se puede crear
+    """
+    game = HashiGame(rows, cols, board)
+    for a, b in bridges:
+        success, _, _ = game.create_bridge(a, b)
+        if not success:
+            return None
+    return BacktrackingSolver(game)
+
+
+class _SharedState:
+    """Objetos compartidos entre el proceso principal y los trabajadores"""
+
+    def __init__(self, ctx, workers):
+        self.tasks = ctx.Queue()
+        self.results = ctx.Queue()
+        self.stop = ctx.Event()
+        # Procesos sin tarea asignada
+        self.idle = ctx.Value('i', workers)
+        # Tareas en la cola sin tomar
+        self.queued = ctx.Value('i', 0)
+        # Tareas creadas que aún no se terminan de explorar
+        self.pending = ctx.Value('i', 0)
+        # Nodos explorados entre todos los procesos
+        self.nodes = ctx.Value('q', 0)
+
+    def push(self, task):
+        """Publica una tarea nueva"""
+        with self.pending.get_lock():
+            self.pending.value += 1
+        with self.queued.get_lock():
+            self.queued.value += 1
+        self.tasks.put(task)
+
+
+def _explore(rows, cols, board, task, shared, max_iterations):
+    """
+    Explora en profundidad el subárbol de una tarea con una pila explícita
+
+    Returns:
+        list de puentes si encontró solución, None en caso contrario
+    """
+    solver = _build_solver(rows, cols, board, task)
+    if solver is None:
+        return None
+
+    def children():
+        if solver._is_solution():
+            return None
+        if solver._is_invalid_state():
+            return []
+        return solver._expand()
+
+    moves = children()
+    if moves is None:
+        return _collect_bridges(solver.game)
+
+    # frames[k] = [movimientos, índice del siguiente] del estado tras applied[:k]
+    frames = [[moves, 0]]
+    applied = []
+
+    try:
+        return _search(solver, children, frames, applied, task, shared, max_iterations)
+    finally:
+        with shared.nodes.get_lock():
+            shared.nodes.value += solver.iterations % CHECK_INTERVAL
+
+
+def _search(solver, children, frames, applied, task, shared, max_iterations):
+    """Bucle de búsqueda en profundidad de _explore; cuenta los nodos en solver.iterations"""
+    while frames:
+        solver.iterations += 1
+        if solver.iterations % CHECK_INTERVAL == 0:
+            with shared.nodes.get_lock():
+                shared.nodes.value += CHECK_INTERVAL
+                total = shared.nodes.value
+            if shared.stop.is_set() or total > max_iterations:
+                return None
+            if shared.idle.value > shared.queued.value:
+                _donate(frames, applied, task, shared)
+
+        frame = frames[-1]
+        if frame[1] >= len(frame[0]):
+            frames.pop()
+            if applied:
+                solver._undo_move(applied.pop())
+            continue
+
+        move = frame[0][frame[1]]
+        frame[1] += 1
+        if not solver._apply_move(move):
+            continue
+        applied.append(move)
+
+        moves = children()
+        if moves is None:
+            return _collect_bridges(solver.game)
+        frames.append([moves, 0])
+
+    return None
+
+
+def _donate(frames, applied, task, shared):
+    """Cede a la cola compartida el movimiento pendiente menos profundo de la pila"""
+    for depth, frame in enumerate(frames):
+        moves, index = frame
+        if index < len(moves):
+            prefix = list(task)
+            for move in applied[:depth]:
+                prefix.extend(_move_bridges(move))
+            prefix.extend(_move_bridges(moves[index]))
+            frame[1] += 1
+            shared.push(prefix)
+            return
+
+
+def _worker(rows, cols, board, shared, max_iterations):
+    """Proceso trabajador: toma tareas hasta que se agotan o alguien encuentra solución"""
+    while not shared.stop.is_set():
+        try:
+            task = shared.tasks.get(timeout=0.01)
+        except queue.Empty:
+            if shared.pending.value == 0:
+                return
+            continue
+
+        with shared.queued.get_lock():
+            shared.queued.value -= 1
+        with shared.idle.get_lock():
+            shared.idle.value -= 1
+
+        bridges = _explore(rows, cols, board, task, shared, max_iterations)
+        if bridges is not None:
+            shared.results.put(bridges)
+            shared.stop.set()
+
+        with shared.idle.get_lock():
+            shared.idle.value += 1
+        with shared.pending.get_lock():
+            shared.pending.value -= 1
+
+
+class ParallelBacktrackingSolver:
+    """Resuelve un puzzle repartiendo el árbol de BacktrackingSolver entre procesos"""
+
+    def __init__(self, game, workers=None, tasks_per_worker=4):
+        """
+        Inicializa el solucionador
+
+        Args:
+            game: instancia de HashiGame
+            workers: número de procesos (por defecto, número de CPUs)
+            tasks_per_worker: subproblemas iniciales por proceso al dividir el árbol
+        """
+        self.game = game
+        self.workers = workers or os.cpu_count() or 1
+        self.tasks_per_worker = tasks_per_worker
+        self.iterations = 0
+        self.max_iterations = 1000000
+
+    def solve(self):
+        """
+        Intenta resolver el puzzle en paralelo
+
+        Returns:
+            tuple (bool, list) - (éxito, lista de puentes [(a, b), ...])
+        """
+        rows, cols, board = self.game.rows, self.game.cols, self.game.board
+        base = _collect_bridges(self.game)
+
+        # Dividir la parte superior del árbol en el proceso principal (BFS por niveles)
+        frontier = [base]
+        target = self.workers * self.tasks_per_worker
+        while len(frontier) < target:
+            next_level = []
+            for task in frontier:
+                solver = _build_solver(rows, cols, board, task)
+                if solver is None:
+                    continue
+                self.iterations += 1
+                if solver._is_solution():
+                    return True, _collect_bridges(solver.game)
+                if solver._is_invalid_state():
+                    continue
+                for move in solver._expand():
+                    next_level.append(task + _move_bridges(move))
+            if not next_level:
+                return False, []
+            if len(next_level) == len(frontier):
+                # El nivel no crece: no vale la pena seguir dividiendo
+                frontier = next_level
+                break
+            frontier = next_level
+
+        ctx = multiprocessing.get_context()
+        shared = _SharedState(ctx, self.workers)
+        for task in frontier:
+            shared.push(task)
+
+        processes = [
+            ctx.Process(target=_worker, args=(rows, cols, board, shared, self.max_iterations), daemon=True)
+            for _ in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        bridges = None
+        try:
+            while True:
+                try:
+                    bridges = shared.results.get(timeout=0.05)
+                    break
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes):
+                        try:
+                            bridges = shared.results.get(timeout=0.05)
+                        except queue.Empty:
+                            pass
+                        break
+        finally:
+            shared.stop.set()
+            for process in processes:
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            self.iterations += shared.nodes.value
+
+        if bridges is None:
+            return False, []
+        return True, bridges
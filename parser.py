@@ -1,19 +1,69 @@
+from sparse_board import SparseBoard
+
+# Marca de la cabecera del formato disperso: "filas,columnas,sparse"
+SPARSE_TAG = "sparse"
+
+
 def parse_board(path):
-    """Lee el archivo y retorna (filas, columnas, tablero) donde tablero es lista de listas de enteros."""
+    """
+    Lee el archivo y retorna (filas, columnas, tablero).
+
+    Formato denso: cabecera 'filas,columnas' y una línea de dígitos por fila;
+    el tablero es lista de listas de enteros.
+    Formato disperso: cabecera 'filas,columnas,sparse' y una línea 'fila,columna,valor'
+    por isla (líneas vacías y comentarios '#' se ignoran); el tablero es un SparseBoard.
+    """
     with open(path, "r", encoding="utf-8") as f:
-        first = f.readline().strip()
-        if not first:
-            raise ValueError("Archivo vacío o formato inválido")
-        parts = first.split(",")
-        if len(parts) != 2:
-            raise ValueError("Primera línea debe ser 'filas,columnas'")
-        rows = int(parts[0])
-        cols = int(parts[1])
-        board = []
-        for _ in range(rows):
-            line = f.readline().strip()
-            if len(line) < cols:
-                raise ValueError("Línea demasiado corta en el tablero")
-            row = [int(ch) for ch in line[:cols]]
-            board.append(row)
+        return parse_board_lines(f)
+
+
+def parse_board_lines(lines):
+    """
+    Igual que parse_board pero a partir de las líneas de un tablero
+
+    Args:
+        lines: iterable de líneas (un archivo abierto, una lista, ...)
+
+    Returns:
+        tupla (filas, columnas, tablero)
+    """
+    lines = iter(lines)
+    first = next(lines, "").strip()
+    if not first:
+        raise ValueError("Archivo vacío o formato inválido")
+    parts = first.split(",")
+    if len(parts) == 3 and parts[2].strip() == SPARSE_TAG:
+        return _parse_sparse(lines, int(parts[0]), int(parts[1]))
+    if len(parts) != 2:
+        raise ValueError("Primera línea debe ser 'filas,columnas'")
+    rows = int(parts[0])
+    cols = int(parts[1])
+    board = []
+    for _ in range(rows):
+        line = next(lines, "").strip()
+        if len(line) < cols:
+            raise ValueError("Línea demasiado corta en el tablero")
+        row = [int(ch) for ch in line[:cols]]
+        board.append(row)
     return rows, cols, board
+
+
+def _parse_sparse(lines, rows, cols):
+    """Lee las líneas 'fila,columna,valor' del formato disperso"""
+    islands = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split(",")
+        if len(parts) != 3:
+            raise ValueError(f"Línea de isla inválida: '{line}' (se espera 'fila,columna,valor')")
+        r, c, v = int(parts[0]), int(parts[1]), int(parts[2])
+        if not (0 <= r < rows and 0 <= c < cols):
+            raise ValueError(f"Isla fuera del tablero: {r},{c}")
+        if v <= 0:
+            raise ValueError(f"Valor de isla inválido en {r},{c}: {v}")
+        if (r, c) in islands:
+            raise ValueError(f"Isla repetida en {r},{c}")
+        islands[(r, c)] = v
+    return rows, cols, SparseBoard(rows, cols, islands)
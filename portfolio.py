@@ -0,0 +1,183 @@
+"""
+Modo portafolio para Hashiwokakero
+Lanza varias configuraciones de solucionadores (CSP, backtracking, distintas
+semillas) en procesos separados y se queda con la primera solución válida.
+El resto de procesos se cancela en cuanto hay un ganador.
+"""
+
+import multiprocessing
+import os
+import queue
+import time
+
+from game_logic import HashiGame
+from solver import HashiSolver
+from backtracking_solver import BacktrackingSolver
+from verifier import BoardVerifier
+
+# Solucionadores disponibles por nombre
+SOLVERS = {
+    'csp': HashiSolver,
+    'backtracking': BacktrackingSolver,
+}
+
+
+def default_configs(workers):
+    """
+    Genera las configuraciones por defecto del portafolio
+
+    Args:
+        workers: número de procesos disponibles
+
+    Returns:
+        list de dicts con 'name', 'solver' y opcionalmente 'seed'
+    """
+    configs = [
+        {'name': 'csp', 'solver': 'csp'},
+        {'name': 'backtracking', 'solver': 'backtracking'},
+    ]
+    seed = 1
+    while len(configs) < workers:
+        configs.append({'name': f'backtracking-s{seed}', 'solver': 'backtracking', 'seed': seed})
+        seed += 1
+    return configs
+
+
+def make_solver(game, config):
+    """
+    Crea un solucionador a partir de una configuración
+
+    Args:
+        game: instancia de HashiGame
+        config: dict con 'solver' y opcionalmente 'seed' y 'max_iterations'
+
+    Returns:
+        instancia del solucionador
+    """
+    solver_class = SOLVERS[config['solver']]
+    if config.get('seed') is not None:
+        solver = solver_class(game, seed=config['seed'])
+    else:
+        solver = solver_class(game)
+    if config.get('max_iterations') is not None:
+        solver.max_iterations = config['max_iterations']
+    return solver
+
+
+def is_valid_solution(rows, cols, board, bridges):
+    """
+    Verifica una solución con el verificador de una sola pasada
+
+    Returns:
+        bool - True si los puentes forman una solución completa
+    """
+    return BoardVerifier(board, rows, cols).verify(bridges)['valid']
+
+
+def _run_config(rows, cols, board, config, results):
+    """Proceso hijo: resuelve el tablero con una configuración y publica el resultado"""
+    start = time.perf_counter()
+    try:
+        game = HashiGame(rows, cols, board)
+        solver = make_solver(game, config)
+        success, bridges = solver.solve()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        results.put((config['name'], success, bridges, solver.iterations, elapsed_ms, None))
+    except Exception as e:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        results.put((config['name'], False, [], 0, elapsed_ms, str(e)))
+
+
+def solve_portfolio(rows, cols, board, configs=None, workers=None, timeout=None):
+    """
+    Resuelve un tablero ejecutando varias configuraciones en paralelo
+
+    Args:
+        rows: número de filas
+        cols: número de columnas
+        board: matriz con los valores de las islas
+        configs: lista de configuraciones (ver default_configs)
+        workers: máximo de procesos simultáneos (por defecto, número de CPUs)
+        timeout: tiempo máximo en segundos (None = sin límite)
+
+    Returns:
+        tuple (bool, list, dict) - (éxito, puentes, info)
+        info contiene 'solver' (configuración ganadora o None), 'iterations',
+        'time_ms' y 'attempts' con el resultado de cada configuración terminada
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if configs is None:
+        configs = default_configs(workers)
+
+    ctx = multiprocessing.get_context()
+    results = ctx.Queue()
+    pending = list(configs)
+    running = {}
+    attempts = []
+    start = time.perf_counter()
+    deadline = start + timeout if timeout is not None else None
+
+    def launch_next():
+        config = pending.pop(0)
+        process = ctx.Process(target=_run_config, args=(rows, cols, board, config, results), daemon=True)
+        process.start()
+        running[config['name']] = process
+
+    try:
+        while pending and len(running) < workers:
+            launch_next()
+
+        while running:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+            try:
+                name, success, bridges, iterations, elapsed_ms, error = results.get(timeout=0.05)
+            except queue.Empty:
+                # Detectar procesos que murieron sin publicar resultado
+                for name, process in list(running.items()):
+                    if not process.is_alive() and process.exitcode not in (0, None):
+                        del running[name]
+                        attempts.append({'solver': name, 'success': False,
+                                         'error': f"exitcode {process.exitcode}"})
+                        if pending:
+                            launch_next()
+                continue
+
+            process = running.pop(name, None)
+            if process is not None:
+                process.join()
+
+            valid = success and is_valid_solution(rows, cols, board, bridges)
+            attempt = {'solver': name, 'success': valid, 'iterations': iterations,
+                       'time_ms': round(elapsed_ms, 2)}
+            if error:
+                attempt['error'] = error
+            attempts.append(attempt)
+
+            if valid:
+                return True, bridges, {
+                    'solver': name,
+                    'iterations': iterations,
+                    'time_ms': (time.perf_counter() - start) * 1000,
+                    'attempts': attempts
+                }
+
+            if pending:
+                launch_next()
+    finally:
+        # Cancelar las configuraciones que siguen en ejecución
+        for process in running.values():
+            if process.is_alive():
+                process.terminate()
+        for process in running.values():
+            process.join()
+        results.close()
+
+    return False, [], {
+        'solver': None,
+        'iterations': sum(a.get('iterations', 0) for a in attempts),
+        'time_ms': (time.perf_counter() - start) * 1000,
+        'attempts': attempts
+    }
@@ -0,0 +1,306 @@
+"""
+Perfilado de ejecuciones de solucionadores
+Envuelve una llamada (normalmente solver.solve) con cProfile o con un
+muestreador de pilas y guarda un archivo por ejecución:
+
+    cprofile  '.pstats'  se abre con pstats, snakeviz, etc.
+    sample    '.folded'  pilas colapsadas ('a;b;c cuenta' por línea), la
+                         entrada de flamegraph.pl, speedscope o inferno
+
+Los archivos de una corrida completa se combinan después en una tabla de
+funciones más costosas (hot_table) y en un archivo agregado, así que sirve
+también cuando cada tablero se resolvió en otro proceso.
+
+Uso:
+    success, bridges = profile_call(solver.solve, 'cprofile', 'perfiles/tablero.pstats')
+    print(format_hot_table(hot_table(glob.glob('perfiles/*.pstats'))))
+    py profiling.py perfiles/*.pstats --limit 15
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import re
+import signal
+import sys
+import threading
+from collections import Counter
+
+PROFILE_MODES = ('cprofile', 'sample')
+
+PROFILE_EXTENSIONS = {
+    'cprofile': '.pstats',
+    'sample': '.folded',
+}
+
+# Nombre del archivo agregado dentro del directorio de perfiles
+AGGREGATE_NAME = "_aggregate"
+
+
+def _frame_label(code):
+    """Etiqueta de una función en las pilas colapsadas: 'archivo.py:Clase.metodo'"""
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{os.path.basename(code.co_filename)}:{name}"
+
+
+class StackSampler:
+    """
+    Muestreador de pilas del hilo principal
+
+    Con SIGPROF (POSIX) el intérprete recibe una señal cada 'interval'
+    segundos de CPU del proceso y el manejador registra la pila
+    interrumpida. Donde no hay setitimer (Windows) o fuera del hilo
+    principal, un hilo lee la pila con sys._current_frames cada 'interval'
+    segundos de reloj. Solo se registran los marcos por debajo del que llamó
+    a start(), así que las pilas empiezan en la función perfilada.
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.counts = Counter()
+        self._root = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._previous_handler = None
+
+    def start(self):
+        """Empieza a muestrear la pila del hilo actual"""
+        self._root = sys._getframe(1)
+        if hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread():
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            target = threading.get_ident()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._poll, args=(target,), daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Deja de muestrear"""
+        if self._thread is None:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        else:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self._root = None
+
+    def _on_signal(self, signum, frame):
+        self._record(frame)
+
+    def _poll(self, thread_id):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                self._record(frame)
+
+    def _record(self, frame):
+        """Suma una muestra de la pila que termina en frame"""
+        stack = []
+        root = self._root
+        while frame is not None and frame is not root:
+            stack.append(_frame_label(frame.f_code))
+            frame = frame.f_back
+        if stack:
+            self.counts[";".join(reversed(stack))] += 1
+
+    def write(self, path):
+        """Escribe las pilas colapsadas ('pila cuenta' por línea)"""
+        write_folded(self.counts, path)
+
+
+def profile_call(func, mode, path, interval=0.001):
+    """
+    Ejecuta func() perfilada y guarda el perfil en path
+
+    Args:
+        func: función sin argumentos (p. ej. solver.solve)
+        mode: 'cprofile' o 'sample'
+        path: archivo de salida ('.pstats' o '.folded')
+        interval: segundos entre muestras en modo 'sample'
+
+    Returns:
+        lo que retorne func()
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"Modo de perfil desconocido: {mode}")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func)
+        finally:
+            profiler.dump_stats(path)
+    sampler = StackSampler(interval)
+    sampler.start()
+    try:
+        return func()
+    finally:
+        sampler.stop()
+        sampler.write(path)
+
+
+def profile_path(directory, name, mode):
+    """
+    Archivo de perfil para un tablero; el nombre se limpia para el sistema
+    de archivos ('corpus.hashi#12' -> 'corpus.hashi_12')
+    """
+    safe = re.sub(r'[^\w.-]+', '_', name).strip('_') or "perfil"
+    return os.path.join(directory, safe + PROFILE_EXTENSIONS[mode])
+
+
+def read_folded(path):
+    """Lee un archivo de pilas colapsadas como Counter pila -> muestras"""
+    counts = Counter()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            stack, _, count = line.rstrip('\n').rpartition(' ')
+            if stack:
+                counts[stack] += int(count)
+    return counts
+
+
+def write_folded(counts, path):
+    """Escribe un Counter de pilas colapsadas"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, count in sorted(counts.items()):
+            f.write(f"{stack} {count}\n")
+
+
+def _short_path(filename):
+    """Ruta corta de un archivo en las etiquetas de cProfile"""
+    return os.path.basename(filename) if filename not in ('~', '') else filename
+
+
+def hot_table(paths, limit=20):
+    """
+    Tabla de funciones más costosas combinando varios perfiles del mismo tipo
+
+    Args:
+        paths: archivos '.pstats' o '.folded'
+        limit: filas a retornar
+
+    Returns:
+        list de dicts ordenados por tiempo propio. Con '.pstats':
+        {'function', 'calls', 'tottime', 'cumtime', 'percent'} (segundos);
+        con '.folded': {'function', 'self', 'total', 'percent'} (muestras)
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+    if paths[0].endswith(PROFILE_EXTENSIONS['cprofile']):
+        stats = pstats.Stats(*paths)
+        total = sum(tt for _, _, tt, _, _ in stats.stats.values()) or 1
+        rows = []
+        for (filename, lineno, funcname), (_, calls, tottime, cumtime, _) in stats.stats.items():
+            label = (f"{_short_path(filename)}:{lineno}({funcname})"
+                     if filename != '~' else funcname)
+            rows.append({
+                'function': label,
+                'calls': calls,
+                'tottime': round(tottime, 6),
+                'cumtime': round(cumtime, 6),
+                'percent': round(100 * tottime / total, 1),
+            })
+        rows.sort(key=lambda row: row['tottime'], reverse=True)
+        return rows[:limit]
+
+    counts = Counter()
+    for path in paths:
+        counts.update(read_folded(path))
+    samples = sum(counts.values()) or 1
+    self_counts = Counter()
+    total_counts = Counter()
+    for stack, count in counts.items():
+        frames = stack.split(';')
+        self_counts[frames[-1]] += count
+        for frame in set(frames):
+            total_counts[frame] += count
+    rows = [{
+        'function': function,
+        'self': self_counts[function],
+        'total': total,
+        'percent': round(100 * self_counts[function] / samples, 1),
+    } for function, total in total_counts.items()]
+    rows.sort(key=lambda row: (row['self'], row['total']), reverse=True)
+    return rows[:limit]
+
+
+def format_hot_table(rows):
+    """Formatea la tabla de hot_table() como texto"""
+    if not rows:
+        return "Sin datos de perfil"
+    if 'calls' in rows[0]:
+        lines = [f"{'% propio':>8} {'propio (s)':>11} {'acum. (s)':>11} {'llamadas':>10}  función",
+                 f"{'-'*8} {'-'*11} {'-'*11} {'-'*10}  {'-'*40}"]
+        lines.extend(f"{row['percent']:>8.1f} {row['tottime']:>11.4f} {row['cumtime']:>11.4f} "
+                     f"{row['calls']:>10}  {row['function']}" for row in rows)
+    else:
+        lines = [f"{'% propio':>8} {'propias':>9} {'totales':>9}  función",
+                 f"{'-'*8} {'-'*9} {'-'*9}  {'-'*40}"]
+        lines.extend(f"{row['percent']:>8.1f} {row['self']:>9} {row['total']:>9}  {row['function']}"
+                     for row in rows)
+    return "\n".join(lines)
+
+
+def write_aggregate(paths, out_path):
+    """
+    Combina varios perfiles del mismo tipo en un solo archivo
+
+    Returns:
+        str - ruta escrita
+    """
+    paths = list(paths)
+    if out_path.endswith(PROFILE_EXTENSIONS['cprofile']):
+        pstats.Stats(*paths).dump_stats(out_path)
+    else:
+        counts = Counter()
+        for path in paths:
+            counts.update(read_folded(path))
+        write_folded(counts, out_path)
+    return out_path
+
+
+def summarize_directory(directory, mode, limit=20, out=None):
+    """
+    Agrega los perfiles de un directorio, escribe el archivo agregado e
+    imprime la tabla de funciones más costosas
+
+    Returns:
+        list - filas de hot_table() (vacía si no se perfiló ninguna
+        ejecución y el directorio no llegó a crearse)
+    """
+    out = out if out is not None else sys.stderr
+    if not os.path.isdir(directory):
+        return []
+    extension = PROFILE_EXTENSIONS[mode]
+    aggregate = AGGREGATE_NAME + extension
+    paths = sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                   if name.endswith(extension) and name != aggregate)
+    if not paths:
+        return []
+    aggregate_path = write_aggregate(paths, os.path.join(directory, aggregate))
+    rows = hot_table(paths, limit)
+    print(f"Perfil agregado de {len(paths)} ejecuciones: {aggregate_path}", file=out)
+    print(format_hot_table(rows), file=out)
+    return rows
+
+
+def main(argv=None):
+    """Imprime la tabla de funciones más costosas de uno o más perfiles"""
+    ap = argparse.ArgumentParser(description="Tabla de funciones más costosas de perfiles .pstats o .folded")
+    ap.add_argument('profiles', nargs='+', help="Archivos .pstats o .folded (del mismo tipo)")
+    ap.add_argument('--limit', type=int, default=20, help="Filas de la tabla")
+    ap.add_argument('-o', '--output', help="Guardar también el perfil combinado")
+    args = ap.parse_args(argv)
+
+    if args.output:
+        write_aggregate(args.profiles, args.output)
+    print(format_hot_table(hot_table(args.profiles, args.limit)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
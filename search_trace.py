@@ -0,0 +1,254 @@
+"""
+Traza del árbol de búsqueda de los solucionadores
+Un SearchTracer asignado a solver.tracer recibe cada nodo expandido, cada
+decisión, cada ronda de propagación, cada contradicción y cada retroceso, con
+su profundidad y el tiempo en microsegundos desde el inicio, y los escribe
+como una línea JSON por evento. Con solver.tracer = None (por defecto) los
+solucionadores solo comparan el atributo con None.
+
+Eventos:
+    start          solver, islands
+    propagate      depth, rules {regla: puentes colocados en la ronda}
+    branch         depth, moves (movimientos candidatos del nodo)
+    decision       depth, a, b, n (puentes agregados entre a y b)
+    backtrack      depth, a, b, n, nodes (nodos del subárbol descartado)
+    contradiction  depth, reason
+    solution       depth
+    abort          depth, reason (límite de iteraciones)
+    end            success, iterations, timed_out
+
+Uso:
+    solver.tracer = SearchTracer('traza.jsonl')
+    solver.solve()
+    solver.tracer.close()
+
+    py search_trace.py traza.jsonl
+    py search_trace.py --solve puzzles/test_hard.txt --solver backtracking -o traza.jsonl
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+
+
+class SearchTracer:
+    """Escribe los eventos de la búsqueda en un flujo JSONL"""
+
+    def __init__(self, target):
+        """
+        Args:
+            target: ruta del archivo de salida o flujo de texto abierto
+        """
+        if isinstance(target, str):
+            self.stream = open(target, 'w', encoding='utf-8')
+            self._owns_stream = True
+        else:
+            self.stream = target
+            self._owns_stream = False
+        self._start = time.perf_counter_ns()
+
+    def emit(self, event, depth=None, **data):
+        """
+        Registra un evento
+
+        Args:
+            event: tipo de evento ('decision', 'backtrack', ...)
+            depth: profundidad del nodo en el árbol de búsqueda
+            **data: campos del evento (las posiciones se escriben como listas)
+        """
+        record = {'ev': event, 't': (time.perf_counter_ns() - self._start) // 1000}
+        if depth is not None:
+            record['depth'] = depth
+        record.update(data)
+        self.stream.write(json.dumps(record, separators=(',', ':')) + "\n")
+
+    def close(self):
+        """Cierra el archivo si el tracer lo abrió"""
+        if self._owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_trace(source):
+    """
+    Lee los eventos de una traza
+
+    Args:
+        source: ruta del archivo o iterable de líneas
+
+    Yields:
+        dict por evento
+    """
+    if isinstance(source, str):
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from read_trace(f)
+        return
+    for line in source:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def summarize(source, top=5):
+    """
+    Resume una traza (puede contener varias resoluciones)
+
+    Args:
+        source: ruta del archivo o iterable de líneas
+        top: número de subárboles descartados más grandes a reportar
+
+    Returns:
+        dict con:
+            runs, solved, nodes, max_depth, duration_ms
+            depths: {profundidad: {'nodes', 'branching', 'decisions',
+                     'backtracks', 'contradictions'}}; branching es el
+                     promedio de movimientos candidatos por nodo
+            wasted_nodes: nodos fuera del camino a la solución
+            largest_wasted: subárboles descartados más grandes
+                            [{'depth', 'a', 'b', 'n', 'nodes'}]
+            rules: {regla: {'rounds', 'bridges'}}
+            contradictions: {motivo: cantidad}
+    """
+    depths = {}
+    rules = {}
+    contradictions = Counter()
+    wasted = []
+    runs = solved = nodes = max_depth = 0
+    duration_us = 0
+    solution_depth = None
+
+    def level(depth):
+        if depth not in depths:
+            depths[depth] = {'nodes': 0, 'moves': 0, 'decisions': 0, 'backtracks': 0, 'contradictions': 0}
+        return depths[depth]
+
+    wasted_nodes = 0
+    for event in read_trace(source):
+        kind = event['ev']
+        depth = event.get('depth')
+        if depth is not None:
+            max_depth = max(max_depth, depth)
+        if kind == 'start':
+            runs += 1
+            solution_depth = None
+        elif kind == 'branch':
+            entry = level(depth)
+            entry['nodes'] += 1
+            entry['moves'] += event['moves']
+        elif kind == 'decision':
+            level(depth)['decisions'] += 1
+        elif kind == 'backtrack':
+            level(depth)['backtracks'] += 1
+            wasted.append({key: event[key] for key in ('depth', 'a', 'b', 'n', 'nodes')})
+        elif kind == 'contradiction':
+            level(depth)['contradictions'] += 1
+            contradictions[event['reason']] += 1
+        elif kind == 'propagate':
+            for rule, bridges in event['rules'].items():
+                stats = rules.setdefault(rule, {'rounds': 0, 'bridges': 0})
+                stats['rounds'] += 1
+                stats['bridges'] += bridges
+        elif kind == 'solution':
+            solution_depth = depth
+        elif kind == 'end':
+            nodes += event['iterations']
+            duration_us += event['t']
+            if event['success']:
+                solved += 1
+                # El camino a la solución tiene un nodo por nivel
+                path = (solution_depth if solution_depth is not None else 0) + 1
+                wasted_nodes += max(0, event['iterations'] - path)
+            else:
+                wasted_nodes += event['iterations']
+
+    for entry in depths.values():
+        moves = entry.pop('moves')
+        entry['branching'] = round(moves / entry['nodes'], 3) if entry['nodes'] else None
+
+    wasted.sort(key=lambda w: w['nodes'], reverse=True)
+    return {
+        'runs': runs,
+        'solved': solved,
+        'nodes': nodes,
+        'max_depth': max_depth,
+        'duration_ms': round(duration_us / 1000, 3),
+        'depths': dict(sorted(depths.items())),
+        'wasted_nodes': wasted_nodes,
+        'largest_wasted': wasted[:top],
+        'rules': rules,
+        'contradictions': dict(contradictions),
+    }
+
+
+def format_summary(summary):
+    """Formatea el resumen de summarize() como texto"""
+    lines = [
+        f"Resoluciones: {summary['runs']} ({summary['solved']} resueltas)",
+        f"Nodos: {summary['nodes']}  profundidad máxima: {summary['max_depth']}  "
+        f"tiempo: {summary['duration_ms']:.1f} ms",
+        f"Nodos desperdiciados (fuera del camino a la solución): {summary['wasted_nodes']}",
+        "",
+        f"{'Prof.':>5} {'nodos':>8} {'ramif.':>7} {'decis.':>8} {'retroc.':>8} {'contrad.':>8}",
+    ]
+    for depth, entry in summary['depths'].items():
+        branching = '-' if entry['branching'] is None else f"{entry['branching']:.2f}"
+        lines.append(f"{depth:>5} {entry['nodes']:>8} {branching:>7} {entry['decisions']:>8} "
+                     f"{entry['backtracks']:>8} {entry['contradictions']:>8}")
+    if summary['rules']:
+        lines.append("")
+        lines.append("Reglas de propagación:")
+        for rule, stats in summary['rules'].items():
+            lines.append(f"  {rule:<14} {stats['rounds']:>6} rondas {stats['bridges']:>8} puentes")
+    if summary['contradictions']:
+        lines.append("")
+        lines.append("Contradicciones:")
+        for reason, count in summary['contradictions'].items():
+            lines.append(f"  {reason:<16} {count:>8}")
+    if summary['largest_wasted']:
+        lines.append("")
+        lines.append("Subárboles descartados más grandes:")
+        for w in summary['largest_wasted']:
+            lines.append(f"  profundidad {w['depth']:>3}: {w['n']} puente(s) {tuple(w['a'])}-{tuple(w['b'])} "
+                         f"-> {w['nodes']} nodos")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Resume una traza o genera una resolviendo un tablero"""
+    ap = argparse.ArgumentParser(description="Traza del árbol de búsqueda de los solucionadores")
+    ap.add_argument('trace', nargs='?', help="Traza JSONL a resumir")
+    ap.add_argument('--solve', metavar='TABLERO', help="Resolver un tablero registrando la traza")
+    ap.add_argument('--solver', default='csp', help="Solucionador con --solve (csp o backtracking)")
+    ap.add_argument('-o', '--output', default='traza.jsonl', help="Archivo de la traza con --solve")
+    ap.add_argument('--top', type=int, default=5, help="Subárboles descartados a mostrar")
+    args = ap.parse_args(argv)
+
+    if args.solve:
+        from parser import parse_board
+        from game_logic import HashiGame
+        from portfolio import SOLVERS
+
+        rows, cols, board = parse_board(args.solve)
+        solver = SOLVERS[args.solver](HashiGame(rows, cols, board))
+        with SearchTracer(args.output) as tracer:
+            solver.tracer = tracer
+            solver.solve()
+        args.trace = args.output
+    if not args.trace:
+        ap.error("indique una traza o --solve TABLERO")
+
+    print(format_summary(summarize(args.trace, args.top)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
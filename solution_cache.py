@@ -0,0 +1,222 @@
+"""
+Caché persistente de soluciones para Hashiwokakero
+Guarda las soluciones en un archivo SQLite local indexadas por un hash del
+contenido del tablero (dimensiones, posiciones y valores de las islas) y
+expulsa las entradas usadas hace más tiempo cuando se supera el tamaño máximo.
+CachedSolver usa la forma canónica del tablero, de modo que las rotaciones y
+reflexiones de un mismo tablero comparten entrada.
+"""
+
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+
+from symmetry import canonical_key, hash_cells, inverse_transform, transform_bridges, transformed_dims
+
+# Tamaño máximo por defecto de las soluciones guardadas (bytes)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Entradas que se mantienen también en memoria
+MEMORY_ENTRIES = 1024
+
+# Aciertos cuyo last_used se acumula antes de escribirlo en SQLite
+TOUCH_BATCH = 64
+
+
+def board_key(game):
+    """
+    Calcula la clave exacta de un tablero (sin considerar simetrías)
+
+    Args:
+        game: instancia de HashiGame
+
+    Returns:
+        str - hash hexadecimal de dimensiones + islas ordenadas por posición
+    """
+    cells = [(pos, game.islands[pos]['num']) for pos in sorted(game.islands)]
+    return hash_cells(game.rows, game.cols, cells)
+
+
+def _encode_bridges(bridges):
+    """Serializa una lista de puentes [(a, b), ...] como JSON compacto"""
+    return json.dumps([[a[0], a[1], b[0], b[1]] for a, b in bridges], separators=(",", ":"))
+
+
+def _decode_bridges(text):
+    """Convierte el JSON guardado en una lista de puentes [(a, b), ...]"""
+    return [((r1, c1), (r2, c2)) for r1, c1, r2, c2 in json.loads(text)]
+
+
+class SolutionCache:
+    """Caché de soluciones en SQLite con expulsión LRU por tamaño"""
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Abre (o crea) la caché
+
+        Args:
+            path: archivo SQLite
+            max_bytes: tamaño máximo de las soluciones guardadas
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory = OrderedDict()
+        # Aciertos pendientes de registrar en last_used (clave -> instante)
+        self._touched = {}
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS solutions ("
+            " key TEXT PRIMARY KEY,"
+            " bridges TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS solutions_lru ON solutions (last_used)")
+        self.conn.commit()
+        # Total llevado por este proceso; otros procesos que compartan el
+        # archivo no lo actualizan, así que se recalcula antes de expulsar
+        self._total = self.size_bytes()
+
+    def get(self, key):
+        """
+        Busca la solución de un tablero
+
+        Returns:
+            list de puentes [(a, b), ...] o None si no está en caché
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self._touch(key)
+            self.hits += 1
+            return list(self.memory[key])
+
+        row = self.conn.execute("SELECT bridges FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self._touch(key)
+        bridges = _decode_bridges(row[0])
+        self._remember(key, bridges)
+        self.hits += 1
+        return list(bridges)
+
+    def put(self, key, bridges):
+        """Guarda la solución de un tablero y expulsa entradas antiguas si hace falta"""
+        text = _encode_bridges(bridges)
+        self._touched.pop(key, None)
+        with self.conn:
+            row = self.conn.execute("SELECT size FROM solutions WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO solutions (key, bridges, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, text, len(text), time.time())
+            )
+            self._total += len(text) - (row[0] if row else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+        self._remember(key, list(bridges))
+
+    def _touch(self, key):
+        """Registra un acierto; los last_used se escriben en SQLite por lotes"""
+        self._touched[key] = time.time()
+        if len(self._touched) >= TOUCH_BATCH:
+            with self.conn:
+                self._flush_touched()
+
+    def _flush_touched(self):
+        """Escribe en SQLite los last_used de los aciertos pendientes"""
+        if self._touched:
+            self.conn.executemany("UPDATE solutions SET last_used = ? WHERE key = ?",
+                                  [(used, key) for key, used in self._touched.items()])
+            self._touched.clear()
+
+    def _remember(self, key, bridges):
+        """Mantiene la entrada en la capa en memoria"""
+        self.memory[key] = bridges
+        self.memory.move_to_end(key)
+        while len(self.memory) > MEMORY_ENTRIES:
+            self.memory.popitem(last=False)
+
+    def _evict(self):
+        """Elimina las entradas menos usadas hasta respetar max_bytes"""
+        self._flush_touched()
+        total = self._total = self.size_bytes()
+        if total <= self.max_bytes:
+            return
+        rows = self.conn.execute("SELECT key, size FROM solutions ORDER BY last_used").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM solutions WHERE key = ?", (key,))
+            self.memory.pop(key, None)
+            total -= size
+        self._total = total
+
+    def size_bytes(self):
+        """Retorna el tamaño total de las soluciones guardadas"""
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM solutions").fetchone()[0]
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self):
+        """Escribe los aciertos pendientes y cierra la conexión con el archivo"""
+        with self.conn:
+            self._flush_touched()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CachedSolver:
+    """Envuelve cualquier solucionador consultando primero la caché"""
+
+    def __init__(self, game, solver_class, cache):
+        """
+        Args:
+            game: instancia de HashiGame
+            solver_class: clase del solucionador (HashiSolver, BacktrackingSolver, ...)
+            cache: instancia de SolutionCache
+        """
+        self.game = game
+        self.solver_class = solver_class
+        self.cache = cache
+        self.iterations = 0
+        self.cached = False
+
+    def solve(self):
+        """
+        Retorna la solución en caché o resuelve y la guarda
+
+        Returns:
+            tuple (bool, list) - (éxito, lista de puentes [(a, b), ...])
+        """
+        # La solución en caché es del tablero vacío: solo aplica si no hay puentes
+        if self.game.get_total_bridges() > 0:
+            solver = self.solver_class(self.game)
+            result = solver.solve()
+            self.iterations = solver.iterations
+            return result
+
+        # La caché guarda las soluciones en coordenadas de la forma canónica
+        rows, cols = self.game.rows, self.game.cols
+        key, t = canonical_key(self.game)
+        bridges = self.cache.get(key)
+        if bridges is not None:
+            self.cached = True
+            crows, ccols = transformed_dims(t, rows, cols)
+            return True, transform_bridges(inverse_transform(t), bridges, crows, ccols)
+
+        solver = self.solver_class(self.game)
+        success, bridges = solver.solve()
+        self.iterations = solver.iterations
+        if success:
+            self.cache.put(key, transform_bridges(t, bridges, rows, cols))
+        return success, bridges
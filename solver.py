@@ -4,6 +4,7 @@ Utiliza constraint propagation + backtracking con heurísticas avanzadas
 """
 
 import copy
+import time
 from collections import deque
 
 class HashiSolver:
@@ -20,6 +21,12 @@ class HashiSolver:
         self.solution_bridges = []
         self.iterations = 0
         self.max_iterations = 10000  # Límite de seguridad
+        self.time_limit = None  # Segundos; None = sin límite
+        self.timed_out = False
+        self._deadline = None
+        self.tracer = None  # SearchTracer opcional (search_trace.py)
+        self.cancelled = False
+        self.depth = 0  # Profundidad del nodo actual (progreso para la interfaz)
     
     def solve(self):
         """
@@ -31,9 +38,21 @@ class HashiSolver:
         # Guardar estado inicial
         initial_state = self._save_state()
         
+        self.timed_out = False
+        self._deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        if self.cancelled:
+            self._deadline = 0.0
+        
+        tracer = self.tracer
+        if tracer is not None:
+            tracer.emit('start', solver='csp', islands=len(self.game.islands))
+        
         # Intentar resolver
         success = self._solve_recursive()
         
+        if tracer is not None:
+            tracer.emit('end', success=success, iterations=self.iterations, timed_out=self.timed_out)
+        
         if success:
             # Recopilar todos los puentes de la solución
             bridges = []
@@ -53,15 +72,29 @@ class HashiSolver:
             self._restore_state(initial_state)
             return False, []
     
-    def _solve_recursive(self):
-        """Algoritmo recursivo mejorado con constraint propagation"""
+    def _solve_recursive(self, depth=0):
+        """
+        Algoritmo recursivo mejorado con constraint propagation
+        
+        Args:
+            depth: profundidad del nodo (para la traza y el progreso)
+        """
         self.iterations += 1
+        self.depth = depth
+        tracer = self.tracer
         if self.iterations > self.max_iterations:
+            if tracer is not None:
+                tracer.emit('abort', depth, reason='max_iterations')
             return False
         
         # Aplicar constraint propagation agresivamente
         changed = True
         while changed:
+            if self._out_of_time():
+                return False
+            if tracer is not None:
+                changed = self._traced_propagation_round(tracer, depth)
+                continue
             changed = False
             
             # Regla 1: Movimientos forzados
@@ -78,23 +111,34 @@ class HashiSolver:
         
         # Verificar victoria
         if self.game.check_victory():
+            if tracer is not None:
+                tracer.emit('solution', depth)
             return True
         
         # Verificar contradicciones
         if self._has_contradiction():
+            if tracer is not None:
+                tracer.emit('contradiction', depth, reason='capacity')
             return False
         
         # Verificar si todas las islas están satisfechas pero no conectadas
         if self._all_satisfied_but_disconnected():
+            if tracer is not None:
+                tracer.emit('contradiction', depth, reason='disconnected')
             return False
         
         # Seleccionar siguiente decisión (isla con menos grados de libertad)
         decision = self._select_best_decision()
         
         if decision is None:
+            if tracer is not None:
+                tracer.emit('contradiction', depth, reason='no_decision')
             return False
         
         island, neighbor, num_bridges = decision
+        if tracer is not None:
+            # Se prueba una sola decisión por nodo
+            tracer.emit('branch', depth, moves=1)
         
         # Probar agregar estos puentes
         state = self._save_state()
@@ -106,17 +150,63 @@ class HashiSolver:
                 success = False
                 break
         
-        if success and self._solve_recursive():
+        if tracer is not None:
+            if success:
+                tracer.emit('decision', depth, a=island, b=neighbor, n=num_bridges)
+            else:
+                tracer.emit('contradiction', depth, reason='invalid_decision')
+            before = self.iterations
+        
+        if success and self._solve_recursive(depth + 1):
             return True
         
         # Restaurar y probar NO agregar estos puentes
         self._restore_state(state)
+        if tracer is not None and success:
+            tracer.emit('backtrack', depth, a=island, b=neighbor, n=num_bridges,
+                        nodes=self.iterations - before)
         
         # Marcar que no se puede crear este puente (simular con ocupación temporal)
         # Para simplificar, solo intentamos otras opciones
         
         return False
     
+    def _traced_propagation_round(self, tracer, depth):
+        """
+        Una ronda de propagación que registra cuántos puentes colocó cada regla
+        
+        Returns:
+            bool - True si alguna regla cambió el estado
+        """
+        changed = False
+        fired = {}
+        for name, rule in (('forced', self._apply_forced_moves),
+                           ('saturation', self._apply_saturation_rule),
+                           ('reachability', self._apply_reachability_analysis)):
+            before = len(self.game.history)
+            if rule():
+                changed = True
+                fired[name] = len(self.game.history) - before
+        if fired:
+            tracer.emit('propagate', depth, rules=fired)
+        return changed
+    
+    def cancel(self):
+        """
+        Pide detener la búsqueda; se puede llamar desde otro hilo y solve()
+        retorna (False, []) en cuanto la búsqueda revisa el tiempo
+        """
+        self.cancelled = True
+        self._deadline = 0.0
+    
+    def _out_of_time(self):
+        """Indica si se superó time_limit (y lo registra en timed_out) o se canceló la búsqueda"""
+        if self.cancelled:
+            return True
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            self.timed_out = True
+        return self.timed_out
+    
     def _apply_forced_moves(self):
         """Aplica movimientos que son forzados por las restricciones"""
         made_change = False
@@ -306,44 +396,14 @@ class HashiSolver:
             list - lista de posiciones de islas vecinas
         """
         neighbors = []
-        r, c = island_pos
-        
-        # Buscar en 4 direcciones
-        # Derecha
-        for nc in range(c + 1, self.game.cols):
-            if self.game.board[r][nc] > 0:
-                neighbor = (r, nc)
-                can_connect, _ = self.game.can_create_bridge(island_pos, neighbor)
-                if can_connect:
-                    neighbors.append(neighbor)
-                break
         
-        # Izquierda
-        for nc in range(c - 1, -1, -1):
-            if self.game.board[r][nc] > 0:
-                neighbor = (r, nc)
+        # Buscar en 4 direcciones: derecha, izquierda, abajo, arriba
+        for dr, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+            neighbor = self.game.nearest_island(island_pos, dr, dc)
+            if neighbor is not None:
                 can_connect, _ = self.game.can_create_bridge(island_pos, neighbor)
                 if can_connect:
                     neighbors.append(neighbor)
-                break
-        
-        # Abajo
-        for nr in range(r + 1, self.game.rows):
-            if self.game.board[nr][c] > 0:
-                neighbor = (nr, c)
-                can_connect, _ = self.game.can_create_bridge(island_pos, neighbor)
-                if can_connect:
-                    neighbors.append(neighbor)
-                break
-        
-        # Arriba
-        for nr in range(r - 1, -1, -1):
-            if self.game.board[nr][c] > 0:
-                neighbor = (nr, c)
-                can_connect, _ = self.game.can_create_bridge(island_pos, neighbor)
-                if can_connect:
-                    neighbors.append(neighbor)
-                break
         
         return neighbors
     
@@ -394,7 +454,7 @@ class HashiSolver:
         """
         state = {
             'islands': {},
-            'occupancy': {},
+            'occupancy': self.game.occupancy.copy(),
             'history_len': len(self.game.history)
         }
         
@@ -404,9 +464,6 @@ class HashiSolver:
                 'bridges': dict(info['bridges'])
             }
         
-        for pos, occ in self.game.occupancy.items():
-            state['occupancy'][pos] = dict(occ)
-        
         return state
     
     def _restore_state(self, state):
@@ -424,9 +481,7 @@ class HashiSolver:
                 info['bridges'] = {}
         
         # Restaurar ocupación
-        self.game.occupancy = {}
-        for pos, occ in state['occupancy'].items():
-            self.game.occupancy[pos] = dict(occ)
+        self.game.occupancy = state['occupancy'].copy()
         
         # Restaurar historial
         while len(self.game.history) > state['history_len']:
@@ -0,0 +1,70 @@
+"""
+Tablero disperso para Hashiwokakero
+Guarda solo las islas (posición -> valor) pero se puede indexar como la matriz
+densa que usa el resto del código: board[r][c] retorna 0 en las celdas vacías.
+"""
+
+
+class SparseBoard:
+    """Tablero que guarda solo las islas en un dict {(r, c): valor}"""
+
+    def __init__(self, rows, cols, islands=None):
+        """
+        Args:
+            rows: número de filas
+            cols: número de columnas
+            islands: dict {(r, c): valor} (opcional)
+        """
+        self.rows = rows
+        self.cols = cols
+        self.islands = dict(islands) if islands else {}
+
+    @classmethod
+    def from_dense(cls, board):
+        """Crea un tablero disperso a partir de una lista de listas"""
+        rows = len(board)
+        cols = len(board[0]) if rows else 0
+        islands = {(r, c): v for r, row in enumerate(board) for c, v in enumerate(row) if v > 0}
+        return cls(rows, cols, islands)
+
+    def to_dense(self):
+        """Retorna el tablero como lista de listas de enteros"""
+        board = [[0] * self.cols for _ in range(self.rows)]
+        for (r, c), v in self.islands.items():
+            board[r][c] = v
+        return board
+
+    def __getitem__(self, r):
+        if not 0 <= r < self.rows:
+            raise IndexError("Fila fuera del tablero")
+        return _SparseRow(self.islands, r, self.cols)
+
+    def __len__(self):
+        return self.rows
+
+    def __iter__(self):
+        for r in range(self.rows):
+            yield _SparseRow(self.islands, r, self.cols)
+
+
+class _SparseRow:
+    """Vista de una fila de SparseBoard"""
+
+    __slots__ = ('islands', 'r', 'cols')
+
+    def __init__(self, islands, r, cols):
+        self.islands = islands
+        self.r = r
+        self.cols = cols
+
+    def __getitem__(self, c):
+        if isinstance(c, slice):
+            return [self.islands.get((self.r, cc), 0) for cc in range(*c.indices(self.cols))]
+        return self.islands.get((self.r, c), 0)
+
+    def __len__(self):
+        return self.cols
+
+    def __iter__(self):
+        for c in range(self.cols):
+            yield self.islands.get((self.r, c), 0)
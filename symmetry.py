@@ -0,0 +1,237 @@
+"""
+Simetrías de tableros Hashiwokakero
+Implementa las 8 transformaciones del grupo diedral (rotaciones y reflexiones),
+la forma canónica de un tablero (la menor de sus 8 transformaciones) y el mapeo
+de listas de puentes entre un tablero y su forma canónica.
+
+Uso como script para encontrar tableros equivalentes en un corpus:
+    py symmetry.py puzzles/
+"""
+
+import hashlib
+import os
+import sys
+
+from parser import parse_board
+from game_logic import HashiGame
+
+# Número de transformaciones del grupo diedral del cuadrado
+NUM_TRANSFORMS = 8
+
+# Nombres de las transformaciones (índice -> descripción)
+TRANSFORM_NAMES = [
+    "identidad",
+    "rotación 90° horaria",
+    "rotación 180°",
+    "rotación 270° horaria",
+    "reflejo horizontal",
+    "transposición",
+    "reflejo vertical",
+    "antitransposición",
+]
+
+# Inversa de cada transformación: las rotaciones de 90° y 270° son mutuamente
+# inversas, el resto son involuciones
+_INVERSE = [0, 3, 2, 1, 4, 5, 6, 7]
+
+
+def transform_point(t, pos, rows, cols):
+    """
+    Aplica una transformación a una celda
+
+    Args:
+        t: índice de la transformación (0-7)
+        pos: tupla (r, c)
+        rows, cols: dimensiones del tablero original
+
+    Returns:
+        tupla (r, c) en el tablero transformado
+    """
+    r, c = pos
+    if t == 0:
+        return r, c
+    if t == 1:
+        return c, rows - 1 - r
+    if t == 2:
+        return rows - 1 - r, cols - 1 - c
+    if t == 3:
+        return cols - 1 - c, r
+    if t == 4:
+        return r, cols - 1 - c
+    if t == 5:
+        return c, r
+    if t == 6:
+        return rows - 1 - r, c
+    return cols - 1 - c, rows - 1 - r
+
+
+def transformed_dims(t, rows, cols):
+    """Retorna (filas, columnas) del tablero tras aplicar la transformación"""
+    if t in (1, 3, 5, 7):
+        return cols, rows
+    return rows, cols
+
+
+def inverse_transform(t):
+    """Retorna el índice de la transformación inversa"""
+    return _INVERSE[t]
+
+
+def islands_of(game):
+    """Retorna el dict {(r, c): valor} de las islas de un HashiGame"""
+    return {pos: info['num'] for pos, info in game.islands.items()}
+
+
+def transform_islands(t, islands, rows, cols):
+    """
+    Transforma un dict de islas {(r, c): valor}
+
+    Returns:
+        dict con las posiciones transformadas
+    """
+    return {transform_point(t, pos, rows, cols): v for pos, v in islands.items()}
+
+
+def automorphisms(islands, rows, cols):
+    """
+    Transformaciones (distintas de la identidad) que dejan el tablero igual
+
+    Args:
+        islands: dict {(r, c): valor}
+        rows, cols: dimensiones
+
+    Returns:
+        list de índices de transformación
+    """
+    result = []
+    for t in range(1, NUM_TRANSFORMS):
+        if transformed_dims(t, rows, cols) != (rows, cols):
+            continue
+        if transform_islands(t, islands, rows, cols) == islands:
+            result.append(t)
+    return result
+
+
+def _signature(t, islands, rows, cols):
+    """Representación comparable de un tablero transformado"""
+    trows, tcols = transformed_dims(t, rows, cols)
+    cells = sorted((transform_point(t, pos, rows, cols), v) for pos, v in islands.items())
+    return (trows, tcols), tuple(cells)
+
+
+def canonical_form(islands, rows, cols):
+    """
+    Calcula la forma canónica: la menor de las 8 transformaciones del tablero
+
+    Args:
+        islands: dict {(r, c): valor}
+        rows, cols: dimensiones
+
+    Returns:
+        tupla (t, filas, columnas, celdas) donde t lleva el tablero original a la
+        forma canónica y celdas es una tupla ordenada de ((r, c), valor)
+    """
+    best_t = 0
+    best = _signature(0, islands, rows, cols)
+    for t in range(1, NUM_TRANSFORMS):
+        sig = _signature(t, islands, rows, cols)
+        if sig < best:
+            best_t, best = t, sig
+    (crows, ccols), cells = best
+    return best_t, crows, ccols, cells
+
+
+def hash_cells(rows, cols, cells):
+    """
+    Hash de un tablero dado como dimensiones + celdas ordenadas
+
+    Args:
+        cells: iterable ordenado de ((r, c), valor)
+
+    Returns:
+        str - hash hexadecimal
+    """
+    parts = [f"{rows},{cols}"]
+    for (r, c), v in cells:
+        parts.append(f"{r},{c},{v}")
+    return hashlib.sha256(";".join(parts).encode("ascii")).hexdigest()
+
+
+def canonical_key(game):
+    """
+    Clave de caché invariante a rotaciones y reflexiones
+
+    Returns:
+        tupla (clave, t) - hash hexadecimal de la forma canónica y la
+        transformación que lleva el tablero a ella
+    """
+    t, crows, ccols, cells = canonical_form(islands_of(game), game.rows, game.cols)
+    return hash_cells(crows, ccols, cells), t
+
+
+def canonical_board(rows, cols, board):
+    """
+    Forma canónica de un tablero denso
+
+    Returns:
+        tupla (t, filas, columnas, tablero) con el tablero canónico como lista de listas
+    """
+    islands = {(r, c): board[r][c] for r in range(rows) for c in range(cols) if board[r][c] > 0}
+    t, crows, ccols, cells = canonical_form(islands, rows, cols)
+    cboard = [[0] * ccols for _ in range(crows)]
+    for (r, c), v in cells:
+        cboard[r][c] = v
+    return t, crows, ccols, cboard
+
+
+def transform_bridges(t, bridges, rows, cols):
+    """
+    Transforma una lista de puentes [(a, b), ...]
+
+    Args:
+        t: transformación a aplicar
+        bridges: puentes en coordenadas del tablero de dimensiones rows x cols
+        rows, cols: dimensiones del tablero de origen
+
+    Returns:
+        list de puentes transformados, cada uno con sus extremos ordenados
+    """
+    result = []
+    for a, b in bridges:
+        ta = transform_point(t, a, rows, cols)
+        tb = transform_point(t, b, rows, cols)
+        result.append((ta, tb) if ta < tb else (tb, ta))
+    return result
+
+
+def group_equivalent(paths):
+    """
+    Agrupa archivos de tablero equivalentes por rotación o reflexión
+
+    Returns:
+        list de listas de rutas con la misma forma canónica (solo grupos de 2 o más)
+    """
+    groups = {}
+    for path in paths:
+        rows, cols, board = parse_board(path)
+        key, _ = canonical_key(HashiGame(rows, cols, board))
+        groups.setdefault(key, []).append(path)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def main(argv=None):
+    """Función principal: lista los tableros equivalentes de un directorio"""
+    argv = sys.argv[1:] if argv is None else argv
+    directory = argv[0] if argv else os.path.join(os.path.dirname(__file__), "puzzles")
+    paths = sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                   if name.endswith(".txt"))
+    groups = group_equivalent(paths)
+    if not groups:
+        print("No hay tableros equivalentes")
+    for group in groups:
+        print(" = ".join(group))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
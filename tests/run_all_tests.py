@@ -16,6 +16,25 @@ import test_solver
 import test_backtracking_solver
 import test_parser
 import test_integration
+import test_portfolio
+import test_parallel_solver
+import test_batch_solve
+import test_solution_cache
+import test_symmetry
+import test_sparse_board
+import test_occupancy
+import test_container
+import test_binary_corpus
+import test_game_id
+import test_verifier
+import test_game_stats
+import test_profiling
+import test_search_trace
+import test_compare
+import test_isolation
+import test_harness
+import test_scaling
+import test_results_store
 
 
 def run_all_tests():
@@ -30,21 +49,78 @@ def run_all_tests():
     print("EJECUTANDO TODAS LAS PRUEBAS UNITARIAS - HASHIWOKAKERO")
     print("=" * 70)
     
-    print("\n[1/5] Cargando pruebas de game_logic...")
+    print("\n[1/24] Cargando pruebas de game_logic...")
     suite.addTests(loader.loadTestsFromModule(test_game_logic))
     
-    print("[2/5] Cargando pruebas de solver (CSP)...")
+    print("[2/24] Cargando pruebas de solver (CSP)...")
     suite.addTests(loader.loadTestsFromModule(test_solver))
     
-    print("[3/5] Cargando pruebas de backtracking_solver...")
+    print("[3/24] Cargando pruebas de backtracking_solver...")
     suite.addTests(loader.loadTestsFromModule(test_backtracking_solver))
     
-    print("[4/5] Cargando pruebas de parser...")
+    print("[4/24] Cargando pruebas de parser...")
     suite.addTests(loader.loadTestsFromModule(test_parser))
     
-    print("[5/5] Cargando pruebas de integración...")
+    print("[5/24] Cargando pruebas de integración...")
     suite.addTests(loader.loadTestsFromModule(test_integration))
     
+    print("[6/24] Cargando pruebas de portfolio...")
+    suite.addTests(loader.loadTestsFromModule(test_portfolio))
+    
+    print("[7/24] Cargando pruebas de parallel_solver...")
+    suite.addTests(loader.loadTestsFromModule(test_parallel_solver))
+    
+    print("[8/24] Cargando pruebas de batch_solve...")
+    suite.addTests(loader.loadTestsFromModule(test_batch_solve))
+    
+    print("[9/24] Cargando pruebas de solution_cache...")
+    suite.addTests(loader.loadTestsFromModule(test_solution_cache))
+    
+    print("[10/24] Cargando pruebas de symmetry...")
+    suite.addTests(loader.loadTestsFromModule(test_symmetry))
+    
+    print("[11/24] Cargando pruebas de sparse_board...")
+    suite.addTests(loader.loadTestsFromModule(test_sparse_board))
+    
+    print("[12/24] Cargando pruebas de Ocupación por intervalos...")
+    suite.addTests(loader.loadTestsFromModule(test_occupancy))
+    
+    print("[13/24] Cargando pruebas de Contenedor de tableros...")
+    suite.addTests(loader.loadTestsFromModule(test_container))
+    
+    print("[14/24] Cargando pruebas de Corpus binario...")
+    suite.addTests(loader.loadTestsFromModule(test_binary_corpus))
+    
+    print("[15/24] Cargando pruebas de IDs de juego...")
+    suite.addTests(loader.loadTestsFromModule(test_game_id))
+    
+    print("[16/24] Cargando pruebas de Verificador de soluciones...")
+    suite.addTests(loader.loadTestsFromModule(test_verifier))
+    
+    print("[17/24] Cargando pruebas de Estadísticas incrementales...")
+    suite.addTests(loader.loadTestsFromModule(test_game_stats))
+    
+    print("[18/24] Cargando pruebas de Perfilado...")
+    suite.addTests(loader.loadTestsFromModule(test_profiling))
+    
+    print("[19/24] Cargando pruebas de traza de búsqueda...")
+    suite.addTests(loader.loadTestsFromModule(test_search_trace))
+    
+    print("[20/24] Cargando pruebas de compuerta de regresiones...")
+    suite.addTests(loader.loadTestsFromModule(test_compare))
+    
+    print("[21/24] Cargando pruebas de ejecución aislada...")
+    suite.addTests(loader.loadTestsFromModule(test_isolation))
+    
+    print("[22/24] Cargando pruebas de estadísticas del harness...")
+    suite.addTests(loader.loadTestsFromModule(test_harness))
+    
+    print("[23/24] Cargando pruebas de generador de tableros...")
+    suite.addTests(loader.loadTestsFromModule(test_scaling))
+    
+    print("[24/24] Cargando pruebas de almacén de resultados...")
+    suite.addTests(loader.loadTestsFromModule(test_results_store))
+    
     print("\n" + "=" * 70)
     print("EJECUTANDO PRUEBAS...")
     print("=" * 70 + "\n")
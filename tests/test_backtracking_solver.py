@@ -48,8 +48,7 @@ class TestBacktrackingSolverBasic(unittest.TestCase):
         
         if success:
             # Aplicar la solución
-            for a, b in bridges:
-                game.create_bridge(a, b)
+            game.apply_bridges(bridges)
             
             # Verificar que es una victoria
             self.assertTrue(game.check_victory())
@@ -226,10 +225,111 @@ class TestBacktrackingEdgeCases(unittest.TestCase):
         success, bridges = solver.solve()
         
         if success:
-            for a, b in bridges:
-                game.create_bridge(a, b)
+            game.apply_bridges(bridges)
             self.assertTrue(game.check_victory())
 
 
+
+class TestBacktrackingSymmetry(unittest.TestCase):
+    """Pruebas de la poda por simetría y el conteo de soluciones"""
+    
+    def setUp(self):
+        """Tablero con las 8 simetrías del cuadrado"""
+        self.board = [
+            [2, 0, 2, 0, 2, 0, 2],
+            [0, 0, 0, 0, 0, 0, 0],
+            [2, 0, 0, 0, 0, 0, 2],
+            [0, 0, 0, 0, 0, 0, 0],
+            [2, 0, 0, 0, 0, 0, 2],
+            [0, 0, 0, 0, 0, 0, 0],
+            [2, 0, 2, 0, 2, 0, 2]
+        ]
+    
+    def count(self, board, symmetry_breaking):
+        rows, cols = len(board), len(board[0])
+        solver = BacktrackingSolver(HashiGame(rows, cols, board))
+        solver.symmetry_breaking = symmetry_breaking
+        return solver.count_solutions(), solver.iterations
+    
+    def test_initial_stabilizer_symmetric_board(self):
+        """Se detectan las 7 simetrías no triviales del tablero"""
+        solver = BacktrackingSolver(HashiGame(7, 7, self.board))
+        self.assertEqual(len(solver._initial_stabilizer()), 7)
+    
+    def test_count_matches_without_symmetry_breaking(self):
+        """La poda por simetría no cambia el número de soluciones"""
+        count_plain, iter_plain = self.count(self.board, False)
+        count_sym, iter_sym = self.count(self.board, True)
+        self.assertEqual(count_plain, count_sym)
+        self.assertGreater(count_sym, 0)
+        self.assertLess(iter_sym, iter_plain)
+    
+    def test_count_asymmetric_board(self):
+        """Conteo exacto en un tablero con una única solución"""
+        board = [
+            [1, 0, 1],
+        ]
+        self.assertEqual(self.count(board, True)[0], 1)
+        self.assertEqual(self.count([[8, 0, 1]], True)[0], 0)
+    
+    def test_symmetric_solution_valid(self):
+        """La solución encontrada con poda sigue siendo válida"""
+        game = HashiGame(7, 7, self.board)
+        success, bridges = BacktrackingSolver(game).solve()
+        self.assertTrue(success)
+        game.apply_bridges(bridges)
+        self.assertTrue(game.check_victory())
+
+
+class CancellingSolver(BacktrackingSolver):
+    """Solver que pide su propia cancelación al expandir el tercer nodo"""
+    
+    def _expand(self):
+        if self.iterations >= 3:
+            self.cancel()
+        return super()._expand()
+
+
+class TestBacktrackingCancel(unittest.TestCase):
+    """Pruebas de la cancelación de una búsqueda en curso"""
+    
+    def setUp(self):
+        self.board = [
+            [2, 0, 2, 0, 2, 0, 2],
+            [0, 0, 0, 0, 0, 0, 0],
+            [2, 0, 0, 0, 0, 0, 2],
+            [0, 0, 0, 0, 0, 0, 0],
+            [2, 0, 0, 0, 0, 0, 2],
+            [0, 0, 0, 0, 0, 0, 0],
+            [2, 0, 2, 0, 2, 0, 2]
+        ]
+    
+    def test_cancel_before_solve(self):
+        """Cancelar antes de empezar retorna sin explorar el árbol"""
+        game = HashiGame(7, 7, self.board)
+        solver = BacktrackingSolver(game)
+        solver.cancel()
+        self.assertEqual(solver.solve(), (False, []))
+        self.assertTrue(solver.cancelled)
+        self.assertFalse(solver.timed_out)
+        self.assertEqual(solver.iterations, 1)
+    
+    def test_cancel_during_search(self):
+        """La búsqueda se detiene y el juego queda como estaba"""
+        game = HashiGame(7, 7, self.board)
+        solver = CancellingSolver(game)
+        solver.symmetry_breaking = False
+        self.assertEqual(solver.solve(), (False, []))
+        self.assertTrue(solver.cancelled)
+        self.assertGreater(solver.depth, 0)
+        self.assertEqual(game.get_total_bridges(), 0)
+        
+        # Los nodos pendientes retornan de inmediato: se exploran muchos menos
+        full = BacktrackingSolver(HashiGame(7, 7, self.board))
+        full.symmetry_breaking = False
+        self.assertTrue(full.solve()[0])
+        self.assertLess(solver.iterations * 5, full.iterations)
+
+
 if __name__ == '__main__':
     unittest.main()
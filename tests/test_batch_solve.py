@@ -0,0 +1,171 @@
+"""
+Pruebas unitarias para batch_solve.py (resolución por lotes)
+Ejecutar con: py -m unittest test_batch_solve.py
+"""
+
+import unittest
+import io
+import json
+import os
+import shutil
+import tempfile
+from batch_solve import collect_inputs, load_completed, solve_file, run_batch
+from container import write_container
+from binary_corpus import write_corpus
+
+
+class TestBatchSolve(unittest.TestCase):
+    """Pruebas de la herramienta por lotes"""
+
+    def setUp(self):
+        """Crear un directorio con tableros temporales"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.good = os.path.join(self.temp_dir, 'good.txt')
+        with open(self.good, 'w') as f:
+            f.write('3,3\n202\n000\n202\n')
+        self.bad = os.path.join(self.temp_dir, 'bad.txt')
+        with open(self.bad, 'w') as f:
+            f.write('no es un tablero\n')
+
+    def tearDown(self):
+        """Limpiar archivos temporales"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_collect_directory_and_stdin(self):
+        """Se expanden directorios y rutas leídas de stdin sin duplicados"""
+        stdin = io.StringIO(self.good + '\n\n')
+        paths = collect_inputs([self.temp_dir, '-'], stdin=stdin)
+        self.assertEqual(paths, [self.bad, self.good])
+
+    def test_collect_glob(self):
+        """Se expanden patrones glob"""
+        paths = collect_inputs([os.path.join(self.temp_dir, 'go*.txt')])
+        self.assertEqual(paths, [self.good])
+
+    def test_solve_file_record(self):
+        """El registro contiene estado, puentes y estadísticas"""
+        record = solve_file((self.good, 'csp'))
+        self.assertEqual(record['status'], 'solved')
+        self.assertEqual(len(record['bridges']), 4)
+        self.assertEqual(record['stats']['islands'], 4)
+        self.assertIn('time_ms', record)
+
+    def test_failures_are_recorded(self):
+        """Un tablero inválido produce un registro de error y no detiene el lote"""
+        out = io.StringIO()
+        counts = run_batch([self.bad, self.good], 'backtracking', workers=1, out=out)
+        self.assertEqual(counts['error'], 1)
+        self.assertEqual(counts['solved'], 1)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r['status'] for r in records], ['error', 'solved'])
+
+    def test_resume_skips_completed(self):
+        """Al reanudar se omiten los tableros terminados pero no los errores"""
+        results = os.path.join(self.temp_dir, 'results.jsonl')
+        with open(results, 'w') as f:
+            run_batch([self.bad, self.good], 'csp', workers=1, out=f)
+            f.write('{"puzzle": "truncado')
+        completed = load_completed(results)
+        self.assertEqual(completed, {self.good})
+
+    def test_resume_retries_unsolved(self):
+        """Un tablero sin solución se vuelve a intentar al reanudar"""
+        results = os.path.join(self.temp_dir, 'results.jsonl')
+        with open(results, 'w') as f:
+            f.write(json.dumps({'puzzle': 'limite.txt', 'status': 'unsolved'}) + '\n')
+            f.write(json.dumps({'puzzle': 'ok.txt', 'status': 'solved'}) + '\n')
+        self.assertEqual(load_completed(results), {'ok.txt'})
+
+    def test_container_puzzles(self):
+        """Los tableros de un contenedor se resuelven y se omiten al reanudar"""
+        container = os.path.join(self.temp_dir, 'lote.hashi')
+        write_container(container, [('a', 3, 3, [[2, 0, 2], [0, 0, 0], [2, 0, 2]]),
+                                    ('b', 1, 3, [[1, 0, 1]])])
+        self.assertIn(container, collect_inputs([self.temp_dir]))
+        out = io.StringIO()
+        counts = run_batch([container], 'csp', workers=2, out=out, skip={container + '#a'})
+        self.assertEqual(counts['solved'], 1)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r['puzzle'] for r in records], [container + '#b'])
+
+    def test_container_malformed_header(self):
+        """Una cabecera inválida produce un registro de error y el lote sigue"""
+        container = os.path.join(self.temp_dir, 'lote.hashi')
+        with open(container, 'w', encoding='utf-8') as f:
+            f.write('#puzzle a\n1,3\n101\n#puzzle b =x\n1,3\n101\n#puzzle c\n1,3\n101\n')
+        out = io.StringIO()
+        counts = run_batch([container], 'csp', out=out)
+        self.assertEqual(counts, {'solved': 2, 'unsolved': 0, 'error': 1})
+        records = {json.loads(line)['puzzle']: json.loads(line) for line in out.getvalue().splitlines()}
+        self.assertEqual(records[container + '#1']['status'], 'error')
+        self.assertIn('ValueError', records[container + '#1']['error'])
+        self.assertEqual(records[container + '#c']['status'], 'solved')
+
+    def test_binary_corpus_puzzles(self):
+        """Los tableros de un corpus binario se resuelven con nombre 'ruta#n'"""
+        corpus = os.path.join(self.temp_dir, 'lote.hbc')
+        write_corpus(corpus, [(3, 3, [[2, 0, 2], [0, 0, 0], [2, 0, 2]]), (1, 3, [[1, 0, 1]])])
+        out = io.StringIO()
+        counts = run_batch([corpus], 'csp', workers=2, out=out)
+        self.assertEqual(counts['solved'], 2)
+        names = sorted(json.loads(line)['puzzle'] for line in out.getvalue().splitlines())
+        self.assertEqual(names, [corpus + '#0', corpus + '#1'])
+
+    def test_game_ids_from_stdin(self):
+        """Los IDs de juego leídos de stdin se resuelven sin archivos intermedios"""
+        out = io.StringIO()
+        stdin = io.StringIO('3x3:2a2c2a2\nmalo 3x3:2a2\n')
+        counts = run_batch(['-'], 'csp', workers=1, out=out, stdin=stdin)
+        self.assertEqual(counts, {'solved': 1, 'unsolved': 0, 'error': 1})
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r['puzzle'] for r in records], ['stdin#0', 'stdin#malo'])
+
+    def test_invalid_game_id_line(self):
+        """Una línea de IDs inválida produce su registro de error y el lote sigue"""
+        out = io.StringIO()
+        stdin = io.StringIO('3x3:2a2c2a2\na b c\n3x3:2a2c2a2\n')
+        counts = run_batch(['-'], 'csp', workers=1, out=out, stdin=stdin)
+        self.assertEqual(counts, {'solved': 2, 'unsolved': 0, 'error': 1})
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r['puzzle'] for r in records], ['stdin#0', 'stdin#1', 'stdin#2'])
+        self.assertIn('ValueError', records[1]['error'])
+
+    def test_streaming_input(self):
+        """Los tableros se resuelven mientras se lee la entrada, no al final"""
+        for workers in (1, 2):
+            out = io.StringIO()
+            written = []
+
+            def stdin():
+                for _ in range(20):
+                    written.append(out.getvalue().count('\n'))
+                    yield '3x3:2a2c2a2\n'
+
+            counts = run_batch(['-'], 'csp', workers=workers, out=out, stdin=stdin())
+            self.assertEqual(counts['solved'], 20)
+            self.assertEqual(written[0], 0)
+            self.assertGreater(written[-1], 0)
+
+    def test_profile_without_solves(self):
+        """Perfilar un lote sin resoluciones no falla al resumir los perfiles"""
+        profile_dir = os.path.join(self.temp_dir, 'perfiles')
+        out = io.StringIO()
+        missing = os.path.join(self.temp_dir, 'no_existe.txt')
+        counts = run_batch([missing], 'csp', workers=1, out=out, profile=('cprofile', profile_dir))
+        self.assertEqual(counts['error'], 1)
+        self.assertFalse(os.path.exists(profile_dir))
+        counts = run_batch([self.good], 'csp', workers=1, out=out, skip={self.good},
+                           profile=('cprofile', profile_dir))
+        self.assertEqual(sum(counts.values()), 0)
+
+    def test_parallel_workers(self):
+        """Varios procesos producen un registro por tablero"""
+        out = io.StringIO()
+        counts = run_batch([self.good, self.bad], 'csp', workers=2, out=out)
+        self.assertEqual(sum(counts.values()), 2)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Pruebas unitarias para binary_corpus.py (corpus binario con mmap)
+Ejecutar con: py -m unittest test_binary_corpus.py
+"""
+
+import unittest
+import os
+import pickle
+import shutil
+import tempfile
+from binary_corpus import (BinaryCorpus, write_corpus, candidate_edges,
+                           encode_solution, decode_solution)
+from sparse_board import SparseBoard
+from game_logic import HashiGame
+from solver import HashiSolver
+
+
+class TestBinaryCorpus(unittest.TestCase):
+    """Pruebas de codificación y lectura del corpus binario"""
+
+    def setUp(self):
+        """Crear un corpus con un tablero resuelto y otro sin solución guardada"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'corpus.hbc')
+        self.dense = [
+            [2, 0, 3, 0, 1],
+            [0, 0, 0, 0, 0],
+            [1, 0, 3, 0, 2]
+        ]
+        success, self.bridges = HashiSolver(HashiGame(3, 5, self.dense)).solve()
+        self.assertTrue(success)
+        self.sparse = SparseBoard(300, 200, {(0, 0): 1, (0, 199): 1, (299, 5): 2})
+        write_corpus(self.path, [(3, 5, self.dense, self.bridges), (300, 200, self.sparse)])
+        self.corpus = BinaryCorpus(self.path)
+
+    def tearDown(self):
+        """Cerrar el corpus y limpiar archivos temporales"""
+        self.corpus.close()
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_boards_roundtrip(self):
+        """Los tableros se decodifican con sus dimensiones e islas"""
+        self.assertEqual(len(self.corpus), 2)
+        rows, cols, board = self.corpus.board(0)
+        self.assertEqual((rows, cols), (3, 5))
+        self.assertEqual(board.to_dense(), self.dense)
+        rows, cols, board = self.corpus.board(1)
+        self.assertEqual((rows, cols), (300, 200))
+        self.assertEqual(board.islands, self.sparse.islands)
+        with self.assertRaises(IndexError):
+            self.corpus.board(2)
+
+    def test_solution_roundtrip(self):
+        """La solución guardada es la misma (como multiconjunto de puentes)"""
+        self.assertTrue(self.corpus.has_solution(0))
+        self.assertFalse(self.corpus.has_solution(1))
+        self.assertIsNone(self.corpus.solution(1))
+        expected = sorted((min(a, b), max(a, b)) for a, b in self.bridges)
+        self.assertEqual(sorted(self.corpus.solution(0)), expected)
+
+    def test_views_are_zero_copy(self):
+        """board_view y solution_view son memoryviews del mapa"""
+        view = self.corpus.board_view(0)
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(len(view), 6 * 5)
+        self.assertEqual(len(self.corpus.solution_view(0)), 2)
+
+    def test_candidate_edges_and_bits(self):
+        """Cada arista candidata ocupa 2 bits"""
+        positions = [(0, 0), (0, 2), (0, 4), (2, 0), (2, 2), (2, 4)]
+        edges = candidate_edges(positions)
+        self.assertEqual(len(edges), 7)
+        self.assertIn(((0, 0), (2, 0)), edges)
+        data = encode_solution(positions, [((0, 2), (0, 0)), ((0, 0), (0, 2)), ((2, 4), (0, 4))])
+        self.assertEqual(len(data), 2)
+        self.assertEqual(sorted(decode_solution(positions, data)),
+                         [((0, 0), (0, 2)), ((0, 0), (0, 2)), ((0, 4), (2, 4))])
+        with self.assertRaises(ValueError):
+            encode_solution(positions, [((0, 0), (0, 4))])
+
+    def test_pickle_reopens_same_file(self):
+        """Al serializar solo viaja la ruta (para pasarlo a otros procesos)"""
+        clone = pickle.loads(pickle.dumps(self.corpus))
+        try:
+            self.assertEqual(clone.board(0)[2].islands, self.corpus.board(0)[2].islands)
+        finally:
+            clone.close()
+
+    def test_invalid_file(self):
+        """Un archivo que no es un corpus produce ValueError"""
+        bad = os.path.join(self.temp_dir, 'malo.hbc')
+        with open(bad, 'wb') as f:
+            f.write(b'no es un corpus binario')
+        with self.assertRaises(ValueError):
+            BinaryCorpus(bad)
+
+
+if __name__ == '__main__':
+    unittest.main()
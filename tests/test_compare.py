@@ -0,0 +1,99 @@
+"""
+Pruebas unitarias para benchmark/compare.py (compuerta de regresiones)
+Ejecutar con: py -m unittest test_compare.py
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmark'))
+
+from compare import compare_reports
+
+
+def report(*cases):
+    """Construye un reporte con casos (nombre, {solver: resultado})"""
+    return {"test_cases": [dict({"name": name}, **results) for name, results in cases]}
+
+
+def run(median, iterations=100, success=True):
+    """Resultado de harness.py con varias mediciones"""
+    return {"success": success, "time_ms": median, "iterations": iterations,
+            "stats": {"median": median, "mean": median, "stdev": 0.0}}
+
+
+def by_metric(findings):
+    """Indexa los hallazgos por (tablero, solver, métrica)"""
+    return {(f["board"], f["solver"], f["metric"]): f for f in findings}
+
+
+class TestCompareReports(unittest.TestCase):
+    """Pruebas de compare_reports"""
+
+    def test_threshold_and_min_ms(self):
+        """Un tiempo es regresión solo si supera el umbral relativo y min_ms"""
+        baseline = report(("a", {"csp": run(0.4)}), ("b", {"csp": run(10.0)}), ("c", {"csp": run(10.0)}))
+        current = report(("a", {"csp": run(0.6)}), ("b", {"csp": run(15.0)}), ("c", {"csp": run(10.5)}))
+        findings = by_metric(compare_reports(baseline, current, threshold=0.10, min_ms=0.5))
+        # +50% pero solo 0.2 ms: ruido de un tablero pequeño
+        self.assertEqual(findings[("a", "csp", "time_ms")]["change"], 0.5)
+        self.assertFalse(findings[("a", "csp", "time_ms")]["regression"])
+        self.assertTrue(findings[("b", "csp", "time_ms")]["regression"])
+        # +5%, dentro del umbral
+        self.assertFalse(findings[("c", "csp", "time_ms")]["regression"])
+        findings = by_metric(compare_reports(baseline, current, threshold=0.10, min_ms=0.1))
+        self.assertTrue(findings[("a", "csp", "time_ms")]["regression"])
+
+    def test_nodes(self):
+        """Cualquier aumento de nodos es regresión salvo con node_threshold"""
+        baseline = report(("a", {"backtracking": run(5.0, 100)}), ("b", {"backtracking": run(5.0, 100)}))
+        current = report(("a", {"backtracking": run(5.0, 110)}), ("b", {"backtracking": run(5.0, 90)}))
+        findings = by_metric(compare_reports(baseline, current))
+        self.assertTrue(findings[("a", "backtracking", "iterations")]["regression"])
+        self.assertEqual(findings[("a", "backtracking", "iterations")]["change"], 0.1)
+        self.assertFalse(findings[("b", "backtracking", "iterations")]["regression"])
+        findings = by_metric(compare_reports(baseline, current, node_threshold=0.2))
+        self.assertFalse(findings[("a", "backtracking", "iterations")]["regression"])
+
+    def test_success_to_failure(self):
+        """Dejar de resolver un tablero es regresión; empezar a resolverlo no"""
+        baseline = report(("a", {"csp": run(5.0)}), ("b", {"csp": run(5.0, success=False)}))
+        current = report(("a", {"csp": run(5.0, success=False)}), ("b", {"csp": run(5.0)}))
+        findings = by_metric(compare_reports(baseline, current))
+        lost = findings[("a", "csp", "success")]
+        self.assertEqual((lost["baseline"], lost["current"], lost["regression"]), (True, False, True))
+        self.assertNotIn(("b", "csp", "success"), findings)
+        self.assertFalse(any(f["regression"] for f in findings.values() if f["board"] == "b"))
+
+    def test_isolated_failure_without_time(self):
+        """Una ejecución aislada que no terminó no compara tiempo ni nodos"""
+        baseline = report(("a", {"csp": run(5.0)}))
+        current = report(("a", {"csp": {"success": False, "time_ms": None, "iterations": None,
+                                        "error": "tiempo agotado", "status": "timeout"}}))
+        findings = compare_reports(baseline, current)
+        self.assertEqual(len(findings), 1)
+        self.assertEqual(findings[0]["metric"], "timeout")
+        self.assertTrue(findings[0]["regression"])
+        # Y una base sin tiempo no produce comparación de tiempo
+        self.assertEqual([f["metric"] for f in compare_reports(current, baseline)], [])
+
+    def test_single_run_reports(self):
+        """Los reportes antiguos de una sola medición usan time_ms"""
+        baseline = report(("Simple 1", {"csp": {"success": True, "time_ms": 2.0, "iterations": 7}}))
+        current = report(("Simple 1", {"csp": run(4.0, 7)}), ("Nuevo", {"csp": run(1.0)}))
+        findings = by_metric(compare_reports(baseline, current))
+        time = findings[("Simple 1", "csp", "time_ms")]
+        self.assertEqual((time["baseline"], time["current"], time["regression"]), (2.0, 4.0, True))
+        self.assertFalse(findings[("Simple 1", "csp", "iterations")]["regression"])
+        self.assertNotIn(("Nuevo", "csp", "time_ms"), findings)
+
+    def test_error_cases_skipped(self):
+        """Los casos con error en cualquiera de los reportes no se comparan"""
+        baseline = report(("a", {"csp": run(5.0)}), ("b", {"error": "no existe"}))
+        current = report(("a", {"error": "no existe"}), ("b", {"csp": run(5.0)}))
+        self.assertEqual(compare_reports(baseline, current), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
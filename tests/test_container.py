@@ -0,0 +1,106 @@
+"""
+Pruebas unitarias para container.py (contenedor de varios tableros)
+Ejecutar con: py -m unittest test_container.py
+"""
+
+import unittest
+import os
+import shutil
+import tempfile
+from container import (write_container, iter_puzzles, iter_headers, read_puzzle,
+                       load_index, build_index, count_puzzles, parse_header, INDEX_EXTENSION)
+from sparse_board import SparseBoard
+
+
+class TestContainer(unittest.TestCase):
+    """Pruebas de lectura y escritura de contenedores"""
+
+    def setUp(self):
+        """Crear un contenedor temporal con tableros densos y dispersos"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'corpus.hashi')
+        self.sparse = SparseBoard(50, 40, {(0, 0): 1, (0, 39): 1})
+        self.puzzles = [
+            ('p1', 3, 3, [[2, 0, 2], [0, 0, 0], [2, 0, 2]], {'dificultad': 'facil'}),
+            ('p2', 1, 3, [[1, 0, 1]]),
+            ('p3', 50, 40, self.sparse),
+        ]
+        write_container(self.path, self.puzzles)
+
+    def tearDown(self):
+        """Limpiar archivos temporales"""
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_iter_puzzles_roundtrip(self):
+        """Los tableros se leen en orden y con el mismo contenido"""
+        read = list(iter_puzzles(self.path))
+        self.assertEqual([p[0] for p in read], ['p1', 'p2', 'p3'])
+        self.assertEqual(read[0][1:], (3, 3, [[2, 0, 2], [0, 0, 0], [2, 0, 2]]))
+        self.assertEqual(read[1][1:], (1, 3, [[1, 0, 1]]))
+        self.assertIsInstance(read[2][3], SparseBoard)
+        self.assertEqual(read[2][3].islands, self.sparse.islands)
+
+    def test_headers_and_metadata(self):
+        """Las cabeceras se recorren con sus metadatos"""
+        headers = list(iter_headers(self.path))
+        self.assertEqual(headers[0], (0, 'p1', {'dificultad': 'facil'}))
+        self.assertEqual(headers[2], (2, 'p3', {}))
+        self.assertEqual(parse_header('#puzzle x a=1 b=dos'), ('x', {'a': '1', 'b': 'dos'}))
+        with self.assertRaises(ValueError):
+            parse_header('#puzzle')
+
+    def test_read_nth_and_start(self):
+        """Se puede saltar al tablero N con el índice de offsets"""
+        self.assertTrue(os.path.exists(self.path + INDEX_EXTENSION))
+        self.assertEqual(count_puzzles(self.path), 3)
+        self.assertEqual(read_puzzle(self.path, 1), ('p2', 1, 3, [[1, 0, 1]]))
+        self.assertEqual([p[0] for p in iter_puzzles(self.path, start=2)], ['p3'])
+        with self.assertRaises(IndexError):
+            read_puzzle(self.path, 3)
+
+    def test_stale_index_rebuilt(self):
+        """Si el contenedor cambia, el índice se reconstruye"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('#puzzle p4\n1,2\n11\n')
+        self.assertEqual(len(load_index(self.path)), 4)
+        self.assertEqual(read_puzzle(self.path, 3), ('p4', 1, 2, [[1, 1]]))
+
+    def test_truncated_index_rebuilt(self):
+        """Un índice truncado no se acepta: se reconstruye completo"""
+        index_path = self.path + INDEX_EXTENSION
+        with open(index_path, 'r+b') as f:
+            f.truncate(os.path.getsize(index_path) - 8)
+        self.assertEqual(len(load_index(self.path)), 3)
+        with open(index_path, 'r+b') as f:
+            f.truncate(os.path.getsize(index_path) - 3)
+        self.assertEqual(list(load_index(self.path)), list(build_index(self.path)))
+        self.assertEqual(read_puzzle(self.path, 2)[0], 'p3')
+
+    def test_index_temp_files(self):
+        """Cada reconstrucción usa su propio temporal y no deja restos"""
+        for _ in range(3):
+            build_index(self.path)
+        self.assertEqual(sorted(os.listdir(self.temp_dir)),
+                         ['corpus.hashi', 'corpus.hashi' + INDEX_EXTENSION])
+
+    def test_malformed_header(self):
+        """Una cabecera inválida detiene el recorrido salvo con strict=False"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('#puzzle p4 sin_valor\n1,2\n11\n#puzzle p5\n1,2\n11\n')
+        with self.assertRaises(ValueError):
+            list(iter_headers(self.path))
+        headers = list(iter_headers(self.path, strict=False))
+        self.assertEqual(headers[3], (3, None, {}))
+        self.assertEqual(headers[4], (4, 'p5', {}))
+        with self.assertRaises(ValueError):
+            read_puzzle(self.path, 3)
+
+    def test_invalid_id(self):
+        """Los ids con espacios no se pueden escribir"""
+        with self.assertRaises(ValueError):
+            write_container(os.path.join(self.temp_dir, 'x.hashi'), [('a b', 1, 1, [[0]])])
+
+
+if __name__ == '__main__':
+    unittest.main()
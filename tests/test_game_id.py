@@ -0,0 +1,80 @@
+"""
+Pruebas unitarias para game_id.py (IDs de juego compactos)
+Ejecutar con: py -m unittest test_game_id.py
+"""
+
+import unittest
+import glob
+import io
+import os
+from game_id import parse_game_id, to_game_id, iter_game_ids, read_game_id_lines
+from parser import parse_board
+from sparse_board import SparseBoard
+
+
+class TestGameId(unittest.TestCase):
+    """Pruebas de conversión desde y hacia IDs de juego"""
+
+    def test_encode_simple(self):
+        """Las celdas vacías se agrupan en letras y las islas son dígitos"""
+        board = [
+            [2, 0, 3],
+            [0, 0, 0],
+            [1, 0, 2]
+        ]
+        self.assertEqual(to_game_id(3, 3, board), '3x3:2a3c1a2')
+
+    def test_decode_simple(self):
+        """El ancho va antes que el alto"""
+        rows, cols, board = parse_game_id('3x2:1c1a')
+        self.assertEqual((rows, cols), (2, 3))
+        self.assertEqual(board.to_dense(), [[1, 0, 0], [0, 1, 0]])
+
+    def test_long_runs(self):
+        """Los huecos de más de 26 celdas usan varias letras"""
+        board = SparseBoard(1, 60, {(0, 0): 1, (0, 59): 1})
+        game_id = to_game_id(1, 60, board)
+        self.assertEqual(game_id, '60x1:1zzf1')
+        self.assertEqual(parse_game_id(game_id)[2].islands, board.islands)
+
+    def test_roundtrip_puzzle_files(self):
+        """Todos los tableros de ejemplo sobreviven ida y vuelta"""
+        puzzles_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'puzzles')
+        for path in sorted(glob.glob(os.path.join(puzzles_dir, '*.txt'))):
+            rows, cols, board = parse_board(path)
+            r2, c2, decoded = parse_game_id(to_game_id(rows, cols, board))
+            self.assertEqual((r2, c2), (rows, cols))
+            self.assertEqual(decoded.to_dense(), [row[:cols] for row in board[:rows]])
+
+    def test_generator_params(self):
+        """Los parámetros extra del generador se ignoran, salvo m distinto de 2"""
+        self.assertEqual(parse_game_id('3x1i30e10m2d0:1a1')[2].islands, {(0, 0): 1, (0, 2): 1})
+        with self.assertRaises(ValueError):
+            parse_game_id('3x1m4:1a1')
+
+    def test_invalid(self):
+        """Descripciones con celdas de más o de menos, o caracteres inválidos"""
+        for bad in ('3x1:1b1', '3x1:1', '3x1:1A1', '3x1', 'axb:c'):
+            with self.assertRaises(ValueError):
+                parse_game_id(bad)
+
+    def test_stream(self):
+        """Se leen varios IDs de un flujo, con nombre opcional"""
+        stream = io.StringIO('# comentario\nuno 3x1:1a1\n\n2x1:11\n')
+        self.assertEqual(list(read_game_id_lines(io.StringIO('2x1:11\n'))), [('0', '2x1:11')])
+        puzzles = list(iter_game_ids(stream))
+        self.assertEqual([p[0] for p in puzzles], ['uno', '1'])
+        self.assertEqual(puzzles[1][3].islands, {(0, 0): 1, (0, 1): 1})
+
+    def test_stream_invalid_line(self):
+        """Una línea con más de dos campos es un error salvo con strict=False"""
+        with self.assertRaises(ValueError):
+            list(read_game_id_lines(io.StringIO('a b c\n')))
+        lines = list(read_game_id_lines(io.StringIO('a b c\n2x1:11\n'), strict=False))
+        self.assertEqual(lines, [('0', 'a b c'), ('1', '2x1:11')])
+        with self.assertRaises(ValueError):
+            parse_game_id(lines[0][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
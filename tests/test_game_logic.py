@@ -5,6 +5,7 @@ Ejecutar con: py -m unittest test_game_logic.py
 
 import unittest
 from game_logic import HashiGame
+from sparse_board import SparseBoard
 
 
 class TestHashiGameInitialization(unittest.TestCase):
@@ -276,6 +277,164 @@ class TestUndo(unittest.TestCase):
             self.assertEqual(self.game.occupancy[(0, 1)]['h'], 0)
 
 
+class TestApplyBridges(unittest.TestCase):
+    """Pruebas de apply_bridges (varios puentes de una vez)"""
+    
+    def setUp(self):
+        """Configuración antes de cada test"""
+        self.board = [
+            [2, 0, 3],
+            [0, 0, 0],
+            [1, 0, 2]
+        ]
+        self.game = HashiGame(3, 3, self.board)
+        self.solution = [((0, 0), (0, 2)), ((0, 0), (2, 0)), ((0, 2), (2, 2)), ((2, 2), (0, 2))]
+    
+    def test_apply_solution(self):
+        """Aplicar una solución completa deja el mismo estado que create_bridge"""
+        success, msg, infos = self.game.apply_bridges(self.solution)
+        self.assertTrue(success)
+        self.assertTrue(self.game.check_victory())
+        self.assertEqual(len(self.game.history), 4)
+        self.assertEqual(self.game.occupancy[(1, 2)]['v'], 2)
+        counts = {(info['a'], info['b']): info['count'] for info in infos}
+        self.assertEqual(counts[((0, 2), (2, 2))], 2)
+        
+        replay = HashiGame(3, 3, self.board)
+        for a, b in self.solution:
+            replay.create_bridge(a, b)
+        self.assertEqual(self.game.islands, replay.islands)
+    
+    def test_undo_after_apply(self):
+        """Se puede deshacer uno a uno lo aplicado"""
+        self.game.apply_bridges(self.solution)
+        for _ in self.solution:
+            self.assertTrue(self.game.undo_last_bridge()[0])
+        self.assertEqual(self.game.get_total_bridges(), 0)
+        self.assertNotIn((0, 1), self.game.occupancy)
+    
+    def test_invalid_set_leaves_state_unchanged(self):
+        """Si un puente no es válido no se aplica ninguno"""
+        self.game.create_bridge((0, 0), (2, 0))
+        invalid_sets = [
+            [((0, 0), (0, 2))] * 3,
+            [((0, 0), (2, 2))],
+            [((0, 2), (2, 2)), ((0, 0), (0, 1))],
+            [((2, 0), (2, 2))] * 2,
+        ]
+        for bridges in invalid_sets:
+            success, msg, infos = self.game.apply_bridges(bridges)
+            self.assertFalse(success, bridges)
+            self.assertIsNone(infos)
+            self.assertEqual(self.game.get_total_bridges(), 1)
+            self.assertEqual(len(self.game.history), 1)
+    
+    def test_crossing_rolls_back(self):
+        """Un cruce entre los puentes nuevos no deja ocupación"""
+        board = [
+            [0, 1, 0],
+            [1, 0, 1],
+            [0, 1, 0]
+        ]
+        game = HashiGame(3, 3, board)
+        success, msg, _ = game.apply_bridges([((0, 1), (2, 1)), ((1, 0), (1, 2))])
+        self.assertFalse(success)
+        self.assertEqual(len(game.occupancy), 0)
+    
+    def test_without_validation(self):
+        """validate=False aplica directamente"""
+        success, _, _ = self.game.apply_bridges(self.solution, validate=False)
+        self.assertTrue(success)
+        self.assertTrue(self.game.check_victory())
+
+
+class TestEvents(unittest.TestCase):
+    """Pruebas de los eventos de puentes"""
+    
+    def setUp(self):
+        """Configuración antes de cada test"""
+        self.board = [
+            [2, 0, 3],
+            [0, 0, 0],
+            [1, 0, 2]
+        ]
+        self.game = HashiGame(3, 3, self.board)
+        self.events = []
+        self.game.subscribe(lambda event, info: self.events.append((event, info['a'], info['b'], info['count'])))
+    
+    def test_add_and_remove_events(self):
+        """Crear, deshacer y eliminar emiten un evento con la cantidad resultante"""
+        self.game.create_bridge((0, 0), (0, 2))
+        self.game.create_bridge((0, 2), (0, 0))
+        self.game.undo_last_bridge()
+        self.game.delete_bridge((0, 0), (0, 2))
+        self.assertEqual(self.events, [
+            ('bridge_added', (0, 0), (0, 2), 1),
+            ('bridge_added', (0, 2), (0, 0), 2),
+            ('bridge_removed', (0, 2), (0, 0), 1),
+            ('bridge_removed', (0, 0), (0, 2), 0),
+        ])
+    
+    def test_apply_emits_one_event_per_bridge(self):
+        """apply_bridges emite un evento por puente"""
+        self.game.apply_bridges([((0, 2), (2, 2)), ((2, 2), (0, 2))])
+        self.assertEqual([e[3] for e in self.events], [1, 2])
+    
+    def test_failures_do_not_emit(self):
+        """Las operaciones fallidas no emiten eventos"""
+        self.game.create_bridge((0, 0), (2, 2))
+        self.game.undo_last_bridge()
+        self.game.apply_bridges([((0, 0), (0, 2))] * 3)
+        self.assertEqual(self.events, [])
+    
+    def test_unsubscribe(self):
+        """Un suscriptor eliminado no recibe eventos"""
+        received = []
+        callback = self.game.subscribe(lambda event, info: received.append(event))
+        self.game.create_bridge((0, 0), (0, 2))
+        self.game.unsubscribe(callback)
+        self.game.create_bridge((0, 0), (0, 2))
+        self.assertEqual(received, ['bridge_added'])
+        self.assertEqual(len(self.events), 2)
+    
+    def test_get_bridges(self):
+        """get_bridges lista cada puente una vez con los extremos ordenados"""
+        self.game.create_bridge((0, 2), (0, 0))
+        self.game.create_bridge((2, 2), (0, 2))
+        self.game.create_bridge((0, 2), (2, 2))
+        self.assertEqual(sorted(self.game.get_bridges()),
+                         [((0, 0), (0, 2)), ((0, 2), (2, 2)), ((0, 2), (2, 2))])
+
+
+class TestReset(unittest.TestCase):
+    """Pruebas de reset()"""
+    
+    def test_reset_clears_bridges(self):
+        """reset deja el juego como recién creado y emite un solo evento"""
+        board = [
+            [2, 0, 3],
+            [0, 0, 0],
+            [1, 0, 2]
+        ]
+        game = HashiGame(3, 3, board)
+        game.apply_bridges([((0, 0), (0, 2)), ((0, 0), (2, 0)), ((0, 2), (2, 2))])
+        events = []
+        game.subscribe(lambda event, info: events.append(event))
+        
+        game.reset()
+        self.assertEqual(events, ['reset'])
+        self.assertEqual(game.get_total_bridges(), 0)
+        self.assertEqual(game.history, [])
+        self.assertEqual(len(game.occupancy), 0)
+        self.assertEqual(len(game.islands), 4)
+        
+        # El juego sigue funcionando: la solución se puede aplicar de nuevo
+        ok, _, _ = game.apply_bridges([((0, 0), (0, 2)), ((0, 0), (2, 0)),
+                                       ((0, 2), (2, 2)), ((2, 2), (0, 2))])
+        self.assertTrue(ok)
+        self.assertTrue(game.check_victory())
+
+
 class TestVictory(unittest.TestCase):
     """Pruebas de victoria"""
     
@@ -355,5 +514,51 @@ class TestQueries(unittest.TestCase):
         self.assertIn((0, 0), islands)
 
 
+
+class TestLineOfSight(unittest.TestCase):
+    """Pruebas de los índices por fila/columna y del tablero disperso"""
+    
+    def setUp(self):
+        self.board = [
+            [2, 0, 3, 0, 2],
+            [0, 0, 0, 0, 0],
+            [3, 0, 4, 0, 3]
+        ]
+        self.game = HashiGame(3, 5, self.board)
+    
+    def test_nearest_island_in_each_direction(self):
+        """Encuentra la isla más cercana en cada dirección"""
+        self.assertEqual(self.game.nearest_island((0, 2), 0, 1), (0, 4))
+        self.assertEqual(self.game.nearest_island((0, 2), 0, -1), (0, 0))
+        self.assertEqual(self.game.nearest_island((0, 2), 1, 0), (2, 2))
+        self.assertIsNone(self.game.nearest_island((0, 2), -1, 0))
+        self.assertIsNone(self.game.nearest_island((0, 4), 0, 1))
+    
+    def test_has_island_between(self):
+        """Detecta islas intermedias en filas y columnas"""
+        self.assertTrue(self.game.has_island_between((0, 0), (0, 4)))
+        self.assertFalse(self.game.has_island_between((0, 0), (0, 2)))
+        self.assertFalse(self.game.has_island_between((2, 4), (0, 4)))
+    
+    def test_sparse_board_same_game(self):
+        """Un SparseBoard produce las mismas islas y validaciones"""
+        game = HashiGame(3, 5, SparseBoard.from_dense(self.board))
+        self.assertEqual(game.islands, self.game.islands)
+        self.assertEqual(game.row_islands, self.game.row_islands)
+        self.assertEqual(game.col_islands, self.game.col_islands)
+        ok, msg = game.can_create_bridge((0, 0), (0, 4))
+        self.assertFalse(ok)
+        self.assertEqual(msg, "Hay isla en el camino")
+    
+    def test_large_sparse_board(self):
+        """Tablero grande y disperso: islas lejanas conectadas"""
+        board = SparseBoard(2000, 2000, {(0, 0): 1, (0, 1999): 2, (1999, 1999): 1})
+        game = HashiGame(2000, 2000, board)
+        self.assertEqual(game.nearest_island((0, 0), 0, 1), (0, 1999))
+        self.assertTrue(game.create_bridge((0, 0), (0, 1999))[0])
+        self.assertTrue(game.create_bridge((0, 1999), (1999, 1999))[0])
+        self.assertTrue(game.check_victory())
+
+
 if __name__ == '__main__':
     unittest.main()
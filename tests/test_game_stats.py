@@ -0,0 +1,91 @@
+"""
+Pruebas unitarias para game_stats.py (estadísticas incrementales)
+Ejecutar con: py -m unittest test_game_stats.py
+"""
+
+import unittest
+import random
+from game_logic import HashiGame
+from game_stats import GameStats
+from solver import HashiSolver
+
+
+class TestGameStats(unittest.TestCase):
+    """Pruebas de los contadores incrementales"""
+
+    def setUp(self):
+        self.board = [
+            [2, 0, 3, 0, 1],
+            [0, 0, 0, 0, 0],
+            [1, 0, 3, 0, 2]
+        ]
+        self.game = HashiGame(3, 5, self.board)
+        self.stats = GameStats(self.game)
+
+    def assert_consistent(self):
+        """Los contadores coinciden con recorrer el estado completo"""
+        self.assertEqual(self.stats.total_bridges, self.game.get_total_bridges())
+        for pos in self.game.get_all_islands():
+            self.assertEqual(self.stats.used[pos], self.game.get_island_info(pos)['used'])
+        complete = sum(1 for pos in self.game.get_all_islands()
+                       if self.game.get_island_info(pos)['used'] == self.game.get_island_info(pos)['num'])
+        self.assertEqual(self.stats.complete_islands, complete)
+
+    def test_random_operations(self):
+        """Tras cualquier secuencia de operaciones los contadores son correctos"""
+        rng = random.Random(7)
+        islands = self.game.get_all_islands()
+        for _ in range(300):
+            op = rng.random()
+            if op < 0.5:
+                a = rng.choice(islands)
+                dr, dc = rng.choice([(0, 1), (1, 0), (0, -1), (-1, 0)])
+                b = self.game.nearest_island(a, dr, dc)
+                if b:
+                    self.game.create_bridge(a, b)
+            elif op < 0.75:
+                self.game.undo_last_bridge()
+            else:
+                bridges = self.game.get_bridges()
+                if bridges:
+                    self.game.delete_bridge(*rng.choice(bridges))
+            self.assert_consistent()
+
+    def test_victory(self):
+        """is_victory coincide con check_victory"""
+        self.assertFalse(self.stats.is_victory())
+        success, bridges = HashiSolver(HashiGame(3, 5, self.board)).solve()
+        self.assertTrue(success)
+        self.game.apply_bridges(bridges)
+        self.assert_consistent()
+        self.assertTrue(self.stats.is_complete())
+        self.assertTrue(self.stats.is_victory())
+        self.game.undo_last_bridge()
+        self.assertFalse(self.stats.is_victory())
+
+    def test_reset(self):
+        """Los contadores vuelven a cero con reset()"""
+        success, bridges = HashiSolver(HashiGame(3, 5, self.board)).solve()
+        self.assertTrue(success)
+        self.game.apply_bridges(bridges)
+        self.assertTrue(self.stats.is_victory())
+        self.game.reset()
+        self.assertEqual(self.stats.total_bridges, 0)
+        self.assertEqual(self.stats.complete_islands, 0)
+        self.assertFalse(self.stats.is_complete())
+        self.game.create_bridge((0, 0), (0, 2))
+        self.assert_consistent()
+
+    def test_existing_state_and_close(self):
+        """Lee el estado inicial y deja de contar al cerrarse"""
+        self.game.create_bridge((0, 0), (0, 2))
+        stats = GameStats(self.game)
+        self.assertEqual(stats.total_bridges, 1)
+        stats.close()
+        self.game.create_bridge((0, 0), (2, 0))
+        self.assertEqual(stats.total_bridges, 1)
+        self.assertEqual(self.stats.total_bridges, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
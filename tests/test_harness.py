@@ -0,0 +1,69 @@
+"""
+Pruebas unitarias para benchmark/harness.py (estadísticas de las mediciones)
+Ejecutar con: py -m unittest test_harness.py
+"""
+
+import unittest
+import sys
+import os
+import gc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmark'))
+
+from harness import percentile, summarize, measure
+from solver import HashiSolver
+
+
+class TestStatistics(unittest.TestCase):
+    """Pruebas de percentile y summarize"""
+
+    def test_percentile_single_sample(self):
+        """Con una sola muestra todos los percentiles son esa muestra"""
+        for p in (0, 50, 95, 100):
+            self.assertEqual(percentile([7.5], p), 7.5)
+
+    def test_percentile_edges(self):
+        """p=0 y p=100 son el mínimo y el máximo, sin importar el orden"""
+        values = [4.0, 1.0, 3.0, 2.0]
+        self.assertEqual(percentile(values, 0), 1.0)
+        self.assertEqual(percentile(values, 100), 4.0)
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertAlmostEqual(percentile(values, 95), 3.85)
+        self.assertEqual(values, [4.0, 1.0, 3.0, 2.0])
+
+    def test_summarize(self):
+        """summarize retorna las estadísticas esperadas de una muestra fija"""
+        stats = summarize([1.0, 2.0, 3.0, 4.0, 10.0])
+        self.assertEqual(list(stats), ['min', 'median', 'p95', 'mean', 'stdev', 'max'])
+        self.assertEqual(stats['min'], 1.0)
+        self.assertEqual(stats['median'], 3.0)
+        self.assertEqual(stats['p95'], 8.8)
+        self.assertEqual(stats['mean'], 4.0)
+        self.assertEqual(stats['stdev'], 3.5355)
+        self.assertEqual(stats['max'], 10.0)
+        self.assertEqual(summarize([2.0])['stdev'], 0.0)
+
+
+class TestMeasure(unittest.TestCase):
+    """Pruebas del calentamiento y las repeticiones de measure"""
+
+    BOARD = [[2, 0, 2], [0, 0, 0], [2, 0, 2]]
+
+    def test_warmup_and_repeat(self):
+        """Solo se guardan las ejecuciones medidas y el GC queda como estaba"""
+        self.assertTrue(gc.isenabled())
+        result = measure(3, 3, self.BOARD, HashiSolver, warmup=2, repeat=3)
+        self.assertTrue(result['success'])
+        self.assertFalse(result['timed_out'])
+        self.assertEqual(len(result['times_ms']), 3)
+        self.assertEqual(result['stats']['min'], min(result['times_ms']))
+        self.assertTrue(gc.isenabled())
+
+    def test_repeat_at_least_one(self):
+        """repeat menor que 1 es un error"""
+        with self.assertRaises(ValueError):
+            measure(3, 3, self.BOARD, HashiSolver, repeat=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
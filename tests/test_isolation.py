@@ -0,0 +1,94 @@
+"""
+Pruebas unitarias para benchmark/isolation.py (ejecución aislada de trabajos)
+Ejecutar con: py -m unittest test_isolation.py
+"""
+
+import unittest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmark'))
+
+from isolation import run_isolated, memory_limit_supported
+
+
+def _square(x):
+    """Trabajo que termina"""
+    return x * x
+
+
+def _sleep(seconds):
+    """Trabajo que tarda"""
+    time.sleep(seconds)
+    return seconds
+
+
+def _exit(code):
+    """Trabajo que mata su proceso sin publicar resultado"""
+    os._exit(code)
+
+
+def _fail(message):
+    """Trabajo que lanza una excepción"""
+    raise RecursionError(message)
+
+
+def _allocate(mb):
+    """Trabajo que reserva mb megabytes"""
+    return len(bytearray(mb * 1024 * 1024))
+
+
+class TestRunIsolated(unittest.TestCase):
+    """Las fallas de un trabajo quedan en su registro sin detener el resto"""
+
+    def test_ok(self):
+        """Los trabajos que terminan publican su resultado"""
+        records = run_isolated([('a', _square, (3,)), ('b', _square, (4,))], workers=2)
+        self.assertEqual({job_id: r['status'] for job_id, r in records.items()}, {'a': 'ok', 'b': 'ok'})
+        self.assertEqual(records['b']['result'], 16)
+        self.assertIsNone(records['a']['error'])
+
+    def test_timeout(self):
+        """Un trabajo que supera el límite de tiempo se termina"""
+        records = run_isolated([('lento', _sleep, (30,)), ('rapido', _square, (2,))],
+                               workers=2, timeout=0.5)
+        record = records['lento']
+        self.assertEqual(record['status'], 'timeout')
+        self.assertIsNone(record['result'])
+        self.assertIn('0.5', record['error'])
+        self.assertLess(record['wall_ms'], 10000)
+        self.assertEqual(records['rapido']['status'], 'ok')
+
+    def test_crash(self):
+        """Un proceso que muere sin publicar resultado se registra como crash"""
+        seen = []
+        records = run_isolated([('muere', _exit, (1,)), ('sigue', _square, (5,))], workers=1,
+                               on_result=lambda job_id, record: seen.append(job_id))
+        record = records['muere']
+        self.assertEqual(record['status'], 'crash')
+        self.assertEqual(record['error'], 'exitcode 1')
+        self.assertEqual(record['exitcode'], 1)
+        self.assertEqual(records['sigue']['result'], 25)
+        self.assertEqual(seen, ['muere', 'sigue'])
+
+    def test_error(self):
+        """Una excepción del trabajo se registra con su tipo y mensaje"""
+        records = run_isolated([('falla', _fail, ("demasiado profundo",))])
+        record = records['falla']
+        self.assertEqual(record['status'], 'error')
+        self.assertIsNone(record['result'])
+        self.assertTrue(record['error'].startswith('RecursionError: demasiado profundo'))
+
+    @unittest.skipUnless(memory_limit_supported(), "sin módulo resource (RLIMIT_AS)")
+    def test_memory_limit(self):
+        """Superar el límite de memoria se registra como 'memory'"""
+        records = run_isolated([('grande', _allocate, (2048,)), ('chico', _allocate, (1,))],
+                               memory_mb=512)
+        self.assertEqual(records['grande']['status'], 'memory')
+        self.assertEqual(records['grande']['error'], 'MemoryError')
+        self.assertEqual(records['chico']['result'], 1024 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Pruebas unitarias para occupancy.py (BridgeOccupancy)
+Ejecutar con: py -m unittest test_occupancy.py
+"""
+
+import unittest
+from occupancy import BridgeOccupancy
+from game_logic import HashiGame
+
+
+class TestBridgeOccupancy(unittest.TestCase):
+    """Pruebas de la ocupación por intervalos"""
+
+    def setUp(self):
+        self.occ = BridgeOccupancy()
+
+    def test_cells_inside_span(self):
+        """Solo las celdas estrictamente entre las islas quedan ocupadas"""
+        self.occ.add((2, 1), (2, 5))
+        for c in range(2, 5):
+            self.assertEqual(self.occ[(2, c)], {'h': 1, 'v': 0})
+        self.assertNotIn((2, 1), self.occ)
+        self.assertNotIn((2, 5), self.occ)
+        self.assertNotIn((3, 3), self.occ)
+        self.assertIsNone(self.occ.get((2, 0)))
+        with self.assertRaises(KeyError):
+            self.occ[(2, 5)]
+
+    def test_double_bridge_and_remove(self):
+        """Un puente doble cuenta 2 y se elimina de uno en uno"""
+        self.occ.add((0, 0), (4, 0))
+        self.occ.add((4, 0), (0, 0))
+        self.assertEqual(self.occ[(2, 0)]['v'], 2)
+        self.assertEqual(len(self.occ), 1)
+        self.occ.remove((0, 0), (4, 0))
+        self.assertEqual(self.occ[(2, 0)]['v'], 1)
+        self.occ.remove((0, 0), (4, 0))
+        self.assertNotIn((2, 0), self.occ)
+        self.assertEqual(len(self.occ), 0)
+        self.assertEqual(self.occ.lines['v'], [])
+
+    def test_crosses(self):
+        """Detecta cruces solo con puentes perpendiculares dentro del tramo"""
+        self.occ.add((0, 3), (4, 3))
+        self.assertTrue(self.occ.crosses((2, 0), (2, 6)))
+        self.assertTrue(self.occ.crosses((2, 6), (2, 0)))
+        # Fila fuera del tramo vertical, o tramo que termina en la columna
+        self.assertFalse(self.occ.crosses((5, 0), (5, 6)))
+        self.assertFalse(self.occ.crosses((2, 0), (2, 3)))
+        self.assertFalse(self.occ.crosses((2, 4), (2, 6)))
+        # Paralelo en otra columna no cruza
+        self.assertFalse(self.occ.crosses((0, 5), (4, 5)))
+
+    def test_crossing_spans(self):
+        """Retorna los puentes perpendiculares cruzados con sus islas"""
+        self.occ.add((0, 3), (4, 3))
+        self.occ.add((1, 5), (3, 5))
+        self.assertEqual(list(self.occ.crossing_spans((2, 0), (2, 6))),
+                         [((0, 3), (4, 3)), ((1, 5), (3, 5))])
+        self.occ.add((2, 0), (2, 6))
+        self.assertEqual(list(self.occ.crossing_spans((0, 4), (3, 4))), [((2, 0), (2, 6))])
+
+    def test_copy_is_independent(self):
+        """Modificar la copia no afecta al original"""
+        self.occ.add((1, 0), (1, 4))
+        copy = self.occ.copy()
+        copy.add((1, 0), (1, 4))
+        copy.add((0, 2), (3, 2))
+        self.assertEqual(self.occ[(1, 2)], {'h': 1, 'v': 0})
+        self.assertEqual(copy[(1, 2)], {'h': 2, 'v': 1})
+
+
+class TestGameOccupancy(unittest.TestCase):
+    """Cruces entre puentes de HashiGame usando la ocupación por intervalos"""
+
+    def setUp(self):
+        board = [
+            [0, 1, 0],
+            [1, 0, 1],
+            [0, 1, 0]
+        ]
+        self.game = HashiGame(3, 3, board)
+
+    def test_crossing_rejected_and_released(self):
+        """Un puente cruzado se rechaza y vuelve a ser posible al deshacer"""
+        self.game.create_bridge((0, 1), (2, 1))
+        ok, msg = self.game.can_create_bridge((1, 0), (1, 2))
+        self.assertFalse(ok)
+        self.assertEqual(msg, "Cruza un puente vertical existente")
+        self.game.undo_last_bridge()
+        ok, _ = self.game.can_create_bridge((1, 0), (1, 2))
+        self.assertTrue(ok)
+        self.game.create_bridge((1, 0), (1, 2))
+        ok, msg = self.game.can_create_bridge((2, 1), (0, 1))
+        self.assertFalse(ok)
+        self.assertEqual(msg, "Cruza un puente horizontal existente")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Pruebas unitarias para parallel_solver.py (ParallelBacktrackingSolver)
+Ejecutar con: py -m unittest test_parallel_solver.py
+"""
+
+import unittest
+import os
+from game_logic import HashiGame
+from parser import parse_board
+from parallel_solver import ParallelBacktrackingSolver
+
+
+class TestParallelSolver(unittest.TestCase):
+    """Pruebas de la búsqueda paralela"""
+
+    def assert_valid(self, rows, cols, board, bridges):
+        game = HashiGame(rows, cols, board)
+        for a, b in bridges:
+            success, msg, _ = game.create_bridge(a, b)
+            self.assertTrue(success, msg)
+        self.assertTrue(game.check_victory())
+
+    def test_solve_simple_puzzle(self):
+        """Resolver puzzle simple"""
+        board = [
+            [2, 0, 2],
+            [0, 0, 0],
+            [2, 0, 2]
+        ]
+        game = HashiGame(3, 3, board)
+        solver = ParallelBacktrackingSolver(game, workers=2)
+        success, bridges = solver.solve()
+        self.assertTrue(success)
+        self.assert_valid(3, 3, board, bridges)
+
+    def test_unsolvable_puzzle(self):
+        """Detecta puzzles sin solución"""
+        board = [
+            [8, 0, 1],
+        ]
+        game = HashiGame(1, 3, board)
+        solver = ParallelBacktrackingSolver(game, workers=2)
+        success, bridges = solver.solve()
+        self.assertFalse(success)
+        self.assertEqual(bridges, [])
+
+    def test_solve_real_puzzle(self):
+        """Resolver un tablero del proyecto repartiendo el árbol"""
+        path = os.path.join(os.path.dirname(__file__), '..', 'puzzles', 'test_hard.txt')
+        rows, cols, board = parse_board(path)
+        game = HashiGame(rows, cols, board)
+        solver = ParallelBacktrackingSolver(game, workers=3)
+        success, bridges = solver.solve()
+        self.assertTrue(success)
+        self.assert_valid(rows, cols, board, bridges)
+        self.assertGreater(solver.iterations, 0)
+
+    def test_game_state_untouched(self):
+        """El juego original no se modifica"""
+        board = [
+            [2, 0, 2],
+            [0, 0, 0],
+            [2, 0, 2]
+        ]
+        game = HashiGame(3, 3, board)
+        ParallelBacktrackingSolver(game, workers=2).solve()
+        self.assertEqual(game.get_total_bridges(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
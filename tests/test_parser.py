@@ -7,6 +7,8 @@ import unittest
 import os
 import tempfile
 from parser import parse_board
+from sparse_board import SparseBoard
+from game_logic import HashiGame
 
 
 class TestParser(unittest.TestCase):
@@ -85,6 +87,56 @@ class TestParser(unittest.TestCase):
             parse_board('nonexistent_file.txt')
 
 
+class TestParserSparse(unittest.TestCase):
+    """Pruebas del formato disperso 'filas,columnas,sparse'"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def write(self, content):
+        file_path = os.path.join(self.temp_dir, 'sparse.txt')
+        with open(file_path, 'w') as f:
+            f.write(content)
+        return file_path
+    
+    def test_parse_sparse_file(self):
+        """Lee solo las islas y retorna un SparseBoard"""
+        path = self.write('1000,2000,sparse\n# comentario\n0,0,2\n\n0,1999,2\n999,0,1\n')
+        rows, cols, board = parse_board(path)
+        self.assertEqual((rows, cols), (1000, 2000))
+        self.assertIsInstance(board, SparseBoard)
+        self.assertEqual(len(board.islands), 3)
+        self.assertEqual(board[0][1999], 2)
+        self.assertEqual(board[500][500], 0)
+    
+    def test_sparse_multi_digit_values(self):
+        """Los valores se leen completos, no dígito a dígito"""
+        path = self.write('3,3,sparse\n0,0,12\n')
+        _, _, board = parse_board(path)
+        self.assertEqual(board[0][0], 12)
+    
+    def test_sparse_equivalent_to_dense(self):
+        """Un tablero disperso produce el mismo HashiGame que el denso"""
+        path = self.write('3,3,sparse\n0,0,2\n0,2,3\n2,0,1\n2,2,2\n')
+        rows, cols, board = parse_board(path)
+        self.assertEqual(board.to_dense(), [[2, 0, 3], [0, 0, 0], [1, 0, 2]])
+        game = HashiGame(rows, cols, board)
+        self.assertEqual(len(game.islands), 4)
+        self.assertEqual(game.islands[(0, 2)]['num'], 3)
+    
+    def test_sparse_invalid_lines(self):
+        """Errores con islas fuera del tablero, repetidas o mal formadas"""
+        for content in ['3,3,sparse\n3,0,1\n', '3,3,sparse\n0,0,1\n0,0,2\n',
+                        '3,3,sparse\n0,0\n', '3,3,sparse\n0,0,0\n']:
+            with self.assertRaises(ValueError):
+                parse_board(self.write(content))
+
+
 class TestParserRealFiles(unittest.TestCase):
     """Pruebas con archivos reales del proyecto"""
     
@@ -0,0 +1,68 @@
+"""
+Pruebas unitarias para portfolio.py (modo portafolio)
+Ejecutar con: py -m unittest test_portfolio.py
+"""
+
+import unittest
+from game_logic import HashiGame
+from backtracking_solver import BacktrackingSolver
+from portfolio import solve_portfolio, default_configs, make_solver, is_valid_solution
+
+
+class TestPortfolioConfigs(unittest.TestCase):
+    """Pruebas de las configuraciones del portafolio"""
+
+    def test_default_configs_fill_workers(self):
+        """Se generan tantas configuraciones como procesos"""
+        configs = default_configs(4)
+        self.assertEqual(len(configs), 4)
+        names = [c['name'] for c in configs]
+        self.assertEqual(len(set(names)), 4)
+        self.assertIn('csp', names)
+
+    def test_make_solver_with_seed(self):
+        """La semilla llega al solucionador"""
+        game = HashiGame(1, 3, [[1, 0, 1]])
+        solver = make_solver(game, {'name': 'bt', 'solver': 'backtracking', 'seed': 3})
+        self.assertIsInstance(solver, BacktrackingSolver)
+        self.assertIsNotNone(solver.rng)
+
+
+class TestPortfolioSolve(unittest.TestCase):
+    """Pruebas de resolución en paralelo"""
+
+    def test_portfolio_solves_puzzle(self):
+        """El portafolio retorna una solución válida"""
+        board = [
+            [2, 0, 2],
+            [0, 0, 0],
+            [2, 0, 2]
+        ]
+        success, bridges, info = solve_portfolio(3, 3, board, workers=2)
+        self.assertTrue(success)
+        self.assertIsNotNone(info['solver'])
+        self.assertTrue(is_valid_solution(3, 3, board, bridges))
+
+    def test_portfolio_unsolvable_puzzle(self):
+        """Sin solución, todas las configuraciones terminan sin éxito"""
+        board = [
+            [8, 0, 1],
+        ]
+        success, bridges, info = solve_portfolio(1, 3, board, workers=2)
+        self.assertFalse(success)
+        self.assertEqual(bridges, [])
+        self.assertIsNone(info['solver'])
+        self.assertEqual(len(info['attempts']), 2)
+
+    def test_invalid_solution_rejected(self):
+        """Una lista de puentes incompleta no es válida"""
+        board = [
+            [2, 0, 2],
+            [0, 0, 0],
+            [2, 0, 2]
+        ]
+        self.assertFalse(is_valid_solution(3, 3, board, [((0, 0), (0, 2))]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Pruebas unitarias para profiling.py (perfilado de solucionadores)
+Ejecutar con: py -m unittest test_profiling.py
+"""
+
+import unittest
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from profiling import (StackSampler, profile_call, profile_path, hot_table, read_folded,
+                       write_aggregate, summarize_directory)
+from batch_solve import run_batch
+from game_logic import HashiGame
+from solver import HashiSolver
+
+
+def busy_leaf(seconds):
+    """Consume CPU durante unos milisegundos"""
+    end = time.process_time() + seconds
+    total = 0
+    while time.process_time() < end:
+        total += 1
+    return total
+
+
+def busy_root():
+    """Función perfilada: todo su tiempo está en busy_leaf"""
+    return busy_leaf(0.15)
+
+
+class TestProfiling(unittest.TestCase):
+    """Pruebas de los perfiles por ejecución y su agregación"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.board = [
+            [2, 0, 3, 0, 1],
+            [0, 0, 0, 0, 0],
+            [1, 0, 3, 0, 2]
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_cprofile_call(self):
+        """El resultado de la función se conserva y el perfil se combina"""
+        paths = []
+        for i in range(2):
+            solver = HashiSolver(HashiGame(3, 5, self.board))
+            path = os.path.join(self.temp_dir, f"p{i}.pstats")
+            success, bridges = profile_call(solver.solve, 'cprofile', path)
+            self.assertTrue(success)
+            self.assertTrue(bridges)
+            paths.append(path)
+        rows = hot_table(paths, limit=50)
+        self.assertTrue(rows)
+        self.assertEqual(rows, sorted(rows, key=lambda r: r['tottime'], reverse=True))
+        calls = {r['function']: r['calls'] for r in rows}
+        single = {r['function']: r['calls'] for r in hot_table(paths[:1], limit=50)}
+        solve = next(name for name in calls if name.endswith('(solve)'))
+        self.assertEqual(calls[solve], 2 * single[solve])
+
+    def test_sampled_stacks(self):
+        """Las pilas empiezan en la función perfilada y terminan en la hoja"""
+        path = os.path.join(self.temp_dir, "s.folded")
+        self.assertGreater(profile_call(busy_root, 'sample', path), 0)
+        counts = read_folded(path)
+        self.assertTrue(counts)
+        for stack in counts:
+            self.assertTrue(stack.startswith("test_profiling.py:busy_root"))
+        rows = hot_table([path])
+        self.assertEqual(rows[0]['function'], "test_profiling.py:busy_leaf")
+
+    def test_thread_sampler(self):
+        """Fuera del hilo principal (o sin SIGPROF) se muestrea con un hilo"""
+        sampler = StackSampler(0.002)
+        result = []
+
+        def worker():
+            sampler.start()
+            result.append(busy_root())
+            sampler.stop()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertTrue(sampler.counts)
+
+    def test_aggregate_folded(self):
+        """El agregado suma las muestras de cada pila"""
+        a = os.path.join(self.temp_dir, "a.folded")
+        b = os.path.join(self.temp_dir, "b.folded")
+        with open(a, 'w') as f:
+            f.write("x;y 3\nx 1\n")
+        with open(b, 'w') as f:
+            f.write("x;y 2\n")
+        out = write_aggregate([a, b], os.path.join(self.temp_dir, "all.folded"))
+        self.assertEqual(read_folded(out), {"x;y": 5, "x": 1})
+        rows = {r['function']: r for r in hot_table([a, b])}
+        self.assertEqual((rows['y']['self'], rows['y']['total']), (5, 5))
+        self.assertEqual((rows['x']['self'], rows['x']['total']), (1, 6))
+
+    def test_profile_path(self):
+        """Los nombres de tablero se limpian para el sistema de archivos"""
+        self.assertEqual(profile_path("d", "corpus.hashi#12", "sample"),
+                         os.path.join("d", "corpus.hashi_12.folded"))
+
+    def test_batch_profile(self):
+        """batch_solve guarda un perfil por tablero y la tabla agregada"""
+        path = os.path.join(self.temp_dir, "t.txt")
+        with open(path, 'w') as f:
+            f.write('3,3\n202\n000\n202\n')
+        directory = os.path.join(self.temp_dir, "perfiles")
+        out = io.StringIO()
+        run_batch([path], "csp", workers=1, out=out, profile=("cprofile", directory))
+        self.assertIn('"profile"', out.getvalue())
+        names = sorted(os.listdir(directory))
+        self.assertEqual(len(names), 2)
+        self.assertIn("_aggregate.pstats", names)
+        self.assertTrue(summarize_directory(directory, "cprofile", out=io.StringIO()))
+
+
+if __name__ == '__main__':
+    unittest.main()
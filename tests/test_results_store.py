@@ -0,0 +1,95 @@
+"""
+Pruebas unitarias para benchmark/results_store.py (almacén incremental)
+Ejecutar con: py -m unittest test_results_store.py
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmark'))
+
+from results_store import (ResultStore, run_incremental, code_revision, board_hash,
+                           measurement_config, history)
+from solver import HashiSolver
+
+
+SOLVERS = {'csp': ('CSP', HashiSolver)}
+
+
+class TestResultStore(unittest.TestCase):
+    """Pruebas de las claves y de la medición incremental"""
+
+    def setUp(self):
+        """Crear un almacén y un tablero temporales"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.store_path = os.path.join(self.temp_dir, 'results.jsonl')
+        self.board = os.path.join(self.temp_dir, 'cuadrado.txt')
+        with open(self.board, 'w') as f:
+            f.write('3,3\n202\n000\n202\n')
+        self.test_files = [('cuadrado', self.board)]
+
+    def tearDown(self):
+        """Limpiar archivos temporales"""
+        shutil.rmtree(self.temp_dir)
+
+    def run_store(self, test_files=None, **kwargs):
+        """Ejecuta run_incremental sin imprimir; retorna (medidos, omitidos, líneas del archivo)"""
+        options = dict(warmup=0, repeat=1, solvers=SOLVERS)
+        options.update(kwargs)
+        with redirect_stdout(StringIO()):
+            measured, skipped = run_incremental(test_files or self.test_files,
+                                                ResultStore(self.store_path), **options)
+        with open(self.store_path, encoding='utf-8') as f:
+            return measured, skipped, f.readlines()
+
+    def test_second_run_appends_nothing(self):
+        """Los pares ya medidos con la misma clave se omiten"""
+        self.assertEqual(self.run_store()[:2], (1, 0))
+        measured, skipped, lines = self.run_store()
+        self.assertEqual((measured, skipped, len(lines)), (0, 1, 1))
+        record = next(ResultStore(self.store_path).records())
+        self.assertEqual(record['revision'], code_revision())
+        self.assertEqual(record['board_hash'], board_hash(3, 3, [[2, 0, 2], [0, 0, 0], [2, 0, 2]]))
+        self.assertTrue(record['success'])
+
+    def test_force_measures_again(self):
+        """Con force se agrega otra medición de la misma clave"""
+        self.run_store()
+        measured, skipped, lines = self.run_store(force=True)
+        self.assertEqual((measured, skipped, len(lines)), (1, 0, 2))
+        _, series = history(ResultStore(self.store_path).records())
+        self.assertEqual(len(series), 1)
+
+    def test_new_config_or_board_is_new_key(self):
+        """Cambiar la configuración o el tablero produce una clave nueva"""
+        self.run_store()
+        self.assertEqual(self.run_store(repeat=2)[:2], (1, 0))
+        self.assertEqual(self.run_store(time_limit=5.0)[:2], (1, 0))
+        other = os.path.join(self.temp_dir, 'linea.txt')
+        with open(other, 'w') as f:
+            f.write('1,3\n101\n')
+        measured, skipped, lines = self.run_store(self.test_files + [('linea', other)])
+        self.assertEqual((measured, skipped, len(lines)), (1, 1, 4))
+        self.assertNotEqual(measurement_config('csp', 0, 1, True, None)[1],
+                            measurement_config('csp', 0, 2, True, None)[1])
+
+    def test_code_revision(self):
+        """La revisión depende solo del contenido de los archivos indicados"""
+        with open(os.path.join(self.temp_dir, 'a.py'), 'w') as f:
+            f.write('x = 1\n')
+        before = code_revision(self.temp_dir, ['a.py'])
+        with open(os.path.join(self.temp_dir, 'otro.py'), 'w') as f:
+            f.write('y = 2\n')
+        self.assertEqual(code_revision(self.temp_dir, ['a.py']), before)
+        with open(os.path.join(self.temp_dir, 'a.py'), 'w') as f:
+            f.write('x = 2\n')
+        self.assertNotEqual(code_revision(self.temp_dir, ['a.py']), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Pruebas unitarias para benchmark/scaling.py (generador de tableros)
+Ejecutar con: py -m unittest test_scaling.py
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmark'))
+
+from scaling import generate_puzzle
+from verifier import verify
+from game_logic import HashiGame
+from solver import HashiSolver
+
+
+class TestGeneratePuzzle(unittest.TestCase):
+    """Los tableros generados tienen solución"""
+
+    def test_generated_bridges_are_solution(self):
+        """Los puentes generados con cada tablero pasan el verificador"""
+        for size in (7, 15, 30, 50):
+            for density in (0.05, 0.1, 0.2):
+                for seed in range(3):
+                    board, bridges = generate_puzzle(size, size, density, seed=seed)
+                    result = verify(board, bridges)
+                    self.assertTrue(result['valid'], (size, density, seed, result['violations'][:3]))
+                    self.assertGreater(sum(1 for row in board for v in row if v > 0), 1)
+
+    def test_reproducible(self):
+        """La misma semilla genera el mismo tablero"""
+        self.assertEqual(generate_puzzle(15, 15, 0.1, seed=4), generate_puzzle(15, 15, 0.1, seed=4))
+
+    def test_solver_finds_solution(self):
+        """El solucionador resuelve los tableros generados pequeños"""
+        for density in (0.1, 0.2):
+            board, _ = generate_puzzle(7, 7, density, seed=1)
+            success, bridges = HashiSolver(HashiGame(7, 7, board)).solve()
+            self.assertTrue(success)
+            self.assertTrue(verify(board, bridges)['valid'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Pruebas unitarias para search_trace.py (traza del árbol de búsqueda)
+Ejecutar con: py -m unittest test_search_trace.py
+"""
+
+import unittest
+import io
+import os
+import shutil
+import tempfile
+from search_trace import SearchTracer, read_trace, summarize, format_summary
+from game_logic import HashiGame
+from parser import parse_board
+from solver import HashiSolver
+from backtracking_solver import BacktrackingSolver
+
+
+HARD_BOARD = os.path.join(os.path.dirname(__file__), '..', 'puzzles', 'test_hard.txt')
+
+
+class TestSearchTrace(unittest.TestCase):
+    """Pruebas del registro de eventos y del resumen de trazas"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.rows, self.cols, self.board = parse_board(HARD_BOARD)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def trace(self, solver_class):
+        """Resuelve el tablero difícil con traza; retorna (solver, resultado, líneas)"""
+        solver = solver_class(HashiGame(self.rows, self.cols, self.board))
+        stream = io.StringIO()
+        solver.tracer = SearchTracer(stream)
+        result = solver.solve()
+        solver.tracer.close()
+        return solver, result, stream.getvalue().splitlines()
+
+    def test_disabled_by_default(self):
+        """Sin tracer la resolución no cambia y los nodos son los mismos"""
+        for solver_class in (HashiSolver, BacktrackingSolver):
+            plain = solver_class(HashiGame(self.rows, self.cols, self.board))
+            self.assertIsNone(plain.tracer)
+            expected = plain.solve()
+            traced, result, _ = self.trace(solver_class)
+            self.assertEqual(result, expected)
+            self.assertEqual(traced.iterations, plain.iterations)
+
+    def test_backtracking_events(self):
+        """Cada nodo expandido tiene su rama y cada retroceso su decisión"""
+        solver, (success, _), lines = self.trace(BacktrackingSolver)
+        events = list(read_trace(lines))
+        self.assertTrue(success)
+        self.assertEqual(events[0]['ev'], 'start')
+        self.assertEqual(events[-1], dict(events[-1], ev='end', success=True,
+                                          iterations=solver.iterations))
+        times = [e['t'] for e in events]
+        self.assertEqual(times, sorted(times))
+        kinds = [e['ev'] for e in events]
+        self.assertEqual(kinds.count('solution'), 1)
+        self.assertEqual(kinds.count('decision'), kinds.count('backtrack') + events[-2]['depth'])
+        # Todo nodo visitado se expande, es contradicción o es la solución
+        expanded = kinds.count('branch') + kinds.count('solution')
+        invalid = sum(1 for e in events if e.get('reason') == 'invalid_state')
+        self.assertEqual(expanded + invalid, solver.iterations)
+
+    def test_summary(self):
+        """El resumen cuenta nodos por profundidad y el trabajo desperdiciado"""
+        _, _, lines = self.trace(BacktrackingSolver)
+        events = list(read_trace(lines))
+        path = os.path.join(self.temp_dir, "traza.jsonl")
+        with SearchTracer(path) as tracer:
+            solver = BacktrackingSolver(HashiGame(self.rows, self.cols, self.board))
+            solver.tracer = tracer
+            solver.solve()
+        summary = summarize(path, top=3)
+        self.assertEqual(summary['runs'], 1)
+        self.assertEqual(summary['solved'], 1)
+        self.assertEqual(summary['nodes'], solver.iterations)
+        solution_depth = next(e['depth'] for e in events if e['ev'] == 'solution')
+        self.assertEqual(summary['max_depth'], solution_depth)
+        self.assertEqual(summary['wasted_nodes'], solver.iterations - solution_depth - 1)
+        self.assertEqual(summary['depths'][0]['nodes'], 1)
+        self.assertLessEqual(len(summary['largest_wasted']), 3)
+        sizes = [w['nodes'] for w in summary['largest_wasted']]
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+        self.assertIn('Prof.', format_summary(summary))
+
+    def test_csp_rules(self):
+        """La traza del solver CSP registra los puentes de cada regla"""
+        _, (success, bridges), lines = self.trace(HashiSolver)
+        self.assertTrue(success)
+        events = list(read_trace(lines))
+        summary = summarize(lines)
+        placed = sum(stats['bridges'] for stats in summary['rules'].values())
+        decided = sum(e['n'] for e in events if e['ev'] == 'decision')
+        self.assertEqual(placed + decided, len(bridges))
+        self.assertEqual(summary['wasted_nodes'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Pruebas unitarias para solution_cache.py (SolutionCache)
+Ejecutar con: py -m unittest test_solution_cache.py
+"""
+
+import unittest
+import os
+import shutil
+import tempfile
+from game_logic import HashiGame
+from solver import HashiSolver
+from solution_cache import SolutionCache, CachedSolver, board_key
+
+
+class TestBoardKey(unittest.TestCase):
+    """Pruebas de la clave canónica del tablero"""
+
+    def test_same_board_same_key(self):
+        """Tableros iguales producen la misma clave"""
+        board = [[2, 0, 2], [0, 0, 0], [2, 0, 2]]
+        key1 = board_key(HashiGame(3, 3, board))
+        key2 = board_key(HashiGame(3, 3, [row[:] for row in board]))
+        self.assertEqual(key1, key2)
+
+    def test_key_depends_on_values_and_dimensions(self):
+        """Cambiar un valor o las dimensiones cambia la clave"""
+        key = board_key(HashiGame(1, 3, [[1, 0, 1]]))
+        self.assertNotEqual(key, board_key(HashiGame(1, 3, [[2, 0, 2]])))
+        self.assertNotEqual(key, board_key(HashiGame(1, 4, [[1, 0, 1, 0]])))
+
+
+class TestSolutionCache(unittest.TestCase):
+    """Pruebas de la caché persistente"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'cache.db')
+
+    def tearDown(self):
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def test_put_and_get_persist(self):
+        """Las soluciones sobreviven a reabrir el archivo"""
+        bridges = [((0, 0), (0, 2))]
+        with SolutionCache(self.path) as cache:
+            self.assertIsNone(cache.get('k'))
+            cache.put('k', bridges)
+        with SolutionCache(self.path) as cache:
+            self.assertEqual(cache.get('k'), bridges)
+            self.assertEqual(len(cache), 1)
+
+    def test_lru_eviction_by_size(self):
+        """Se expulsa la entrada usada hace más tiempo al superar el tamaño"""
+        bridges = [((0, 0), (0, 2))]
+        entry_size = len('[[0,0,0,2]]')
+        with SolutionCache(self.path, max_bytes=2 * entry_size) as cache:
+            cache.put('a', bridges)
+            cache.put('b', bridges)
+            cache.memory.clear()
+            cache.get('a')
+            cache.put('c', bridges)
+            cache.memory.clear()
+            self.assertIsNotNone(cache.get('a'))
+            self.assertIsNone(cache.get('b'))
+            self.assertIsNotNone(cache.get('c'))
+            self.assertLessEqual(cache.size_bytes(), 2 * entry_size)
+
+    def test_memory_hits_count_for_lru(self):
+        """Los aciertos en memoria también retrasan la expulsión"""
+        bridges = [((0, 0), (0, 2))]
+        entry_size = len('[[0,0,0,2]]')
+        with SolutionCache(self.path, max_bytes=2 * entry_size) as cache:
+            cache.put('a', bridges)
+            cache.put('b', bridges)
+            self.assertIn('a', cache.memory)
+            cache.get('a')
+            cache.put('c', bridges)
+            self.assertIsNotNone(cache.get('a'))
+            self.assertNotIn('b', cache.memory)
+            self.assertIsNone(cache.get('b'))
+
+    def test_touches_persist_and_total(self):
+        """Los aciertos pendientes se escriben al cerrar y el total sigue al archivo"""
+        with SolutionCache(self.path) as cache:
+            cache.put('a', [((0, 0), (0, 2))])
+            cache.put('b', [((0, 0), (0, 2))])
+            cache.put('a', [((0, 0), (0, 2)), ((0, 0), (2, 0))])
+            self.assertEqual(cache._total, cache.size_bytes())
+            cache.get('a')
+        with SolutionCache(self.path) as cache:
+            order = [key for key, in cache.conn.execute("SELECT key FROM solutions ORDER BY last_used")]
+            self.assertEqual(order, ['b', 'a'])
+            self.assertEqual(cache._total, cache.size_bytes())
+
+    def test_cached_solver_skips_search(self):
+        """La segunda resolución sale de la caché sin iteraciones"""
+        board = [[2, 0, 2], [0, 0, 0], [2, 0, 2]]
+        with SolutionCache(self.path) as cache:
+            first = CachedSolver(HashiGame(3, 3, board), HashiSolver, cache)
+            success, bridges = first.solve()
+            self.assertTrue(success)
+            self.assertFalse(first.cached)
+
+            second = CachedSolver(HashiGame(3, 3, board), HashiSolver, cache)
+            success2, bridges2 = second.solve()
+            self.assertTrue(success2)
+            self.assertTrue(second.cached)
+            self.assertEqual(second.iterations, 0)
+            self.assertEqual(sorted(bridges), sorted(bridges2))
+
+
+if __name__ == '__main__':
+    unittest.main()
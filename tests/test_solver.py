@@ -200,5 +200,26 @@ class TestSolverEdgeCases(unittest.TestCase):
         self.assertTrue(success)
 
 
+class TestSolverCancel(unittest.TestCase):
+    """Pruebas de la cancelación de la búsqueda"""
+    
+    def test_cancel_before_solve(self):
+        """Cancelar antes de empezar retorna sin resolver"""
+        board = [
+            [2, 0, 3, 0, 1],
+            [0, 0, 0, 0, 0],
+            [1, 0, 3, 0, 2]
+        ]
+        game = HashiGame(3, 5, board)
+        solver = HashiSolver(game)
+        solver.cancel()
+        self.assertEqual(solver.solve(), (False, []))
+        self.assertFalse(solver.timed_out)
+        self.assertEqual(game.get_total_bridges(), 0)
+        
+        # Sin cancelar, el mismo tablero se resuelve
+        self.assertTrue(HashiSolver(HashiGame(3, 5, board)).solve()[0])
+
+
 if __name__ == '__main__':
     unittest.main()
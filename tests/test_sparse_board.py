@@ -0,0 +1,46 @@
+"""
+Pruebas unitarias para sparse_board.py (SparseBoard)
+Ejecutar con: py -m unittest test_sparse_board.py
+"""
+
+import unittest
+from sparse_board import SparseBoard
+
+
+class TestSparseBoard(unittest.TestCase):
+    """Pruebas del tablero disperso"""
+    
+    def setUp(self):
+        self.dense = [
+            [2, 0, 3],
+            [0, 0, 0],
+            [1, 0, 2]
+        ]
+        self.board = SparseBoard.from_dense(self.dense)
+    
+    def test_indexing_like_dense(self):
+        """board[r][c] se comporta como la matriz densa"""
+        self.assertEqual(len(self.board), 3)
+        self.assertEqual(len(self.board[0]), 3)
+        for r in range(3):
+            for c in range(3):
+                self.assertEqual(self.board[r][c], self.dense[r][c])
+    
+    def test_row_slicing_and_iteration(self):
+        """Las filas se pueden copiar e iterar"""
+        self.assertEqual([row[:] for row in self.board], self.dense)
+        self.assertEqual([list(row) for row in self.board], self.dense)
+    
+    def test_round_trip(self):
+        """from_dense y to_dense son inversas"""
+        self.assertEqual(self.board.to_dense(), self.dense)
+        self.assertEqual(len(self.board.islands), 4)
+    
+    def test_row_out_of_range(self):
+        """Filas fuera del tablero producen IndexError"""
+        with self.assertRaises(IndexError):
+            self.board[3]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Pruebas unitarias para symmetry.py (simetrías del tablero)
+Ejecutar con: py -m unittest test_symmetry.py
+"""
+
+import unittest
+import os
+import shutil
+import tempfile
+from game_logic import HashiGame
+from solver import HashiSolver
+from solution_cache import SolutionCache, CachedSolver
+from symmetry import (NUM_TRANSFORMS, transform_point, transformed_dims, inverse_transform,
+                      canonical_board, canonical_key, transform_bridges)
+
+
+def rotate_board(board):
+    """Rota un tablero denso 90° en sentido horario"""
+    rows, cols = len(board), len(board[0])
+    return [[board[rows - 1 - r][c] for r in range(rows)] for c in range(cols)]
+
+
+class TestTransforms(unittest.TestCase):
+    """Pruebas de las transformaciones diedrales"""
+
+    def test_inverse_restores_point(self):
+        """Cada transformación seguida de su inversa es la identidad"""
+        rows, cols = 3, 5
+        for t in range(NUM_TRANSFORMS):
+            trows, tcols = transformed_dims(t, rows, cols)
+            for pos in [(0, 0), (1, 4), (2, 3)]:
+                moved = transform_point(t, pos, rows, cols)
+                self.assertTrue(0 <= moved[0] < trows and 0 <= moved[1] < tcols)
+                back = transform_point(inverse_transform(t), moved, trows, tcols)
+                self.assertEqual(back, pos)
+
+    def test_transforms_are_distinct(self):
+        """Las 8 transformaciones de un tablero asimétrico son distintas"""
+        board = [[1, 2, 0], [0, 0, 3]]
+        islands = {(r, c): board[r][c] for r in range(2) for c in range(3) if board[r][c]}
+        images = set()
+        for t in range(NUM_TRANSFORMS):
+            images.add(tuple(sorted((transform_point(t, p, 2, 3), v) for p, v in islands.items())))
+        self.assertEqual(len(images), NUM_TRANSFORMS)
+
+
+class TestCanonicalForm(unittest.TestCase):
+    """Pruebas de la forma canónica"""
+
+    def setUp(self):
+        self.board = [
+            [3, 0, 2],
+            [0, 0, 0],
+            [1, 0, 0]
+        ]
+
+    def test_rotations_share_canonical_form(self):
+        """Un tablero y sus rotaciones tienen la misma forma canónica y clave"""
+        board = self.board
+        _, crows, ccols, cboard = canonical_board(3, 3, board)
+        key, _ = canonical_key(HashiGame(3, 3, board))
+        for _ in range(3):
+            board = rotate_board(board)
+            _, rrows, rcols, rboard = canonical_board(3, 3, board)
+            self.assertEqual((rrows, rcols, rboard), (crows, ccols, cboard))
+            self.assertEqual(canonical_key(HashiGame(3, 3, board))[0], key)
+
+    def test_bridges_map_back_through_inverse(self):
+        """Los puentes llevados a la forma canónica vuelven con la inversa"""
+        bridges = [((0, 0), (0, 2)), ((0, 0), (2, 0))]
+        t, crows, ccols, _ = canonical_board(3, 3, self.board)
+        canonical = transform_bridges(t, bridges, 3, 3)
+        back = transform_bridges(inverse_transform(t), canonical, crows, ccols)
+        self.assertEqual(sorted(back), sorted(bridges))
+
+    def test_cache_shared_between_rotations(self):
+        """Un tablero rotado reutiliza la solución en caché del original"""
+        board = [
+            [2, 0, 3, 0, 1],
+            [0, 0, 0, 0, 0],
+            [1, 0, 3, 0, 2]
+        ]
+        rotated = rotate_board(board)
+        temp_dir = tempfile.mkdtemp()
+        try:
+            with SolutionCache(os.path.join(temp_dir, 'cache.db')) as cache:
+                success, _ = CachedSolver(HashiGame(3, 5, board), HashiSolver, cache).solve()
+                self.assertTrue(success)
+
+                solver = CachedSolver(HashiGame(5, 3, rotated), HashiSolver, cache)
+                success, bridges = solver.solve()
+                self.assertTrue(success)
+                self.assertTrue(solver.cached)
+
+                game = HashiGame(5, 3, rotated)
+                for a, b in bridges:
+                    ok, msg, _ = game.create_bridge(a, b)
+                    self.assertTrue(ok, msg)
+                self.assertTrue(game.check_victory())
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
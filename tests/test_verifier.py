@@ -0,0 +1,110 @@
+"""
+Pruebas unitarias para verifier.py (verificador de soluciones)
+Ejecutar con: py -m unittest test_verifier.py
+"""
+
+import unittest
+from verifier import verify, BoardVerifier
+from sparse_board import SparseBoard
+from game_logic import HashiGame
+from solver import HashiSolver
+
+
+class TestVerifier(unittest.TestCase):
+    """Pruebas del verificador de una sola pasada"""
+
+    def setUp(self):
+        self.board = [
+            [2, 0, 3, 0, 1],
+            [0, 0, 0, 0, 0],
+            [1, 0, 3, 0, 2]
+        ]
+        success, self.solution = HashiSolver(HashiGame(3, 5, self.board)).solve()
+        self.assertTrue(success)
+
+    def types(self, report):
+        return sorted(v['type'] for v in report['violations'])
+
+    def test_valid_solution(self):
+        """La solución del solver es válida, también como listas JSON y tablero disperso"""
+        self.assertEqual(verify(self.board, self.solution), {'valid': True, 'violations': []})
+        as_json = [[list(a), list(b)] for a, b in self.solution]
+        self.assertTrue(verify(SparseBoard.from_dense(self.board), as_json)['valid'])
+
+    def test_wrong_counts(self):
+        """Falta un puente: las dos islas quedan incompletas"""
+        report = verify(self.board, self.solution[1:])
+        self.assertFalse(report['valid'])
+        wrong = [v for v in report['violations'] if v['type'] == 'wrong_count']
+        self.assertEqual(len(wrong), 2)
+        self.assertEqual(wrong[0]['actual'], wrong[0]['expected'] - 1)
+
+    def test_invalid_edges(self):
+        """Puentes que no unen islas consecutivas alineadas"""
+        bridges = [((0, 0), (2, 2)), ((0, 0), (0, 4)), ((0, 1), (2, 1)), ((0, 0), (0, 0)), 'x']
+        report = verify(self.board, bridges)
+        types = self.types(report)
+        for expected in ('invalid_bridge', 'island_in_path', 'not_aligned', 'not_island'):
+            self.assertIn(expected, types)
+        self.assertEqual(types.count('not_aligned'), 2)
+
+    def test_malformed_endpoints(self):
+        """Extremos con tipos mezclados o anidados son violaciones, no excepciones"""
+        bridges = [
+            [[0, 'x'], [0, 2]],
+            [[[0], 0], [0, 2]],
+            [[0, 0], [0, 2.0]],
+            [[0, 0, 1], [0, 2]],
+            [[True, 0], [0, 2]],
+            [None, [0, 2]],
+        ]
+        report = verify(self.board, bridges)
+        self.assertEqual(self.types(report).count('invalid_bridge'), len(bridges))
+        self.assertEqual(report['violations'][0]['bridge'], bridges[0])
+        # Los puentes bien formados de la misma lista se siguen verificando
+        report = verify(self.board, self.solution + bridges)
+        self.assertEqual(self.types(report), ['invalid_bridge'] * len(bridges))
+
+    def test_too_many_bridges(self):
+        """Más de 2 puentes entre el mismo par de islas"""
+        report = verify([[3, 0, 3]], [((0, 0), (0, 2))] * 3)
+        self.assertEqual(self.types(report), ['too_many_bridges'])
+        self.assertEqual(report['violations'][0]['count'], 3)
+
+    def test_crossing(self):
+        """Un puente horizontal que cruza uno vertical"""
+        board = [
+            [0, 1, 0],
+            [1, 0, 1],
+            [0, 1, 0]
+        ]
+        report = verify(board, [((0, 1), (2, 1)), ((1, 0), (1, 2))])
+        self.assertEqual(self.types(report), ['crossing', 'disconnected'])
+        crossing = report['violations'][0]
+        self.assertEqual(crossing['bridge'], ((1, 0), (1, 2)))
+        self.assertEqual(crossing['other'], ((0, 1), (2, 1)))
+
+    def test_disconnected(self):
+        """Dos grupos completos pero separados"""
+        board = [
+            [1, 1, 0, 1, 1]
+        ]
+        bridges = [((0, 0), (0, 1)), ((0, 3), (0, 4))]
+        report = verify(board, bridges)
+        self.assertEqual(self.types(report), ['disconnected'])
+        self.assertEqual(report['violations'][0]['components'], 2)
+
+    def test_reusable_verifier(self):
+        """Un BoardVerifier sirve para varias soluciones del mismo tablero"""
+        verifier = BoardVerifier(self.board)
+        self.assertTrue(verifier.verify(self.solution)['valid'])
+        self.assertFalse(verifier.verify([])['valid'])
+        self.assertTrue(verifier.verify(list(reversed(self.solution)))['valid'])
+
+    def test_empty_board(self):
+        """Un tablero sin islas no tiene solución"""
+        self.assertEqual(self.types(verify([[0, 0]], [])), ['no_islands'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+"""
+Verificador de soluciones Hashiwokakero
+Comprueba una lista de puentes sin reproducirla sobre un HashiGame: los puentes
+solo pueden unir islas consecutivas de una fila o columna (aristas candidatas),
+así que esas aristas se precalculan una vez por tablero y cada verificación es
+una sola pasada sobre los puentes, con los cruces buscados en el índice por
+intervalos de occupancy.py y union-find para la conectividad.
+
+Uso:
+    report = verify(board, bridges)
+    if not report['valid']:
+        for violation in report['violations']:
+            print(violation['message'])
+
+Para verificar muchas soluciones del mismo tablero se reutiliza BoardVerifier.
+"""
+
+from occupancy import BridgeOccupancy
+from sparse_board import SparseBoard
+
+
+def _endpoint(pos):
+    """
+    Convierte un extremo de puente a tupla (fila, columna) de enteros
+
+    Raises:
+        TypeError/ValueError si no es un par de enteros (las soluciones a
+        verificar no son confiables: tipos mezclados o listas anidadas no
+        deben llegar a las comparaciones ni a los hashes)
+    """
+    pos = tuple(pos)
+    if len(pos) != 2 or not all(type(v) is int for v in pos):
+        raise ValueError(f"Extremo mal formado: {pos!r}")
+    return pos
+
+
+class BoardVerifier:
+    """Estructuras precalculadas de un tablero para verificar soluciones"""
+
+    def __init__(self, board, rows=None, cols=None):
+        """
+        Args:
+            board: lista de listas o SparseBoard
+            rows, cols: dimensiones (por defecto las del tablero)
+        """
+        if isinstance(board, SparseBoard):
+            self.rows = board.rows if rows is None else rows
+            self.cols = board.cols if cols is None else cols
+            cells = sorted(board.islands.items())
+        else:
+            self.rows = len(board) if rows is None else rows
+            self.cols = (len(board[0]) if board else 0) if cols is None else cols
+            cells = [((r, c), v) for r, row in enumerate(board[:self.rows])
+                     for c, v in enumerate(row[:self.cols]) if v > 0]
+
+        # islands: (r,c) -> valor; index: (r,c) -> posición para union-find
+        self.islands = dict(cells)
+        self.index = {pos: i for i, (pos, _) in enumerate(cells)}
+
+        # Aristas candidatas: (a, b) con a < b -> índice de la arista
+        self.edges = {}
+        columns = {}
+        prev = None
+        for pos, _ in cells:
+            if prev is not None and prev[0] == pos[0]:
+                self.edges[(prev, pos)] = len(self.edges)
+            prev = pos
+            columns.setdefault(pos[1], []).append(pos[0])
+        for c, rows_in_col in columns.items():
+            for r1, r2 in zip(rows_in_col, rows_in_col[1:]):
+                self.edges[((r1, c), (r2, c))] = len(self.edges)
+        self.edge_list = list(self.edges)
+
+    def verify(self, bridges):
+        """
+        Verifica una solución
+
+        Args:
+            bridges: lista de puentes [(a, b), ...] (un elemento por puente;
+                     un puente doble aparece dos veces)
+
+        Returns:
+            dict {'valid': bool, 'violations': [dict, ...]}; cada violación
+            tiene 'type', 'message' y los datos del problema
+        """
+        violations = []
+        edge_list = self.edge_list
+        counts = {}
+        used = {pos: 0 for pos in self.islands}
+
+        for bridge in bridges:
+            try:
+                a, b = (_endpoint(p) for p in bridge)
+            except (TypeError, ValueError):
+                violations.append(_violation('invalid_bridge', f"Puente mal formado: {bridge!r}",
+                                             bridge=bridge))
+                continue
+            key = (a, b) if a < b else (b, a)
+            i = self.edges.get(key)
+            if i is None:
+                violations.append(self._edge_violation(a, b))
+                continue
+            counts[i] = counts.get(i, 0) + 1
+            used[a] += 1
+            used[b] += 1
+
+        for i, count in counts.items():
+            if count > 2:
+                a, b = edge_list[i]
+                violations.append(_violation('too_many_bridges',
+                                             f"{count} puentes entre {a} y {b} (máximo 2)",
+                                             a=a, b=b, count=count))
+
+        # Cruces: los puentes verticales usados se indexan por columna y cada
+        # horizontal solo revisa las columnas con verticales dentro de su tramo
+        vertical = BridgeOccupancy()
+        for i in counts:
+            a, b = edge_list[i]
+            if a[1] == b[1]:
+                vertical.add(a, b)
+        for i in counts:
+            a, b = edge_list[i]
+            if a[0] == b[0]:
+                for other in vertical.crossing_spans(a, b):
+                    violations.append(_violation('crossing', f"El puente {(a, b)} cruza el puente {other}",
+                                                 bridge=(a, b), other=other))
+
+        for pos, value in self.islands.items():
+            if used[pos] != value:
+                violations.append(_violation('wrong_count',
+                                             f"La isla {pos} necesita {value} puentes y tiene {used[pos]}",
+                                             island=pos, expected=value, actual=used[pos]))
+
+        if not self.islands:
+            violations.append(_violation('no_islands', "El tablero no tiene islas"))
+        else:
+            components = self._components(edge_list[i] for i in counts)
+            if components > 1:
+                violations.append(_violation('disconnected',
+                                             f"Las islas forman {components} grupos separados",
+                                             components=components))
+
+        return {'valid': not violations, 'violations': violations}
+
+    def _edge_violation(self, a, b):
+        """Explica por qué un puente no es una arista candidata"""
+        for pos in (a, b):
+            if pos not in self.islands:
+                return _violation('not_island', f"{pos} no es una isla", a=a, b=b, cell=pos)
+        if a == b:
+            return _violation('not_aligned', f"Puente de la isla {a} consigo misma", a=a, b=b)
+        if a[0] != b[0] and a[1] != b[1]:
+            return _violation('not_aligned', f"{a} y {b} no están alineadas", a=a, b=b)
+        return _violation('island_in_path', f"Hay una isla en el camino entre {a} y {b}", a=a, b=b)
+
+    def _components(self, edges):
+        """Cuenta las componentes conexas con union-find (unión por tamaño)"""
+        parent = list(range(len(self.index)))
+        size = [1] * len(parent)
+
+        def find(x):
+            root = x
+            while parent[root] != root:
+                root = parent[root]
+            while parent[x] != root:
+                parent[x], x = root, parent[x]
+            return root
+
+        components = len(parent)
+        for a, b in edges:
+            ra, rb = find(self.index[a]), find(self.index[b])
+            if ra == rb:
+                continue
+            if size[ra] < size[rb]:
+                ra, rb = rb, ra
+            parent[rb] = ra
+            size[ra] += size[rb]
+            components -= 1
+        return components
+
+
+def _violation(kind, message, **data):
+    """Construye una entrada del reporte"""
+    entry = {'type': kind, 'message': message}
+    entry.update(data)
+    return entry
+
+
+def verify(board, bridges):
+    """
+    Verifica una solución sin reproducirla sobre un HashiGame
+
+    Args:
+        board: lista de listas o SparseBoard
+        bridges: lista de puentes [(a, b), ...]
+
+    Returns:
+        dict {'valid': bool, 'violations': [dict, ...]}
+    """
+    return BoardVerifier(board).verify(bridges)